@@ -0,0 +1,126 @@
+"""Micro-benchmark: logging overhead per AppServices call, with debug on and off.
+
+Part one times a single debug call: the original style (an f-string built with
+inspect.currentframe() on every call, written synchronously by the calling
+thread) against LoggingService (%-style arguments formatted lazily, records
+handed to a background writer thread). Part two times AppServices methods on an
+in-memory SQLite backend with the service and backend loggers at DEBUG and at
+ERROR; the difference is the logging cost a caller pays per call.
+
+The benchmark runs in a temporary directory with its own app_settings.json, so
+it logs to a temporary file and never to the console.
+
+Usage:
+    python benchmarks/bench_logging.py [--calls 20000] [--repeat 5]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+from argparse import ArgumentParser
+import copy
+import inspect
+import json
+import logging
+import tempfile
+import timeit
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(__file__), '../config/volunteer_event_coordination_app_config.json')
+
+
+def best_per_call(function, calls:int, repeat:int)->float:
+	"""Best-of-repeat time per call, in microseconds."""
+	return min(timeit.repeat(function, number=calls, repeat=repeat)) / calls * 1e6
+
+
+def legacy_logger(path:str, level:int)->logging.Logger:
+	"""A logger set up like the original LoggingService: the handler writes on the calling thread."""
+	logger = logging.getLogger('LegacyBenchmark')
+	logger.propagate = False
+	logger.handlers.clear()
+	handler = logging.FileHandler(path)
+	handler.setFormatter(logging.Formatter('%(levelname)s:%(name)s:%(asctime)s:%(message)s'))
+	logger.addHandler(handler)
+	logger.setLevel(level)
+	return logger
+
+
+def bench_log_call(directory:str, calls:int, repeat:int)->None:
+	from volunteer_event_coordination.logging import LoggingService
+	print('Single debug call (us per call)')
+	print(f'  {"":10} {"original":>10} {"queued":>10}')
+	service = LoggingService('LoggingBenchmark', 'bench')
+	for name, level in (('debug on', logging.DEBUG), ('debug off', logging.ERROR)):
+		legacy = legacy_logger(os.path.join(directory, 'legacy.log'), level)
+		service._logger.setLevel(level)
+		user_id = 42
+
+		def log_debug(message):
+			legacy.debug(message)
+
+		def original():
+			log_debug(f'{inspect.currentframe().f_code.co_name}: Retrieving user id {user_id} from database.')
+
+		def queued():
+			service.log_debug('Retrieving user id %s from database.', user_id)
+
+		print(f'  {name:10} {best_per_call(original, calls, repeat):10.2f} {best_per_call(queued, calls, repeat):10.2f}')
+
+
+def bench_app_services(config:dict, calls:int, repeat:int)->None:
+	from volunteer_event_coordination.service_layer.app_services import AppServices
+	from volunteer_event_coordination.infrastructure_layer.user import User
+	app = AppServices(config)
+	user = User()
+	user.full_name = 'Benchmark User'
+	user.email = 'benchmark@example.com'
+	user.phone = ''
+	user.role = 'organizer'
+	user = app.DB.insert_user(user)
+	event = app.create_event('Park Cleanup', 'Pick up litter', 'City Park', '2030-01-01 09:00:00', '2030-01-01 12:00:00', 10, user.id)
+	app.register_user_to_event(user.id, event.id, 'registered')
+	cases = (
+		('get_user_by_id (cached)', lambda: app.get_user_by_id(user.id)),
+		('get_event_by_id (cached)', lambda: app.get_event_by_id(event.id)),
+		('count_registrations', lambda: app.count_registrations(event.id)),
+		('get_registered_events_for_user_id', lambda: app.get_registered_events_for_user_id(user.id)),
+	)
+	print('AppServices on SQLite (us per call)')
+	print(f'  {"":36} {"debug on":>10} {"debug off":>10} {"overhead":>10}')
+	for name, function in cases:
+		timings = []
+		for level in (logging.DEBUG, logging.ERROR):
+			app._logger._logger.setLevel(level)
+			app.DB._logger._logger.setLevel(level)
+			timings.append(best_per_call(function, calls, repeat))
+		print(f'  {name:36} {timings[0]:10.2f} {timings[1]:10.2f} {timings[0] - timings[1]:10.2f}')
+	app.DB.close()
+
+
+def main():
+	parser = ArgumentParser(prog='bench_logging.py', description='Logging overhead per call with debug on and off.')
+	parser.add_argument('-c', '--configfile', default=DEFAULT_CONFIG, help="Configuration file to load.")
+	parser.add_argument('--calls', type=int, default=20000, help="Calls per timing.")
+	parser.add_argument('--repeat', type=int, default=5, help="Timings per case; the best is reported.")
+	args = parser.parse_args()
+
+	with open(args.configfile, 'r') as f:
+		config = copy.deepcopy(json.loads(f.read()))
+	config["database"]["backend"] = 'sqlite'
+	config["database"]["sqlite"] = {"path": ':memory:'}
+
+	with tempfile.TemporaryDirectory() as directory:
+		os.chdir(directory)
+		with open('app_settings.json', 'w') as f:
+			json.dump({"logs_dir": directory, "log_filename": "bench.log", "log_level": "debug",
+					   "log_to_console": False, "log_to_file": True, "deployed_to_production": False}, f)
+		bench_log_call(directory, args.calls, args.repeat)
+		bench_app_services(config, args.calls, args.repeat)
+		from volunteer_event_coordination.logging import stop_listeners
+		stop_listeners()
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,85 @@
+"""Benchmark: point-lookup and registration throughput with and without prepared statements.
+
+Runs the same workload twice against a live database, once with text cursors and
+once with database.prepared_statements enabled, from --threads threads:
+select_user_by_id / select_event_by_id / user_exists on random existing IDs, then
+register_user_to_event followed by unregister_user_from_event for random pairs of
+existing users and events (the registrations are removed again).
+
+Usage:
+    python benchmarks/bench_prepared_statements.py -c config/volunteer_event_coordination_app_config.json \
+        [--operations 20000] [--threads 8]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+from volunteer_event_coordination.persistence_layer.mysql_persistence_wrapper import MySQLPersistenceWrapper
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import json
+import random
+import time
+
+
+def lookups(db:MySQLPersistenceWrapper, user_ids:list, event_ids:list, count:int, seed:int)->None:
+	rng = random.Random(seed)
+	for _ in range(count // 3):
+		db.select_user_by_id(rng.choice(user_ids))
+		db.select_event_by_id(rng.choice(event_ids))
+		db.user_exists(rng.choice(user_ids))
+
+
+def registrations(db:MySQLPersistenceWrapper, user_ids:list, event_ids:list, count:int, seed:int)->None:
+	rng = random.Random(seed)
+	for _ in range(count // 2):
+		user_id, event_id = rng.choice(user_ids), rng.choice(event_ids)
+		if db.register_user_to_event(user_id, event_id, 'registered'):
+			db.unregister_user_from_event(user_id, event_id)
+
+
+def measure(db:MySQLPersistenceWrapper, workload, user_ids:list, event_ids:list, operations:int, threads:int)->float:
+	"""Operations per second for workload split across threads."""
+	per_thread = operations // threads
+	started = time.perf_counter()
+	with ThreadPoolExecutor(max_workers=threads) as executor:
+		list(executor.map(lambda seed: workload(db, user_ids, event_ids, per_thread, seed), range(threads)))
+	return round(per_thread * threads / (time.perf_counter() - started), 1)
+
+
+def main():
+	parser = ArgumentParser(prog='bench_prepared_statements.py', description='Prepared statement throughput benchmark.')
+	parser.add_argument('-c', '--configfile', required=True, help="Configuration file to load.")
+	parser.add_argument('--operations', type=int, default=20000, help="Calls per workload.")
+	parser.add_argument('--threads', type=int, default=8, help="Concurrent callers.")
+	args = parser.parse_args()
+
+	with open(args.configfile, 'r') as f:
+		config = json.loads(f.read())
+
+	results = []
+	for prepared in (False, True):
+		mode_config = copy.deepcopy(config)
+		mode_config["database"]["prepared_statements"] = prepared
+		db = MySQLPersistenceWrapper(mode_config)
+		user_ids = [user.id for user in db.iter_users()]
+		event_ids = [event.id for event in db.iter_events()]
+		if not user_ids or not event_ids:
+			sys.exit('The benchmark needs at least one user and one event in the database.')
+		# Open the pooled connections (and prepare their statements) before timing
+		measure(db, lookups, user_ids, event_ids, args.threads * 30, args.threads)
+		results.append({
+			"prepared_statements": prepared,
+			"lookups_per_second": measure(db, lookups, user_ids, event_ids, args.operations, args.threads),
+			"registrations_per_second": measure(db, registrations, user_ids, event_ids, args.operations, args.threads),
+			"pool": {key: value for key, value in db.get_pool_stats().items() if key in ("size", "checkouts", "timeouts")},
+		})
+		db.close()
+	print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+	main()
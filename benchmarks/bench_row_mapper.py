@@ -0,0 +1,99 @@
+"""Micro-benchmark: row-to-object mapping cost and entity memory footprint.
+
+Compares the original mapping (an Enum name lookup per field into dict-backed
+entities) with the precompiled RowMapper over __slots__ entities.
+
+Usage:
+    python benchmarks/bench_row_mapper.py [--rows 200000] [--repeat 5]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+from volunteer_event_coordination.infrastructure_layer.event import Event
+from volunteer_event_coordination.persistence_layer.row_mapper import RowMapper
+from argparse import ArgumentParser
+from datetime import datetime
+from enum import Enum
+import timeit
+import tracemalloc
+
+EventColumns = \
+	Enum('EventColumns',[ ('id', 0), ('title', 1), ('description', 2), ('location', 3), ('starts_at', 4), ('ends_at', 5), ('capacity', 6), ('created_by', 7), ('created_at', 8)])
+
+
+class DictEvent:
+	"""The dict-backed Event entity as it was before __slots__."""
+
+	def __init__(self):
+		self.id = 0
+		self.title = ""
+		self.description = ""
+		self.location = ""
+		self.starts_at = ""
+		self.ends_at = ""
+		self.capacity = 0
+		self.created_by = 0
+		self.created_at = ""
+		self.registration_status = ""
+
+
+def enum_lookup_mapper(results):
+	"""The original _populate_event_objects loop."""
+	events_list = []
+	for row in results:
+		event = DictEvent()
+		event.id = row[EventColumns['id'].value]
+		event.title = row[EventColumns['title'].value]
+		event.description = row[EventColumns['description'].value]
+		event.location = row[EventColumns['location'].value]
+		event.starts_at = row[EventColumns['starts_at'].value]
+		event.ends_at = row[EventColumns['ends_at'].value]
+		event.capacity = row[EventColumns['capacity'].value]
+		event.created_by = row[EventColumns['created_by'].value]
+		event.created_at = row[EventColumns['created_at'].value]
+		events_list.append(event)
+	return events_list
+
+
+def make_rows(count:int)->list:
+	"""Build event rows shaped like the SELECT_ALL_EVENTS result."""
+	starts_at = datetime(2025, 11, 20, 10, 0, 0)
+	ends_at = datetime(2025, 11, 20, 14, 0, 0)
+	created_at = datetime(2025, 11, 1, 9, 0, 0)
+	return [(i, f'Event {i}', 'Community food collection and sorting', 'Community Center',
+			 starts_at, ends_at, 50, 1, created_at) for i in range(1, count + 1)]
+
+
+def bytes_per_object(mapper, rows)->float:
+	"""Measure memory allocated per mapped object (excluding the shared row values)."""
+	tracemalloc.start()
+	before = tracemalloc.take_snapshot()
+	objects = mapper(rows)
+	after = tracemalloc.take_snapshot()
+	tracemalloc.stop()
+	allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+	return allocated / len(objects)
+
+
+def main():
+	parser = ArgumentParser(prog='bench_row_mapper.py', description='Row mapper micro-benchmark.')
+	parser.add_argument('--rows', type=int, default=200000, help="Rows mapped per run.")
+	parser.add_argument('--repeat', type=int, default=5, help="Runs per mapper; the best is reported.")
+	args = parser.parse_args()
+
+	rows = make_rows(args.rows)
+	row_mapper = RowMapper.from_enum(Event, EventColumns)
+	candidates = [('enum lookup + dict entity', enum_lookup_mapper),
+				  ('RowMapper + __slots__ entity', row_mapper.map_rows)]
+
+	print(f"{'mapper':<30} {'ns/row':>10} {'bytes/object':>14}")
+	for name, mapper in candidates:
+		best = min(timeit.repeat(lambda: mapper(rows), number=1, repeat=args.repeat))
+		print(f"{name:<30} {best / args.rows * 1e9:>10.0f} {bytes_per_object(mapper, rows):>14.0f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,111 @@
+"""Benchmark: JSON serialization of users with nested events.
+
+Compares the per-object User.to_json() path (one dict and one json.dumps per
+user, joined into an array) with the bulk serializer writing a JSON array and
+JSON Lines, using whichever encoder is available (orjson or json).
+
+Usage:
+    python benchmarks/bench_serialization.py [--users 100000] [--events-per-user 3] [--repeat 3]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+from volunteer_event_coordination.infrastructure_layer.user import User
+from volunteer_event_coordination.infrastructure_layer.event import Event
+from volunteer_event_coordination.infrastructure_layer import serialization
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+import io
+import json
+import timeit
+
+
+def make_users(count:int, events_per_user:int)->list:
+	"""Build users with registered events holding datetime values, as MySQL returns them."""
+	created_at = datetime(2025, 11, 1, 9, 0, 0)
+	events = []
+	for i in range(1, 51):
+		event = Event()
+		event.id = i
+		event.title = f'Event {i}'
+		event.description = 'Community food collection and sorting'
+		event.location = 'Community Center'
+		event.starts_at = datetime(2025, 11, 20, 10, 0, 0) + timedelta(days=i)
+		event.ends_at = event.starts_at + timedelta(hours=4)
+		event.capacity = 50
+		event.created_by = 1
+		event.created_at = created_at
+		event.registration_status = 'registered'
+		events.append(event)
+	users = []
+	for i in range(1, count + 1):
+		user = User()
+		user.id = i
+		user.full_name = f'Volunteer {i}'
+		user.email = f'volunteer{i}@example.com'
+		user.phone = '+1-555-0101'
+		user.role = 'volunteer'
+		user.created_at = created_at
+		user.events = [events[(i + j) % len(events)] for j in range(events_per_user)]
+		users.append(user)
+	return users
+
+
+def legacy_to_json(user:User)->str:
+	"""The original User.to_json: a fresh dict and a json.dumps per user
+	(with default=str added, since the original failed on datetime values)."""
+	supplier_dict = {}
+	supplier_dict["id"] = user.id
+	supplier_dict["full_name"] = user.full_name
+	supplier_dict["email"] = user.email
+	supplier_dict["phone"] = user.phone
+	supplier_dict["role"] = user.role
+	supplier_dict["created_at"] = user.created_at
+	supplier_dict["events"] = []
+	for event in user.events:
+		supplier_dict["events"].append(event.to_dict())
+	return json.dumps(supplier_dict, default=str)
+
+
+def per_object_to_json(users:list)->bytes:
+	"""One legacy to_json() call per user, joined into a JSON array."""
+	return ('[' + ','.join(legacy_to_json(user) for user in users) + ']').encode('utf-8')
+
+
+def bulk_json_array(users:list)->bytes:
+	buffer = io.BytesIO()
+	serialization.dump_json_array(users, buffer)
+	return buffer.getvalue()
+
+
+def bulk_jsonl(users:list)->bytes:
+	buffer = io.BytesIO()
+	serialization.dump_jsonl(users, buffer)
+	return buffer.getvalue()
+
+
+def main():
+	parser = ArgumentParser(prog='bench_serialization.py', description='Bulk JSON serialization benchmark.')
+	parser.add_argument('--users', type=int, default=100000, help="Users serialized per run.")
+	parser.add_argument('--events-per-user', type=int, default=3, help="Registered events nested in each user.")
+	parser.add_argument('--repeat', type=int, default=3, help="Runs per serializer; the best is reported.")
+	args = parser.parse_args()
+
+	users = make_users(args.users, args.events_per_user)
+	assert len(json.loads(bulk_json_array(users))) == args.users
+
+	print(f"encoder: {serialization.ENCODER}, users: {args.users}, events per user: {args.events_per_user}")
+	print(f"{'serializer':<28} {'seconds':>9} {'users/s':>12} {'MB':>8}")
+	for name, serializer in [('per-object to_json', per_object_to_json),
+							 ('bulk JSON array', bulk_json_array),
+							 ('bulk JSON Lines', bulk_jsonl)]:
+		best = min(timeit.repeat(lambda: serializer(users), number=1, repeat=args.repeat))
+		size = len(serializer(users)) / 1e6
+		print(f"{name:<28} {best:>9.3f} {args.users / best:>12,.0f} {size:>8.1f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,58 @@
+"""Compares two benchmark result files written by suite.py.
+
+Matches results by scale, target, method and variant and prints the change in
+best-of-repeat time per call. Exits with status 1 when any case slowed down by
+more than --threshold (a fraction; 0.10 = 10%), so it can gate CI.
+
+Usage:
+    python benchmarks/compare.py baseline.json candidate.json [--threshold 0.10]
+"""
+
+from argparse import ArgumentParser
+import json
+import sys
+
+
+def load_results(path:str)->dict:
+	with open(path, 'r') as f:
+		report = json.loads(f.read())
+	return report["meta"], {(r["scale"], r["target"], r["method"], r["variant"]): r for r in report["results"]}
+
+
+def main():
+	parser = ArgumentParser(prog='compare.py', description='Compare two benchmark result files.')
+	parser.add_argument('baseline', help="Results of the reference run.")
+	parser.add_argument('candidate', help="Results of the run to check.")
+	parser.add_argument('--threshold', type=float, default=0.10, help="Slowdown fraction that counts as a regression.")
+	args = parser.parse_args()
+
+	baseline_meta, baseline = load_results(args.baseline)
+	candidate_meta, candidate = load_results(args.candidate)
+	print(f'baseline:  {baseline_meta.get("git_revision")} {baseline_meta.get("timestamp")} ({baseline_meta.get("backend")})')
+	print(f'candidate: {candidate_meta.get("git_revision")} {candidate_meta.get("timestamp")} ({candidate_meta.get("backend")})')
+	print(f'{"scale":<6} {"target":<8} {"method":<52} {"variant":<16} {"base us":>12} {"new us":>12} {"change":>8}')
+
+	regressions = 0
+	for key in sorted(baseline.keys() & candidate.keys()):
+		before = baseline[key]["per_call_us"]
+		after = candidate[key]["per_call_us"]
+		change = (after - before) / before if before else 0.0
+		flag = ''
+		if change > args.threshold:
+			flag = '  REGRESSION'
+			regressions += 1
+		elif change < -args.threshold:
+			flag = '  faster'
+		print(f'{key[0]:<6} {key[1]:<8} {key[2]:<52} {key[3]:<16} {before:>12.2f} {after:>12.2f} {change:>+8.1%}{flag}')
+
+	for label, keys in (('only in baseline', baseline.keys() - candidate.keys()),
+						('only in candidate', candidate.keys() - baseline.keys())):
+		for key in sorted(keys):
+			print(f'{label}: {" ".join(part for part in key if part)}')
+
+	print(f'{regressions} regression(s) above {args.threshold:.0%}')
+	sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+	main()
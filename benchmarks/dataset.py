@@ -0,0 +1,130 @@
+"""Seeded synthetic dataset generator for the benchmarks.
+
+generate() builds users, events and registrations that satisfy the schema in
+database/db_version_1/create_tables.sql: roles and statuses come from the ENUM
+values, every event is created by an existing organizer or admin, and every
+(event, user) registration pair is unique. The same seed always produces the
+same dataset. Foreign keys are 1-based positions in the generated lists until
+load() inserts the data and rewrites them to the IDs the database generated.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+from volunteer_event_coordination.infrastructure_layer.user import User
+from volunteer_event_coordination.infrastructure_layer.event import Event
+from volunteer_event_coordination.infrastructure_layer.registration import Registration
+from datetime import datetime, timedelta
+import random
+
+ROLES = ('admin', 'organizer', 'volunteer')
+ROLE_WEIGHTS = (1, 9, 90)
+STATUSES = ('registered', 'waitlist', 'cancelled')
+STATUS_WEIGHTS = (80, 15, 5)
+
+# name: (users, events, registrations)
+SCALES = {
+	'1k': (500, 50, 1_000),
+	'100k': (20_000, 2_000, 100_000),
+	'1m': (100_000, 10_000, 1_000_000),
+}
+
+ACTIVITIES = ('Park Cleanup', 'Food Drive', 'Beach Sweep', 'Tree Planting', 'Shelter Shift',
+			  'Book Sorting', 'Blood Drive', 'River Cleanup', 'Soup Kitchen', 'Charity Run')
+LOCATIONS = tuple(f'{name} {kind}' for name in ('North', 'South', 'East', 'West', 'Central')
+				  for kind in ('Park', 'Library', 'Community Hall', 'School', 'Beach',
+							   'Market', 'Church', 'Stadium', 'Clinic', 'Shelter'))
+FIRST_DATE = datetime(2030, 1, 1, 8, 0, 0)
+
+
+class Dataset():
+	"""Generated users, events and registrations."""
+
+	def __init__(self, users:list, events:list, registrations:list, seed:int)->None:
+		self.users = users
+		self.events = events
+		self.registrations = registrations
+		self.seed = seed
+		self.loaded = False
+
+	def __str__(self)->str:
+		return f'{len(self.users)} users, {len(self.events)} events, {len(self.registrations)} registrations (seed {self.seed})'
+
+
+def generate(users:int, events:int, registrations:int, seed:int=42)->Dataset:
+	"""Builds a dataset of the given size; raises ValueError if the registrations cannot be unique."""
+	if users < 1 or events < 1 or registrations > users * events:
+		raise ValueError(f'Cannot place {registrations} unique registrations over {users} users and {events} events')
+	rng = random.Random(seed)
+
+	roles = rng.choices(ROLES, ROLE_WEIGHTS, k=users)
+	roles[0] = 'organizer'
+	user_list = []
+	for i, role in enumerate(roles):
+		user = User()
+		user.full_name = f'Volunteer {i:07d}'
+		user.email = f'volunteer{i:07d}.s{seed}@bench.example.com'
+		user.phone = f'555-{rng.randrange(10000):04d}'
+		user.role = role
+		user_list.append(user)
+
+	creators = [position for position, role in enumerate(roles, 1) if role != 'volunteer']
+	event_list = []
+	for i in range(events):
+		event = Event()
+		starts_at = FIRST_DATE + timedelta(hours=rng.randrange(365 * 24))
+		event.title = f'{rng.choice(ACTIVITIES)} #{i}'
+		event.description = f'Synthetic benchmark event {i}'
+		event.location = rng.choice(LOCATIONS)
+		event.starts_at = starts_at
+		event.ends_at = starts_at + timedelta(hours=rng.randint(1, 8))
+		event.capacity = rng.randint(5, 200)
+		event.created_by = rng.choice(creators)
+		event_list.append(event)
+
+	# Sampling from the range of pair indexes gives unique pairs without materializing users x events
+	statuses = rng.choices(STATUSES, STATUS_WEIGHTS, k=registrations)
+	registration_list = []
+	for pair, status in zip(rng.sample(range(users * events), registrations), statuses):
+		registration = Registration()
+		registration.user_id = pair // events + 1
+		registration.event_id = pair % events + 1
+		registration.status = status
+		registration_list.append(registration)
+
+	return Dataset(user_list, event_list, registration_list, seed)
+
+
+def generate_scale(name:str, seed:int=42)->Dataset:
+	"""Builds one of the named SCALES."""
+	return generate(*SCALES[name], seed=seed)
+
+
+def load(db, dataset:Dataset)->None:
+	"""Inserts the dataset through a StorageBackend's batch methods, which set the generated IDs."""
+	if dataset.loaded:
+		raise ValueError('Dataset is already loaded')
+	user_ids = _checked_ids(db.insert_users_many(dataset.users), 'users')
+	for event in dataset.events:
+		event.created_by = user_ids[event.created_by - 1]
+	event_ids = _checked_ids(db.insert_events_many(dataset.events), 'events')
+	for registration in dataset.registrations:
+		registration.user_id = user_ids[registration.user_id - 1]
+		registration.event_id = event_ids[registration.event_id - 1]
+	_checked_ids(db.register_many(dataset.registrations), 'registrations')
+	dataset.loaded = True
+
+
+def unload(db, dataset:Dataset)->None:
+	"""Deletes a loaded dataset; registrations go with their users and events."""
+	db.delete_events_many([event.id for event in dataset.events])
+	db.delete_users_many([user.id for user in dataset.users])
+	dataset.loaded = False
+
+
+def _checked_ids(result, what:str)->list:
+	if result.failures:
+		raise RuntimeError(f'{len(result.failures)} {what} failed to load, first: {result.failures[0]}')
+	return result.ids
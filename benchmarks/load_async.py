@@ -0,0 +1,112 @@
+"""Load test: concurrent registrations through AsyncAppServices vs. threads over AppServices.
+
+Creates --users temporary volunteers and two events, registers every volunteer
+to the first event from a pool of --threads OS threads calling AppServices, then
+to the second event from a single asyncio event loop keeping --concurrency
+AsyncAppServices calls in flight. Reports throughput and latency percentiles for
+both paths and removes the temporary data afterwards.
+
+Usage:
+    python benchmarks/load_async.py -c config/volunteer_event_coordination_app_config.json \
+        [--users 2000] [--threads 16] [--concurrency 500]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+from volunteer_event_coordination.service_layer.app_services import AppServices
+from volunteer_event_coordination.service_layer.async_app_services import AsyncAppServices
+from volunteer_event_coordination.infrastructure_layer.user import User
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import statistics
+import threading
+import time
+
+
+def summarize(name:str, latencies:list, elapsed:float, threads:int, succeeded:int)->dict:
+	"""Throughput and latency percentiles for one run."""
+	cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+	return {"path": name, "requests": len(latencies), "succeeded": succeeded,
+			"seconds": round(elapsed, 3), "requests_per_second": round(len(latencies) / elapsed, 1),
+			"p50_ms": round(cuts[49] * 1000, 2), "p95_ms": round(cuts[94] * 1000, 2),
+			"p99_ms": round(cuts[98] * 1000, 2), "os_threads": threads}
+
+
+def run_threaded(app:AppServices, user_ids:list, event_id:int, threads:int)->dict:
+	"""Register every user from a pool of OS threads, one blocking call per thread at a time."""
+	def register(user_id):
+		started = time.perf_counter()
+		ok = app.register_user_to_event(user_id, event_id, 'registered')
+		return time.perf_counter() - started, ok
+
+	started = time.perf_counter()
+	with ThreadPoolExecutor(max_workers=threads) as executor:
+		results = list(executor.map(register, user_ids))
+	elapsed = time.perf_counter() - started
+	return summarize('threads + AppServices', [r[0] for r in results], elapsed,
+					 threads, sum(1 for r in results if r[1]))
+
+
+async def run_async(app:AsyncAppServices, user_ids:list, event_id:int, concurrency:int)->dict:
+	"""Register every user from one event loop with up to concurrency calls in flight."""
+	semaphore = asyncio.Semaphore(concurrency)
+
+	async def register(user_id):
+		async with semaphore:
+			started = time.perf_counter()
+			ok = await app.register_user_to_event(user_id, event_id, 'registered')
+			return time.perf_counter() - started, ok
+
+	started = time.perf_counter()
+	results = await asyncio.gather(*(register(user_id) for user_id in user_ids))
+	elapsed = time.perf_counter() - started
+	return summarize('asyncio + AsyncAppServices', [r[0] for r in results], elapsed,
+					 threading.active_count(), sum(1 for r in results if r[1]))
+
+
+def main():
+	parser = ArgumentParser(prog='load_async.py', description='Async vs. threaded registration load test.')
+	parser.add_argument('-c', '--configfile', required=True, help="Configuration file to load.")
+	parser.add_argument('--users', type=int, default=2000, help="Temporary volunteers to register.")
+	parser.add_argument('--threads', type=int, default=16, help="OS threads for the synchronous path.")
+	parser.add_argument('--concurrency', type=int, default=500, help="In-flight calls for the async path.")
+	args = parser.parse_args()
+
+	with open(args.configfile, 'r') as f:
+		config = json.loads(f.read())
+
+	app = AppServices(config)
+	stamp = time.time_ns()
+	users = []
+	for i in range(args.users):
+		user = User()
+		user.full_name = f'Load Test Volunteer {i}'
+		user.email = f'load_{stamp}_{i}@example.com'
+		user.role = 'volunteer'
+		users.append(user)
+	user_ids = [user_id for user_id in app.create_users_many(users).ids if user_id]
+	events = [app.create_event(f'Load Test Event {n} {stamp}', 'load test', 'Load Test Location',
+							   '2030-01-01 09:00:00', '2030-01-01 12:00:00', args.users, user_ids[0])
+			  for n in (1, 2)]
+
+	try:
+		results = [run_threaded(app, user_ids, events[0].id, args.threads)]
+		async_app = AsyncAppServices(config, app)
+		try:
+			results.append(asyncio.run(run_async(async_app, user_ids, events[1].id, args.concurrency)))
+		finally:
+			async_app.close()
+		print(json.dumps(results, indent=2))
+	finally:
+		app.delete_event(events[0].id)
+		app.delete_event(events[1].id)
+		app.DB.delete_users_many(user_ids)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,268 @@
+"""Load test: mixed workload with a realistic arrival curve against AppServices.
+
+Generates open-loop arrivals from a piecewise-linear rate curve (requests per
+second over time, Poisson within each instant) and hands each arrival to a pool
+of worker threads, optionally spread over several processes. Each arrival runs one
+operation drawn from the --mix weights:
+
+    browse      get_all_events, or one event by ID when --browse-page is set
+    register    register_user_to_event for a random user and event
+    status      update_user_event_registration_status on an existing registration
+    unregister  unregister_user_from_event on an existing registration
+    list_users  get_all_users
+
+Latency is measured from the scheduled arrival time, so time spent queued behind
+busy workers counts (no coordinated omission). The report gives throughput and
+p50/p95/p99 latency per operation, plus connection pool wait time and timeouts.
+
+By default a seeded dataset (benchmarks/dataset.py) is loaded into a temporary
+SQLite file. With --backend mysql it is loaded into the configured database and
+deleted afterwards; use a dedicated database.
+
+Usage:
+    python benchmarks/load_mixed.py [--backend sqlite|mysql] [-c config.json] [--scale 1k] \
+        [--curve 0:20,10:300,40:300,60:50] [--mix browse=45,register=25,status=15,unregister=5,list_users=10] \
+        [--threads 32] [--processes 1] [--seed 7]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from volunteer_event_coordination.service_layer.app_services import AppServices
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_context
+import copy
+import dataset as datasets
+import json
+import random
+import statistics
+import tempfile
+import threading
+import time
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(__file__), '../config/volunteer_event_coordination_app_config.json')
+# Event-launch day: a quiet start, a sharp spike when registration opens, a plateau and a tail
+DEFAULT_CURVE = '0:20,10:300,40:300,60:50'
+DEFAULT_MIX = 'browse=45,register=25,status=15,unregister=5,list_users=10'
+OPERATIONS = ('browse', 'register', 'status', 'unregister', 'list_users')
+
+
+def parse_curve(text:str)->list:
+	"""'t0:rate0,t1:rate1,...' -> [(seconds, requests per second)], sorted by time."""
+	points = sorted((float(t), float(rate)) for t, rate in (point.split(':') for point in text.split(',')))
+	if len(points) < 2 or points[0][0] != 0:
+		raise ValueError('The curve needs at least two points and must start at time 0')
+	return points
+
+
+def parse_mix(text:str)->dict:
+	mix = {name: float(weight) for name, weight in (item.split('=') for item in text.split(','))}
+	unknown = set(mix) - set(OPERATIONS)
+	if unknown:
+		raise ValueError(f'Unknown operations in mix: {", ".join(sorted(unknown))}')
+	return mix
+
+
+def rate_at(curve:list, t:float)->float:
+	for (t0, r0), (t1, r1) in zip(curve, curve[1:]):
+		if t0 <= t <= t1:
+			return r0 + (r1 - r0) * (t - t0) / (t1 - t0)
+	return 0.0
+
+
+def schedule(curve:list, mix:dict, seed:int)->list:
+	"""Arrival times and operations of a non-homogeneous Poisson process, by thinning."""
+	rng = random.Random(seed)
+	peak = max(rate for _, rate in curve)
+	duration = curve[-1][0]
+	names, weights = list(mix), list(mix.values())
+	arrivals = []
+	t = 0.0
+	while True:
+		t += rng.expovariate(peak)
+		if t >= duration:
+			return arrivals
+		if rng.random() * peak <= rate_at(curve, t):
+			arrivals.append((t, rng.choices(names, weights)[0]))
+
+
+class Workload():
+	"""Runs operations against AppServices and tracks the registrations it may change."""
+
+	def __init__(self, app:AppServices, user_ids:list, event_ids:list, registrations:list, seed:int, browse_page:bool)->None:
+		self.app = app
+		self.user_ids = user_ids
+		self.event_ids = event_ids
+		self.registered = list(registrations)
+		self.lock = threading.Lock()
+		self.rng = random.Random(seed)
+		self.browse_page = browse_page
+
+	def run(self, operation:str)->bool:
+		with self.lock:
+			rng_value = self.rng.random()
+			user_id = self.rng.choice(self.user_ids)
+			event_id = self.rng.choice(self.event_ids)
+			pair = None
+			if operation in ('status', 'unregister') and self.registered:
+				index = self.rng.randrange(len(self.registered))
+				pair = self.registered[index]
+				if operation == 'unregister':
+					self.registered[index] = self.registered[-1]
+					self.registered.pop()
+		if operation == 'browse':
+			if self.browse_page:
+				return self.app.get_event_by_id(event_id) is not None
+			return bool(self.app.get_all_events())
+		if operation == 'list_users':
+			return bool(self.app.get_all_users())
+		if operation == 'register':
+			ok = self.app.register_user_to_event(user_id, event_id, 'registered')
+			if ok:
+				with self.lock:
+					self.registered.append((user_id, event_id))
+			return ok
+		if pair is None:
+			return False
+		if operation == 'status':
+			status = 'waitlist' if rng_value < 0.5 else 'registered'
+			return self.app.update_user_event_registration_status(pair[0], pair[1], status)
+		return self.app.unregister_user_from_event(pair[0], pair[1])
+
+
+def drive(config:dict, arrivals:list, user_ids:list, event_ids:list, registrations:list, threads:int, seed:int, browse_page:bool)->dict:
+	"""Replays arrivals in this process and returns raw latencies and pool stats."""
+	app = AppServices(config)
+	workload = Workload(app, user_ids, event_ids, registrations, seed, browse_page)
+	records = {name: [] for name in OPERATIONS}
+	failures = {name: 0 for name in OPERATIONS}
+	lag = []
+	records_lock = threading.Lock()
+
+	def execute(scheduled:float, operation:str):
+		started = time.perf_counter()
+		try:
+			ok = workload.run(operation)
+		except Exception:
+			ok = False
+		finished = time.perf_counter()
+		with records_lock:
+			records[operation].append((finished - scheduled, finished - started))
+			if not ok:
+				failures[operation] += 1
+
+	with ThreadPoolExecutor(max_workers=threads) as executor:
+		origin = time.perf_counter()
+		for offset, operation in arrivals:
+			scheduled = origin + offset
+			delay = scheduled - time.perf_counter()
+			if delay > 0:
+				time.sleep(delay)
+			else:
+				lag.append(-delay)
+			executor.submit(execute, scheduled, operation)
+	elapsed = time.perf_counter() - origin
+	pool = app.get_pool_stats()
+	app.DB.close()
+	return {"records": records, "failures": failures, "elapsed": elapsed, "pool": pool,
+			"dispatch_lag_max": max(lag, default=0.0)}
+
+
+def _drive_process(args):
+	return drive(*args)
+
+
+def percentiles(values:list)->dict:
+	if not values:
+		return {"p50_ms": None, "p95_ms": None, "p99_ms": None}
+	cuts = statistics.quantiles(values, n=100) if len(values) > 1 else values * 99
+	return {"p50_ms": round(cuts[49] * 1000, 2), "p95_ms": round(cuts[94] * 1000, 2), "p99_ms": round(cuts[98] * 1000, 2)}
+
+
+def report(runs:list, duration:float)->dict:
+	elapsed = max(run["elapsed"] for run in runs)
+	operations = {}
+	for name in OPERATIONS:
+		latencies = [latency for run in runs for latency, _ in run["records"][name]]
+		service = [service for run in runs for _, service in run["records"][name]]
+		if not latencies:
+			continue
+		failed = sum(run["failures"][name] for run in runs)
+		operations[name] = {"requests": len(latencies), "failed": failed,
+							"throughput_per_second": round(len(latencies) / elapsed, 1),
+							**percentiles(latencies),
+							"service_p99_ms": percentiles(service)["p99_ms"]}
+	total = sum(op["requests"] for op in operations.values())
+	checkouts = sum(run["pool"]["checkouts"] for run in runs)
+	wait_total = sum(run["pool"]["wait_seconds_total"] for run in runs)
+	return {
+		"duration_seconds": duration,
+		"elapsed_seconds": round(elapsed, 3),
+		"requests": total,
+		"throughput_per_second": round(total / elapsed, 1),
+		"all": percentiles([latency for run in runs for records in run["records"].values() for latency, _ in records]),
+		"operations": operations,
+		"pool": {
+			"checkouts": checkouts,
+			"timeouts": sum(run["pool"]["timeouts"] for run in runs),
+			"wait_ms_mean": round(wait_total / checkouts * 1000, 3) if checkouts else 0.0,
+			"wait_ms_max": round(max(run["pool"]["wait_seconds_max"] for run in runs) * 1000, 3),
+			"max_size": sum(run["pool"]["max_size"] for run in runs),
+		},
+		"dispatch_lag_ms_max": round(max(run["dispatch_lag_max"] for run in runs) * 1000, 3),
+	}
+
+
+def main():
+	parser = ArgumentParser(prog='load_mixed.py', description='Mixed-workload load generator for AppServices.')
+	parser.add_argument('-c', '--configfile', default=DEFAULT_CONFIG, help="Configuration file to load.")
+	parser.add_argument('--backend', choices=('sqlite', 'mysql'), default='sqlite', help="Storage backend to drive.")
+	parser.add_argument('--scale', choices=tuple(datasets.SCALES), default='1k', help="Dataset loaded before the run.")
+	parser.add_argument('--curve', default=DEFAULT_CURVE, help="Arrival rate curve as seconds:requests_per_second points.")
+	parser.add_argument('--mix', default=DEFAULT_MIX, help="Operation weights.")
+	parser.add_argument('--threads', type=int, default=32, help="Worker threads per process.")
+	parser.add_argument('--processes', type=int, default=1, help="Worker processes, each with its own AppServices.")
+	parser.add_argument('--browse-page', action='store_true', help="Browse one event by ID instead of listing all events.")
+	parser.add_argument('--seed', type=int, default=7, help="Arrival and operation seed.")
+	args = parser.parse_args()
+
+	with open(args.configfile, 'r') as f:
+		config = json.loads(f.read())
+	config = copy.deepcopy(config)
+	config["database"]["backend"] = args.backend
+	curve = parse_curve(args.curve)
+	arrivals = schedule(curve, parse_mix(args.mix), args.seed)
+
+	with tempfile.TemporaryDirectory() as directory:
+		if args.backend == 'sqlite':
+			config["database"]["sqlite"] = dict(config["database"].get("sqlite", {}), path=os.path.join(directory, 'load.db'))
+		setup = AppServices(config)
+		data = datasets.generate_scale(args.scale, args.seed)
+		datasets.load(setup.DB, data)
+		user_ids = [user.id for user in data.users]
+		event_ids = [event.id for event in data.events]
+		pairs = [(r.user_id, r.event_id) for r in data.registrations]
+		print(f'{len(arrivals)} arrivals over {curve[-1][0]:g}s against {data}', file=sys.stderr)
+		try:
+			if args.processes == 1:
+				runs = [drive(config, arrivals, user_ids, event_ids, pairs, args.threads, args.seed, args.browse_page)]
+			else:
+				# Each process owns every n-th arrival and a disjoint share of the existing registrations
+				jobs = [(config, arrivals[p::args.processes], user_ids, event_ids, pairs[p::args.processes],
+						 args.threads, args.seed + p, args.browse_page) for p in range(args.processes)]
+				with get_context('spawn').Pool(args.processes) as pool:
+					runs = pool.map(_drive_process, jobs)
+		finally:
+			if args.backend == 'mysql':
+				datasets.unload(setup.DB, data)
+			setup.DB.close()
+
+	print(json.dumps(report(runs, curve[-1][0]), indent=2))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,385 @@
+"""Benchmark suite: times every public StorageBackend and AppServices method at several scales.
+
+For each scale a seeded dataset (see dataset.py) is loaded into a fresh database,
+then every case runs --repeat times. Point operations are timed over --calls
+random IDs per sample; writes undo themselves (insert+delete, register+unregister,
+updates that write back the current values) so each sample sees the same data.
+Results go to --output as JSON and can be compared between runs with compare.py.
+
+The default backend is a SQLite file in a temporary directory, which needs no
+server. With --backend mysql the dataset is loaded into the database named in the
+config file and deleted again afterwards; use a dedicated, empty database.
+
+Usage:
+    python benchmarks/suite.py [--scales 1k,100k,1m] [--backend sqlite|mysql] \
+        [-c config/volunteer_event_coordination_app_config.json] [--repeat 3] [--calls 1000] \
+        [--seed 42] [--output bench_results.json]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from volunteer_event_coordination.service_layer.app_services import AppServices
+from volunteer_event_coordination.infrastructure_layer.user import User
+from volunteer_event_coordination.infrastructure_layer.event import Event
+from volunteer_event_coordination.infrastructure_layer.registration import Registration
+from volunteer_event_coordination.infrastructure_layer import serialization
+from volunteer_event_coordination.settings import Settings
+from argparse import ArgumentParser
+from datetime import datetime, timedelta, timezone
+import copy
+import dataset as datasets
+import io
+import json
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(__file__), '../config/volunteer_event_coordination_app_config.json')
+
+# Rows per page for the paged event queries, the search results' default limit
+PAGE = 20
+
+
+class Context():
+	"""IDs and sample rows the cases draw from."""
+
+	def __init__(self, data:datasets.Dataset, calls:int, seed:int)->None:
+		rng = random.Random(seed)
+		self.calls = calls
+		self.user_ids = [rng.choice(data.users).id for _ in range(calls)]
+		self.event_ids = [rng.choice(data.events).id for _ in range(calls)]
+		self.users = rng.sample(data.users, min(calls, len(data.users)))
+		self.events = rng.sample(data.events, min(calls, len(data.events)))
+		self.registrations = rng.sample(data.registrations, min(calls, len(data.registrations)))
+		self.free_event_ids = rng.sample([event.id for event in data.events], min(calls, len(data.events)))
+		# Three-hour windows over the dataset's year of events
+		starts = [datasets.FIRST_DATE + timedelta(hours=rng.randrange(365 * 24)) for _ in range(calls)]
+		self.windows = [(start, start + timedelta(hours=3)) for start in starts]
+		self.locations = [rng.choice(datasets.LOCATIONS) for _ in range(calls)]
+		# Whole words and prefixes of the activity names in event titles
+		words = [word.lower() for activity in datasets.ACTIVITIES for word in activity.split()]
+		self.queries = [rng.choice(words)[:rng.randint(3, 8)] for _ in range(calls)]
+		self.stamp = 0
+		# Users the cases create outside the dataset, removed with it
+		self.extra_user_ids = []
+
+	def new_users(self, count:int)->list:
+		"""Users with emails that do not collide with the dataset or earlier samples."""
+		self.stamp += 1
+		users = []
+		for i in range(count):
+			user = User()
+			user.full_name = f'Bench User {i}'
+			user.email = f'bench{self.stamp}.{i}@bench.example.com'
+			user.phone = '555-0000'
+			user.role = 'volunteer'
+			users.append(user)
+		return users
+
+	def new_events(self, count:int, created_by:int)->list:
+		events = []
+		for i in range(count):
+			event = Event()
+			event.title = f'Bench Event {i}'
+			event.description = 'benchmark'
+			event.location = 'Bench Hall'
+			event.starts_at = datetime(2031, 1, 1, 9, 0, 0)
+			event.ends_at = datetime(2031, 1, 1, 12, 0, 0)
+			event.capacity = 10
+			event.created_by = created_by
+			events.append(event)
+		return events
+
+
+def drain(iterator)->int:
+	return sum(1 for _ in iterator)
+
+
+def backend_cases(db, ctx:Context)->list:
+	"""(method, variant, calls, function) for every public StorageBackend method."""
+	n = ctx.calls
+	volunteer = db.insert_user(ctx.new_users(1)[0])
+	ctx.extra_user_ids.append(volunteer.id)
+	organizer = ctx.users[0].id
+
+	def point(function, ids):
+		return lambda: [function(i) for i in ids]
+
+	def insert_delete_user():
+		for user in ctx.new_users(n):
+			db.insert_user(user)
+			db.delete_user(user.id)
+
+	def insert_delete_event():
+		for event in ctx.new_events(n, organizer):
+			db.insert_event(event)
+			db.delete_event(event.id)
+
+	def register_unregister():
+		for event_id in ctx.free_event_ids:
+			db.register_user_to_event(volunteer.id, event_id, 'registered')
+			db.unregister_user_from_event(volunteer.id, event_id)
+
+	def insert_delete_users_many():
+		result = db.insert_users_many(ctx.new_users(n))
+		db.delete_users_many([user_id for user_id in result.ids if user_id])
+
+	def insert_delete_events_many():
+		result = db.insert_events_many(ctx.new_events(n, organizer))
+		db.delete_events_many([event_id for event_id in result.ids if event_id])
+
+	def register_unregister_many():
+		registrations = []
+		for event_id in ctx.free_event_ids:
+			registration = Registration()
+			registration.user_id = volunteer.id
+			registration.event_id = event_id
+			registration.status = 'registered'
+			registrations.append(registration)
+		db.register_many(registrations)
+		db.unregister_many(registrations)
+
+	return [
+		('select_all_users', 'lazy', 1, lambda: db.select_all_users()),
+		('select_all_users', 'prefetch_events', 1, lambda: db.select_all_users(prefetch_events=True)),
+		('select_all_events', '', 1, lambda: db.select_all_events()),
+		('iter_users', 'lazy', 1, lambda: drain(db.iter_users())),
+		('iter_users', 'prefetch_events', 1, lambda: drain(db.iter_users(prefetch_events=True))),
+		('iter_events', '', 1, lambda: drain(db.iter_events())),
+		('iter_registrations', '', 1, lambda: drain(db.iter_registrations())),
+		('select_event_frame', '', 1, lambda: db.select_event_frame()),
+		('select_registration_frame', '', 1, lambda: db.select_registration_frame()),
+		('select_user_by_id', '', n, point(db.select_user_by_id, ctx.user_ids)),
+		('select_user_by_id', 'prefetch_events', n, point(lambda i: db.select_user_by_id(i, True), ctx.user_ids)),
+		('select_event_by_id', '', n, point(db.select_event_by_id, ctx.event_ids)),
+		('select_all_events_for_user_id', '', n, point(db.select_all_events_for_user_id, ctx.user_ids)),
+		('user_exists', '', n, point(db.user_exists, ctx.user_ids)),
+		('event_exists', '', n, point(db.event_exists, ctx.event_ids)),
+		('validate_user_and_event', '', n, lambda: [db.validate_user_and_event(u, e) for u, e in zip(ctx.user_ids, ctx.event_ids)]),
+		('count_registrations', '', n, point(db.count_registrations, ctx.event_ids)),
+		('count_registrations', 'status', n, point(lambda i: db.count_registrations(i, 'registered'), ctx.event_ids)),
+		('select_users_in', '', 1, lambda: db.select_users_in(ctx.user_ids)),
+		('select_events_in', '', 1, lambda: db.select_events_in(ctx.event_ids)),
+		('select_user_ids', 'volunteer', 1, lambda: db.select_user_ids('volunteer')),
+		('select_events_between', 'page', n, lambda: [db.select_events_between(start, end, PAGE) for start, end in ctx.windows]),
+		('select_upcoming_events', 'page', 1, lambda: db.select_upcoming_events(PAGE)),
+		('select_events_by_location', 'page', n, lambda: [db.select_events_by_location(location, limit=PAGE) for location in ctx.locations]),
+		('select_events_by_location', 'window', n,
+			lambda: [db.select_events_by_location(location, start, end, PAGE) for location, (start, end) in zip(ctx.locations, ctx.windows)]),
+		('select_conflicting_events', '', n, lambda: [db.select_conflicting_events(u, e) for u, e in zip(ctx.user_ids, ctx.event_ids)]),
+		('insert_user+delete_user', '', n, insert_delete_user),
+		('insert_event+delete_event', '', n, insert_delete_event),
+		('update_user', '', len(ctx.users), lambda: [db.update_user(user) for user in ctx.users]),
+		('update_event', '', len(ctx.events), lambda: [db.update_event(event) for event in ctx.events]),
+		('register_user_to_event+unregister_user_from_event', '', len(ctx.free_event_ids), register_unregister),
+		('update_user_event_registration_status', '', len(ctx.registrations),
+			lambda: [db.update_user_event_registration_status(r.user_id, r.event_id, r.status) for r in ctx.registrations]),
+		('insert_users_many+delete_users_many', '', n, insert_delete_users_many),
+		('insert_events_many+delete_events_many', '', n, insert_delete_events_many),
+		('register_many+unregister_many', '', len(ctx.free_event_ids), register_unregister_many),
+		('update_users_many', '', len(ctx.users), lambda: db.update_users_many(ctx.users)),
+		('update_events_many', '', len(ctx.events), lambda: db.update_events_many(ctx.events)),
+		('update_registration_status_many', '', len(ctx.registrations), lambda: db.update_registration_status_many(ctx.registrations)),
+	]
+
+
+def service_cases(app:AppServices, ctx:Context)->list:
+	"""(method, variant, calls, function) for every public AppServices method."""
+	n = ctx.calls
+	volunteer = ctx.new_users(1)[0]
+	volunteer = app.create_user(volunteer.full_name, volunteer.email, volunteer.phone, volunteer.role)
+	ctx.extra_user_ids.append(volunteer.id)
+	organizer = ctx.users[0].id
+
+	def point(function, ids):
+		return lambda: [function(i) for i in ids]
+
+	def create_delete_user():
+		for user in ctx.new_users(n):
+			created = app.create_user(user.full_name, user.email, user.phone, user.role)
+			app.delete_user(created.id)
+
+	def create_delete_event():
+		for i in range(n):
+			created = app.create_event(f'Bench Event {i}', 'benchmark', 'Bench Hall',
+									   '2031-01-01 09:00:00', '2031-01-01 12:00:00', 10, organizer)
+			app.delete_event(created.id)
+
+	def register_unregister():
+		for event_id in ctx.free_event_ids:
+			app.register_user_to_event(volunteer.id, event_id, 'registered')
+			app.unregister_user_from_event(volunteer.id, event_id)
+
+	def create_users_many():
+		result = app.create_users_many(ctx.new_users(n))
+		app.DB.delete_users_many([user_id for user_id in result.ids if user_id])
+
+	def create_events_many():
+		result = app.create_events_many(ctx.new_events(n, organizer))
+		app.DB.delete_events_many([event_id for event_id in result.ids if event_id])
+
+	def register_many():
+		registrations = []
+		for event_id in ctx.free_event_ids:
+			registration = Registration()
+			registration.user_id = volunteer.id
+			registration.event_id = event_id
+			registration.status = 'registered'
+			registrations.append(registration)
+		app.register_many(registrations)
+		app.DB.unregister_many(registrations)
+
+	def search_cold():
+		# Drop the in-memory index so the sample includes rebuilding it from the events
+		app._search = None
+		app.search_events(ctx.queries[0])
+
+	def available_cold():
+		app._availability = None
+		app.find_available_volunteers(*ctx.windows[0])
+
+	return [
+		('get_all_users', 'lazy', 1, lambda: app.get_all_users()),
+		('get_all_users', 'prefetch_events', 1, lambda: app.get_all_users(prefetch_events=True)),
+		('get_all_events', '', 1, lambda: app.get_all_events()),
+		('iter_users', '', 1, lambda: drain(app.iter_users())),
+		('iter_events', '', 1, lambda: drain(app.iter_events())),
+		('iter_registrations', '', 1, lambda: drain(app.iter_registrations())),
+		('export_users', 'jsonl', 1, lambda: app.export_users(io.BytesIO())),
+		('export_events', 'json', 1, lambda: app.export_events(io.BytesIO(), json_lines=False)),
+		('get_event_frame', '', 1, lambda: app.get_event_frame()),
+		('get_registration_frame', '', 1, lambda: app.get_registration_frame()),
+		('get_user_by_id', '', n, point(app.get_user_by_id, ctx.user_ids)),
+		('get_event_by_id', '', n, point(app.get_event_by_id, ctx.event_ids)),
+		('get_registered_events_for_user_id', '', n, point(app.get_registered_events_for_user_id, ctx.user_ids)),
+		('count_registrations', '', n, point(app.count_registrations, ctx.event_ids)),
+		('get_events_between', 'page', n, lambda: [app.get_events_between(start, end, PAGE) for start, end in ctx.windows]),
+		('get_upcoming_events', 'page', 1, lambda: app.get_upcoming_events(PAGE)),
+		('get_events_by_location', 'page', n, lambda: [app.get_events_by_location(location, limit=PAGE) for location in ctx.locations]),
+		('search_events', 'build_index', 1, search_cold),
+		('search_events', '', n, lambda: [app.search_events(query) for query in ctx.queries]),
+		('find_available_volunteers', 'build_index', 1, available_cold),
+		('find_available_volunteers', 'limit', n, lambda: [app.find_available_volunteers(start, end, PAGE) for start, end in ctx.windows]),
+		('get_schedule_conflicts', '', n, lambda: [app.get_schedule_conflicts(u, e) for u, e in zip(ctx.user_ids, ctx.event_ids)]),
+		('get_schedule_conflict_report', '', 1, lambda: app.get_schedule_conflict_report()),
+		('create_user+delete_user', '', n, create_delete_user),
+		('create_event+delete_event', '', n, create_delete_event),
+		('update_user', '', len(ctx.users),
+			lambda: [app.update_user(u.id, u.full_name, u.email, u.phone, u.role) for u in ctx.users]),
+		('update_event', '', len(ctx.events),
+			lambda: [app.update_event(e.id, e.title, e.description, e.location, e.starts_at, e.ends_at, e.capacity) for e in ctx.events]),
+		('register_user_to_event+unregister_user_from_event', '', len(ctx.free_event_ids), register_unregister),
+		('update_user_event_registration_status', '', len(ctx.registrations),
+			lambda: [app.update_user_event_registration_status(r.user_id, r.event_id, r.status) for r in ctx.registrations]),
+		('create_users_many', '', n, create_users_many),
+		('create_events_many', '', n, create_events_many),
+		('register_many', '', len(ctx.free_event_ids), register_many),
+	]
+
+
+def time_case(function, repeat:int)->list:
+	samples = []
+	for _ in range(repeat):
+		started = time.perf_counter()
+		function()
+		samples.append(time.perf_counter() - started)
+	return samples
+
+
+def run_scale(name:str, config:dict, args)->list:
+	data = datasets.generate_scale(name, args.seed)
+	print(f'[{name}] {data}', file=sys.stderr)
+	app = AppServices(config)
+	started = time.perf_counter()
+	datasets.load(app.DB, data)
+	results = [{"scale": name, "target": "dataset", "method": "load", "variant": "",
+				"calls": len(data.users) + len(data.events) + len(data.registrations),
+				"seconds": [round(time.perf_counter() - started, 6)]}]
+	ctx = Context(data, args.calls, args.seed)
+	try:
+		for target, cases in (('backend', backend_cases(app.DB, ctx)), ('service', service_cases(app, ctx))):
+			for method, variant, calls, function in cases:
+				if args.filter and args.filter not in method:
+					continue
+				samples = time_case(function, args.repeat)
+				results.append({"scale": name, "target": target, "method": method, "variant": variant,
+								"calls": calls, "seconds": [round(s, 6) for s in samples]})
+				print(f'[{name}] {target}.{method} {variant}: {min(samples):.4f}s', file=sys.stderr)
+	finally:
+		if args.backend == 'mysql':
+			datasets.unload(app.DB, data)
+			app.DB.delete_users_many(ctx.extra_user_ids)
+		app.DB.close()
+	for result in results:
+		seconds = result["seconds"]
+		result["seconds_min"] = min(seconds)
+		result["seconds_median"] = statistics.median(seconds)
+		result["per_call_us"] = round(min(seconds) / result["calls"] * 1e6, 3)
+	return results
+
+
+def git_revision()->str:
+	try:
+		return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+							  cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+	except Exception:
+		return None
+
+
+def main():
+	parser = ArgumentParser(prog='suite.py', description='Scaled benchmark suite for the storage backend and services.')
+	parser.add_argument('-c', '--configfile', default=DEFAULT_CONFIG, help="Configuration file to load.")
+	parser.add_argument('--backend', choices=('sqlite', 'mysql'), default='sqlite', help="Storage backend to benchmark.")
+	parser.add_argument('--scales', default='1k,100k', help=f"Comma-separated scales from {', '.join(datasets.SCALES)}.")
+	parser.add_argument('--repeat', type=int, default=3, help="Samples per case.")
+	parser.add_argument('--calls', type=int, default=1000, help="Operations per sample for point cases.")
+	parser.add_argument('--seed', type=int, default=42, help="Dataset and sampling seed.")
+	parser.add_argument('--filter', help="Only run methods whose name contains this text.")
+	parser.add_argument('--output', default='bench_results.json', help="Results file.")
+	args = parser.parse_args()
+
+	with open(args.configfile, 'r') as f:
+		base_config = json.loads(f.read())
+
+	# The services log to logs_dir from app_settings.json, relative to the working directory
+	os.makedirs(Settings.current()['logs_dir'], exist_ok=True)
+
+	results = []
+	with tempfile.TemporaryDirectory() as directory:
+		for name in args.scales.split(','):
+			config = copy.deepcopy(base_config)
+			config["database"]["backend"] = args.backend
+			if args.backend == 'sqlite':
+				config["database"]["sqlite"] = dict(config["database"].get("sqlite", {}),
+													path=os.path.join(directory, f'bench_{name}.db'))
+			results.extend(run_scale(name, config, args))
+
+	report = {
+		"meta": {
+			"timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+			"git_revision": git_revision(),
+			"python": platform.python_version(),
+			"platform": platform.platform(),
+			"backend": args.backend,
+			"json_encoder": serialization.ENCODER,
+			"scales": {name: datasets.SCALES[name] for name in args.scales.split(',')},
+			"repeat": args.repeat,
+			"calls": args.calls,
+			"seed": args.seed,
+		},
+		"results": results,
+	}
+	with open(args.output, 'w') as f:
+		json.dump(report, f, indent=2)
+	print(f'Wrote {len(results)} results to {args.output}', file=sys.stderr)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,16 @@
+-- Performance indexes for the persistence wrapper's hot queries
+-- Applied by: python src/main.py -c <config> migrate
+-- ALGORITHM=INPLACE, LOCK=NONE builds each index online: reads and writes continue meanwhile.
+
+-- SELECT_REGISTERED_EVENTS_FOR_USER_ID, SELECT_ALL_USERS_WITH_EVENTS and the user-side
+-- UPDATE_USER_EVENT_STATUS / UNREGISTER_USER_FROM_EVENT lookups
+CREATE INDEX idx_xref_user_event ON volunteer_shift_xref (user_id, event_id) ALGORITHM=INPLACE LOCK=NONE;
+
+-- COUNT_REGISTRATIONS_FOR_EVENT_BY_STATUS, answered from the index alone
+CREATE INDEX idx_xref_event_status ON volunteer_shift_xref (event_id, status) ALGORITHM=INPLACE LOCK=NONE;
+
+-- Date-range and upcoming-event queries
+CREATE INDEX idx_events_starts_at ON events (starts_at) ALGORITHM=INPLACE LOCK=NONE;
+
+-- Events by creator; also used by ON DELETE SET NULL when a user is deleted
+CREATE INDEX idx_events_created_by ON events (created_by) ALGORITHM=INPLACE LOCK=NONE;
@@ -0,0 +1,7 @@
+-- Performance indexes for the persistence wrapper's hot queries
+-- SQLite version of migrate.sql; applied automatically when the SQLite backend opens a database.
+
+CREATE INDEX IF NOT EXISTS idx_xref_user_event ON volunteer_shift_xref (user_id, event_id);
+CREATE INDEX IF NOT EXISTS idx_xref_event_status ON volunteer_shift_xref (event_id, status);
+CREATE INDEX IF NOT EXISTS idx_events_starts_at ON events (starts_at);
+CREATE INDEX IF NOT EXISTS idx_events_created_by ON events (created_by);
@@ -0,0 +1,4 @@
+-- Location and start time index for events by location
+-- Serves SELECT_EVENTS_BY_LOCATION_PAGE as one index range in (starts_at, id) order;
+-- the starts_at range queries use idx_events_starts_at from db_version_2.
+CREATE INDEX idx_events_location_starts_at ON events (location, starts_at) ALGORITHM=INPLACE LOCK=NONE;
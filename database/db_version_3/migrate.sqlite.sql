@@ -0,0 +1,3 @@
+-- Location and start time index for events by location
+-- SQLite version of migrate.sql.
+CREATE INDEX IF NOT EXISTS idx_events_location_starts_at ON events (location, starts_at);
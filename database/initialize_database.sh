@@ -27,4 +27,9 @@ $MYSQL -u $USER -p$PASSWORD < db_version_1/create_user.sql 2>&1 | tee -a logs/cr
 echo $d': Creating tables...' | tee -a logs/create_tables.log
 $MYSQL -u $USER -p$PASSWORD < db_version_1/create_tables.sql 2>&1 | tee -a logs/create_tables.log
 echo $d': Inserting test data...' | tee -a logs/insert_test_data.log
-$MYSQL -u $USER -p$PASSWORD < db_version_1/insert_test_data.sql 2>&1 | tee -a logs/insert_test_data.log
\ No newline at end of file
+$MYSQL -u $USER -p$PASSWORD < db_version_1/insert_test_data.sql 2>&1 | tee -a logs/insert_test_data.log
+
+# Apply Database Versions 2+ (database/db_version_<N>/migrate.sql); existing databases
+# can be upgraded online with the same command instead of being recreated
+echo $d': Migrating schema...' | tee -a logs/migrate.log
+python3 ../src/main.py -c ../config/volunteer_event_coordination_app_config.json migrate 2>&1 | tee -a logs/migrate.log
\ No newline at end of file
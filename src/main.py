@@ -1,21 +1,75 @@
 """Entry point for the Employee Training Application."""
 
+import time
+_STARTED = time.perf_counter()
+
 import json
+import sys
 from argparse import ArgumentParser
-from volunteer_event_coordination.presentation_layer.console_ui import ConsoleUI
+from contextlib import contextmanager
+from volunteer_event_coordination.settings import Settings
+
+
+
+class StartupProfile():
+	"""Times the startup stages and the modules each one imports."""
 
+	def __init__(self, enabled:bool)->None:
+		self.enabled = enabled
+		self.stages = [('main.py imports', time.perf_counter() - _STARTED, len(sys.modules), [])]
+
+	@contextmanager
+	def stage(self, name:str):
+		if not self.enabled:
+			yield
+			return
+		modules = set(sys.modules)
+		started = time.perf_counter()
+		try:
+			yield
+		finally:
+			elapsed = time.perf_counter() - started
+			loaded = sorted(set(sys.modules) - modules)
+			packages = sorted({module.split('.')[0] for module in loaded if not module.startswith('_')})
+			self.stages.append((name, elapsed, len(loaded), packages))
+
+	def report(self)->None:
+		if not self.enabled:
+			return
+		total = time.perf_counter() - _STARTED
+		print(f'Startup profile ({total * 1000:.1f} ms since main.py started):', file=sys.stderr)
+		for name, elapsed, modules, packages in self.stages:
+			imported = f'{modules} modules' + (f': {", ".join(packages)}' if packages else '')
+			print(f'\t{elapsed * 1000:8.1f} ms  {name:34} {imported}', file=sys.stderr)
+		print('\tFor a per-module breakdown run: python -X importtime src/main.py ...', file=sys.stderr)
 
 
 def main():
 	"""Entry point."""
 	args = configure_and_parse_commandline_arguments()
+	profile = StartupProfile(args.startup_profile)
+
+	with profile.stage('read settings'):
+		# Read app_settings.json once; edits (such as log_level) apply without a restart
+		Settings.watch()
+
+	with profile.stage('read configuration'):
+		if args.configfile:
+			config = None
+			with open(args.configfile, 'r') as f:
+				config = json.loads(f.read())
 
-	if args.configfile:
-		config = None
-		with open(args.configfile, 'r') as f:
-			config = json.loads(f.read())
+	if args.command == 'import':
+		run_import(config, args, profile)
+		return
+	if args.command == 'migrate':
+		sys.exit(run_migrate(config, args))
 
-	ui = ConsoleUI(config)
+	with profile.stage('import console UI and services'):
+		from volunteer_event_coordination.presentation_layer.console_ui import ConsoleUI
+	with profile.stage('create console UI and services'):
+		ui = ConsoleUI(config)
+	profile.report()
 	ui.start()
 			
 		
@@ -31,10 +85,88 @@ def configure_and_parse_commandline_arguments():
 	parser.add_argument('-c','--configfile',
 					help="Configuration file to load.",
 					required=True)
+
+	parser.add_argument('--startup-profile',
+					action='store_true',
+					help="Print an import and initialization timing breakdown to stderr before starting.")
+
+	subparsers = parser.add_subparsers(dest='command')
+	import_parser = subparsers.add_parser('import',
+					help="Stream users, events and registrations from CSV/JSONL files into the database.")
+	import_parser.add_argument('--users',
+					help="CSV or JSONL file of users (full_name, email, phone, role).")
+	import_parser.add_argument('--events',
+					help="CSV or JSONL file of events (title, description, location, starts_at, ends_at, capacity, created_by).")
+	import_parser.add_argument('--registrations',
+					help="CSV or JSONL file of registrations (user_id, event_id, status).")
+	import_parser.add_argument('--rejects',
+					default='import_rejects.jsonl',
+					help="JSONL file that rejected rows are appended to.")
+	import_parser.add_argument('--workers',
+					type=int,
+					help="Number of validation worker processes (default: CPU count).")
+	import_parser.add_argument('--chunk-size',
+					type=int,
+					help="Rows per validation chunk and write transaction (default: database.batch_size).")
+	migrate_parser = subparsers.add_parser('migrate',
+					help="Apply pending schema migrations (database/db_version_<N>) to the configured database.")
+	migrate_parser.add_argument('--target',
+					type=int,
+					help="Stop after this schema version (default: the latest).")
+	migrate_parser.add_argument('--check',
+					action='store_true',
+					help="EXPLAIN the hot queries afterwards and exit non-zero if any scans a whole table or index.")
 	args = parser.parse_args()
+	if args.command == 'import' and not (args.users or args.events or args.registrations):
+		import_parser.error("at least one of --users, --events or --registrations is required")
 	return args
 
 
+def run_import(config:dict, args, profile:StartupProfile)->None:
+	"""Import the given files, users first so events and registrations can reference them."""
+	with profile.stage('import import services'):
+		from volunteer_event_coordination.service_layer.import_services import ImportServices
+	with profile.stage('create import services'):
+		importer = ImportServices(config)
+	profile.report()
+	if args.users:
+		print(importer.import_users(args.users, args.rejects, args.workers, args.chunk_size))
+	if args.events:
+		print(importer.import_events(args.events, args.rejects, args.workers, args.chunk_size))
+	if args.registrations:
+		print(importer.import_registrations(args.registrations, args.rejects, args.workers, args.chunk_size))
+
+
+
+def run_migrate(config:dict, args)->int:
+	"""Migrate the schema and optionally check the hot query plans; return the exit status."""
+	from volunteer_event_coordination.persistence_layer.storage_backend import create_storage_backend
+
+	db = create_storage_backend(config)
+	try:
+		before = db.get_schema_version()
+		if before is None:
+			print('Could not read the schema version; see the log for details.', file=sys.stderr)
+			return 1
+		applied = db.migrate(args.target)
+		after = db.get_schema_version()
+		print(f'Schema version {before} -> {after}' + (f' (applied {", ".join(map(str, applied))})' if applied else ''))
+		if args.target is not None and after is not None and after < args.target:
+			print(f'Migration stopped before version {args.target}; see the log for details.', file=sys.stderr)
+			return 1
+		if args.check:
+			problems = db.check_query_plans()
+			if problems is None:
+				print('Could not explain the hot queries; see the log for details.', file=sys.stderr)
+				return 1
+			for name, scans in problems.items():
+				print(f'{name}: {"; ".join(scans)}', file=sys.stderr)
+			print('Query plan check ' + ('failed' if problems else 'passed'))
+			return 1 if problems else 0
+		return 0
+	finally:
+		db.close()
+
 
 if __name__ == "__main__":
 	main()
\ No newline at end of file
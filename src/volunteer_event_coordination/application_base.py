@@ -9,7 +9,7 @@ class ApplicationBase(ABC):
     
     def __init__(self, subclass_name:str, logfile_prefix_name:str)->None:
         """Instantiate instance."""
-        self._settings = Settings().read_settings_file_from_location()
+        self._settings = Settings.current()
         self._logger = LoggingService(subclass_name, logfile_prefix_name)
         
        
@@ -0,0 +1,24 @@
+import json
+from typing import List, Tuple
+
+class BatchResult:
+    """ Implements the outcome of a batched write """
+
+    def __init__(self):
+        self.ids:List[int] = []
+        self.succeeded = 0
+        self.failures:List[Tuple[int, str]] = []
+
+    def __str__(self)-> str:
+        return self.to_json()
+    
+    def __repr__(self)-> str:
+        return self.to_json()
+    
+    def to_json(self)-> str:
+        supplier_dict = {}
+        supplier_dict["ids"] = self.ids
+        supplier_dict["succeeded"] = self.succeeded
+        supplier_dict["failures"] = self.failures
+
+        return json.dumps(supplier_dict)
\ No newline at end of file
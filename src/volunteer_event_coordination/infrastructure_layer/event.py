@@ -1,8 +1,10 @@
-import json
+from volunteer_event_coordination.infrastructure_layer.serialization import dumps
 
 class Event:
     """ Implements a Event entity """
 
+    __slots__ = ('id', 'title', 'description', 'location', 'starts_at', 'ends_at', 'capacity', 'created_by', 'created_at', 'registration_status')
+
     def __init__(self):
         self.id = 0
         self.title = ""
@@ -13,6 +15,7 @@ class Event:
         self.capacity = 0
         self.created_by = 0
         self.created_at = ""
+        self.registration_status = ""
 
     def __str__(self)-> str:
         return self.to_json()
@@ -21,6 +24,9 @@ class Event:
         return self.to_json()
     
     def to_json(self)-> str:
+        return dumps(self.to_dict())
+
+    def to_dict(self)-> dict:
         supplier_dict = {}
         supplier_dict["id"] = self.id
         supplier_dict["title"] = self.title
@@ -31,5 +37,6 @@ class Event:
         supplier_dict["capacity"] = self.capacity
         supplier_dict["created_by"] = self.created_by
         supplier_dict["created_at"] = self.created_at
+        supplier_dict["registration_status"] = self.registration_status
 
-        return json.dumps(supplier_dict)
\ No newline at end of file
+        return supplier_dict
\ No newline at end of file
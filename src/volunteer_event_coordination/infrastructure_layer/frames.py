@@ -0,0 +1,198 @@
+"""Columnar, NumPy-backed event and registration result sets for analytics."""
+
+import numpy as np
+from typing import Iterable, Tuple
+
+# volunteer_shift_xref.status enum, in create_tables.sql order
+REGISTRATION_STATUS_CODES = {'registered': 0, 'waitlist': 1, 'cancelled': 2}
+
+
+class EventFrame:
+    """ Implements a columnar set of events, sorted by id.
+
+    Columns: id (int64), starts_at and ends_at (datetime64[s]), capacity (int64)
+    and created_by (int64, 0 where the creator was deleted).
+    """
+
+    __slots__ = ('id', 'starts_at', 'ends_at', 'capacity', 'created_by', '_lookup')
+
+    def __init__(self, id:np.ndarray, starts_at:np.ndarray, ends_at:np.ndarray, capacity:np.ndarray, created_by:np.ndarray):
+        order = np.argsort(id, kind='stable')
+        self.id = np.asarray(id, dtype=np.int64)[order]
+        self.starts_at = np.asarray(starts_at, dtype='datetime64[s]')[order]
+        self.ends_at = np.asarray(ends_at, dtype='datetime64[s]')[order]
+        self.capacity = np.asarray(capacity, dtype=np.int64)[order]
+        self.created_by = np.asarray(created_by, dtype=np.int64)[order]
+        self._lookup = None
+
+    @classmethod
+    def from_rows(cls, rows:Iterable[Tuple])->'EventFrame':
+        """ Build from (id, starts_at, ends_at, capacity, created_by) rows. """
+        rows = list(rows)
+        if not rows:
+            return cls([], [], [], [], [])
+        ids, starts_at, ends_at, capacity, created_by = zip(*rows)
+        return cls(np.fromiter(ids, dtype=np.int64, count=len(rows)),
+                   np.array(starts_at, dtype='datetime64[s]'),
+                   np.array(ends_at, dtype='datetime64[s]'),
+                   np.fromiter((c or 0 for c in capacity), dtype=np.int64, count=len(rows)),
+                   np.fromiter((c or 0 for c in created_by), dtype=np.int64, count=len(rows)))
+
+    def __len__(self)-> int:
+        return len(self.id)
+
+    def durations_hours(self)-> np.ndarray:
+        """ Length of each event in hours. """
+        return (self.ends_at - self.starts_at).astype(np.int64) / 3600.0
+
+    def positions(self, event_ids:np.ndarray)-> np.ndarray:
+        """ Row position of each event id in this frame, or -1 for ids not in the frame. """
+        if len(self.id) == 0:
+            return np.full(len(event_ids), -1, dtype=np.int64)
+        lookup = self._dense_lookup()
+        if lookup is not None:
+            offsets = event_ids - self.id[0]
+            in_range = (offsets >= 0) & (offsets < len(lookup))
+            return np.where(in_range, lookup[np.where(in_range, offsets, 0)], -1)
+        positions = np.minimum(np.searchsorted(self.id, event_ids), len(self.id) - 1)
+        return np.where(self.id[positions] == event_ids, positions, -1)
+
+    def _dense_lookup(self)-> np.ndarray:
+        """ Table from (id - min id) to row position, built when ids are dense enough.
+        Gathering from it is far cheaper than a binary search per registration.
+        """
+        if self._lookup is None:
+            span = int(self.id[-1] - self.id[0]) + 1
+            if span > 4 * len(self.id):
+                return None
+            self._lookup = np.full(span, -1, dtype=np.int64)
+            self._lookup[self.id - self.id[0]] = np.arange(len(self.id))
+        return self._lookup
+
+    def registration_counts(self, registrations:'RegistrationFrame', status:str='registered')-> np.ndarray:
+        """ Number of registrations with the given status for each event (None counts every status). """
+        event_ids = registrations.event_id if status is None else registrations.event_id[registrations.status == REGISTRATION_STATUS_CODES[status]]
+        positions = self.positions(event_ids)
+        return np.bincount(positions[positions >= 0], minlength=len(self.id))
+
+    def fill_rate(self, registrations:'RegistrationFrame', status:str='registered')-> np.ndarray:
+        """ Registrations divided by capacity for each event; NaN where capacity is 0. """
+        counts = self.registration_counts(registrations, status).astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.capacity > 0, counts / self.capacity, np.nan)
+
+    def events_per_bucket(self, bucket:str='D')-> Tuple[np.ndarray, np.ndarray]:
+        """ Count events by start time bucket ('h', 'D', 'W', 'M' or 'Y'); returns (bucket starts, counts). """
+        return np.unique(self.starts_at.astype(f'datetime64[{bucket}]'), return_counts=True)
+
+    def volunteer_hours(self, registrations:'RegistrationFrame', status:str='registered')-> float:
+        """ Total event hours summed over every registration with the given status. """
+        return float(np.dot(self.registration_counts(registrations, status), self.durations_hours()))
+
+    def schedule_conflicts(self, registrations:'RegistrationFrame', status:str='registered')-> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ Every pair of overlapping events a volunteer is registered to with the given status.
+
+        Returns (user_id, event_id, other_event_id) arrays, one entry per pair, where
+        event_id starts no later than other_event_id. A sweep over the registrations
+        sorted by (user, start): each one overlaps exactly the later ones of the same
+        user that start before it ends, found with one binary search, so the cost is
+        O(n log n) plus the number of pairs.
+        """
+        user_ids, event_ids = registrations.user_id, registrations.event_id
+        if status is not None:
+            selected = registrations.status == REGISTRATION_STATUS_CODES[status]
+            user_ids, event_ids = user_ids[selected], event_ids[selected]
+        positions = self.positions(event_ids)
+        user_ids, positions = user_ids[positions >= 0], positions[positions >= 0]
+        starts = self.starts_at[positions].astype(np.int64)
+        ends = self.ends_at[positions].astype(np.int64)
+        # Zero-length events overlap nothing
+        user_ids, positions, starts, ends = (column[ends > starts] for column in (user_ids, positions, starts, ends))
+        if len(positions) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+
+        # One sort key orders by user, then start: user rank * span + seconds since the earliest start
+        _, user_codes = np.unique(user_ids, return_inverse=True)
+        origin = starts.min()
+        span = int(ends.max() - origin) + 1
+        start_keys = user_codes.astype(np.int64) * span + (starts - origin)
+        order = np.argsort(start_keys, kind='stable')
+        start_keys = start_keys[order]
+        end_keys = (user_codes.astype(np.int64) * span + (ends - origin))[order]
+        # Registrations i+1 .. stops[i]-1 start before i ends
+        stops = np.searchsorted(start_keys, end_keys, side='left')
+        counts = stops - np.arange(len(order)) - 1
+        first = np.repeat(np.arange(len(order)), counts)
+        second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(counts) - counts, counts)
+        sorted_user_ids = user_ids[order]
+        sorted_event_ids = self.id[positions[order]]
+        return sorted_user_ids[first], sorted_event_ids[first], sorted_event_ids[second]
+
+    def new_registration_conflicts(self, registrations:'RegistrationFrame', user_ids:np.ndarray, event_ids:np.ndarray)-> dict:
+        """ Check new 'registered' registrations, in order, against the registered ones already in registrations.
+
+        Returns {position in user_ids: id of the first event it overlaps} for each new
+        registration that overlaps one of the user's registered events or an earlier new
+        registration that did not itself conflict. New registrations for events outside
+        the frame are not checked.
+        """
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        positions = self.positions(np.asarray(event_ids, dtype=np.int64))
+        selected = (registrations.status == REGISTRATION_STATUS_CODES['registered']) & np.isin(registrations.user_id, user_ids)
+        booked = {}
+        for user_id, position in zip(registrations.user_id[selected].tolist(), self.positions(registrations.event_id[selected]).tolist()):
+            if position >= 0:
+                booked.setdefault(user_id, []).append(position)
+
+        starts = self.starts_at.astype(np.int64).tolist()
+        ends = self.ends_at.astype(np.int64).tolist()
+        conflicts = {}
+        for index, (user_id, position) in enumerate(zip(user_ids.tolist(), positions.tolist())):
+            # Zero-length events overlap nothing
+            if position < 0 or ends[position] <= starts[position]:
+                continue
+            taken = booked.setdefault(user_id, [])
+            clash = next((other for other in taken if other != position and ends[other] > starts[other]
+                          and starts[other] < ends[position] and ends[other] > starts[position]), None)
+            if clash is None:
+                taken.append(position)
+            else:
+                conflicts[index] = int(self.id[clash])
+        return conflicts
+
+
+class RegistrationFrame:
+    """ Implements a columnar set of volunteer registrations.
+
+    Columns: id, event_id and user_id (int64) and status (int8 codes, see
+    REGISTRATION_STATUS_CODES).
+    """
+
+    __slots__ = ('id', 'event_id', 'user_id', 'status')
+
+    def __init__(self, id:np.ndarray, event_id:np.ndarray, user_id:np.ndarray, status:np.ndarray):
+        self.id = np.asarray(id, dtype=np.int64)
+        self.event_id = np.asarray(event_id, dtype=np.int64)
+        self.user_id = np.asarray(user_id, dtype=np.int64)
+        self.status = np.asarray(status, dtype=np.int8)
+
+    @classmethod
+    def from_rows(cls, rows:Iterable[Tuple])->'RegistrationFrame':
+        """ Build from (id, event_id, user_id, status) rows. """
+        rows = list(rows)
+        if not rows:
+            return cls([], [], [], [])
+        ids, event_ids, user_ids, statuses = zip(*rows)
+        return cls(np.fromiter(ids, dtype=np.int64, count=len(rows)),
+                   np.fromiter(event_ids, dtype=np.int64, count=len(rows)),
+                   np.fromiter(user_ids, dtype=np.int64, count=len(rows)),
+                   np.fromiter((REGISTRATION_STATUS_CODES[s] for s in statuses), dtype=np.int8, count=len(rows)))
+
+    def __len__(self)-> int:
+        return len(self.id)
+
+    def status_counts(self)-> dict:
+        """ Number of registrations per status name. """
+        counts = np.bincount(self.status, minlength=len(REGISTRATION_STATUS_CODES))
+        return {name: int(counts[code]) for name, code in REGISTRATION_STATUS_CODES.items()}
@@ -0,0 +1,35 @@
+import json
+
+class ImportReport:
+    """ Implements the summary of a file import """
+
+    def __init__(self):
+        self.entity = ""
+        self.path = ""
+        self.rows_read = 0
+        self.rows_imported = 0
+        self.rows_rejected = 0
+        self.elapsed_seconds = 0.0
+
+    def rows_per_second(self)-> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows_read / self.elapsed_seconds
+
+    def __str__(self)-> str:
+        return self.to_json()
+    
+    def __repr__(self)-> str:
+        return self.to_json()
+    
+    def to_json(self)-> str:
+        supplier_dict = {}
+        supplier_dict["entity"] = self.entity
+        supplier_dict["path"] = self.path
+        supplier_dict["rows_read"] = self.rows_read
+        supplier_dict["rows_imported"] = self.rows_imported
+        supplier_dict["rows_rejected"] = self.rows_rejected
+        supplier_dict["elapsed_seconds"] = self.elapsed_seconds
+        supplier_dict["rows_per_second"] = self.rows_per_second()
+
+        return json.dumps(supplier_dict)
\ No newline at end of file
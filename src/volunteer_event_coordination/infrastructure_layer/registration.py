@@ -0,0 +1,32 @@
+from volunteer_event_coordination.infrastructure_layer.serialization import dumps
+
+class Registration:
+    """ Implements a Registration entity """
+
+    __slots__ = ('id', 'event_id', 'user_id', 'status', 'registered_at')
+
+    def __init__(self):
+        self.id = 0
+        self.event_id = 0
+        self.user_id = 0
+        self.status = ""
+        self.registered_at = ""
+
+    def __str__(self)-> str:
+        return self.to_json()
+    
+    def __repr__(self)-> str:
+        return self.to_json()
+    
+    def to_json(self)-> str:
+        return dumps(self.to_dict())
+
+    def to_dict(self)-> dict:
+        supplier_dict = {}
+        supplier_dict["id"] = self.id
+        supplier_dict["event_id"] = self.event_id
+        supplier_dict["user_id"] = self.user_id
+        supplier_dict["status"] = self.status
+        supplier_dict["registered_at"] = self.registered_at
+
+        return supplier_dict
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""Bulk JSON serialization for User, Event and Registration entities.
+
+Uses orjson when it is installed and falls back to the standard library json
+module otherwise. Both encoders write datetime values as ISO 8601 strings.
+Output functions take binary file objects (open(path, 'wb'), sys.stdout.buffer).
+"""
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from itertools import islice
+from typing import Any, BinaryIO, Iterable
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Entities serialized per encoder call when streaming
+CHUNK_SIZE = 1000
+
+
+def _default(value:Any)-> Any:
+    """ Encode the non-JSON types that MySQL rows contain. """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8')
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+if orjson is not None:
+    ENCODER = 'orjson'
+
+    def dumps_bytes(value:Any)-> bytes:
+        """ Encode a JSON-compatible value (plus datetimes) to UTF-8 bytes. """
+        return orjson.dumps(value, default=_default)
+else:
+    ENCODER = 'json'
+    _encoder = json.JSONEncoder(default=_default, ensure_ascii=False, separators=(',', ':'))
+
+    def dumps_bytes(value:Any)-> bytes:
+        """ Encode a JSON-compatible value (plus datetimes) to UTF-8 bytes. """
+        return _encoder.encode(value).encode('utf-8')
+
+
+def dumps(value:Any)-> str:
+    """ Encode a JSON-compatible value (plus datetimes) to a str. """
+    return dumps_bytes(value).decode('utf-8')
+
+
+def _chunks(entities:Iterable)-> Iterable[list]:
+    """ Convert entities to dicts, CHUNK_SIZE at a time. """
+    entities = iter(entities)
+    while True:
+        chunk = [entity.to_dict() for entity in islice(entities, CHUNK_SIZE)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def dump_json_array(entities:Iterable, fp:BinaryIO)-> int:
+    """ Stream entities to fp as one JSON array; returns the number written. """
+    count = 0
+    fp.write(b'[')
+    for chunk in _chunks(entities):
+        if count:
+            fp.write(b',')
+        # Encode the whole chunk in one call and drop its surrounding brackets
+        fp.write(dumps_bytes(chunk)[1:-1])
+        count += len(chunk)
+    fp.write(b']')
+    return count
+
+
+def dump_jsonl(entities:Iterable, fp:BinaryIO)-> int:
+    """ Stream entities to fp as JSON Lines; returns the number written. """
+    count = 0
+    for chunk in _chunks(entities):
+        fp.write(b'\n'.join([dumps_bytes(item) for item in chunk]))
+        fp.write(b'\n')
+        count += len(chunk)
+    return count
@@ -1,10 +1,12 @@
-import json
+from volunteer_event_coordination.infrastructure_layer.serialization import dumps
 from volunteer_event_coordination.infrastructure_layer.event import Event
-from typing import List
+from typing import Callable, List
 
 class User:
     """ Implements a User entity """
 
+    __slots__ = ('id', 'full_name', 'email', 'phone', 'role', 'created_at', '_events', '_events_loader')
+
     def __init__(self):
         self.id = 0
         self.full_name = ""
@@ -12,7 +14,30 @@ class User:
         self.phone = ""
         self.role = ""
         self.created_at = ""
-        self.events:List[Event] = []
+        self._events:List[Event] = []
+        self._events_loader:Callable[[int], List[Event]] = None
+
+    @property
+    def events(self)-> List[Event]:
+        """ Registered events, loaded through the deferred loader on first access. """
+        if self._events is None:
+            self._events = self._events_loader(self.id)
+            self._events_loader = None
+        return self._events
+
+    @events.setter
+    def events(self, events:List[Event])-> None:
+        self._events = events
+        self._events_loader = None
+
+    @property
+    def events_loaded(self)-> bool:
+        return self._events is not None
+
+    def defer_events(self, loader:Callable[[int], List[Event]])-> None:
+        """ Load events with loader(user_id) the first time they are accessed. """
+        self._events = None
+        self._events_loader = loader
 
     def __str__(self)-> str:
         return self.to_json()
@@ -21,6 +46,10 @@ class User:
         return self.to_json()
     
     def to_json(self)-> str:
+        return dumps(self.to_dict())
+
+    def to_dict(self)-> dict:
+        """ Plain dict of the user; deferred events are left out rather than loaded. """
         supplier_dict = {}
         supplier_dict["id"] = self.id
         supplier_dict["full_name"] = self.full_name
@@ -28,9 +57,7 @@ class User:
         supplier_dict["phone"] = self.phone
         supplier_dict["role"] = self.role
         supplier_dict["created_at"] = self.created_at
-        supplier_dict["events"] = []
-
-        for event in self.events:
-            supplier_dict["events"].append(event.__dict__)
+        if self.events_loaded:
+            supplier_dict["events"] = [event.to_dict() for event in self._events]
         
-        return json.dumps(supplier_dict)
\ No newline at end of file
+        return supplier_dict
\ No newline at end of file
@@ -1,83 +1,160 @@
 """Provides LoggingService convenience class for application logging."""
 
+import atexit
 import logging
 import logging.handlers
+from queue import SimpleQueue
+from threading import Lock
+from typing import Callable, Hashable, List, Mapping
 from volunteer_event_coordination.settings import Settings
 import os
 
+LOG_LEVELS = {
+    'notset': logging.NOTSET,
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+}
+
+# The caller's function name comes from the record (stacklevel), not from the message
+LOG_FORMAT = '%(levelname)s:%(name)s:%(asctime)s:%(funcName)s: %(message)s'
+
+_listeners = {}
+_listeners_lock = Lock()
+# Logger name -> path of the settings file LoggingService configured it from; its level follows log_level there
+_service_loggers = {}
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queues records unformatted; the listener thread merges msg and args.
+
+    Arguments are formatted after the call returns, so pass values that are not
+    mutated afterwards (IDs, counts, exceptions, strings).
+    """
+
+    def prepare(self, record:logging.LogRecord)->logging.LogRecord:
+        return record
+
+
+def queue_handler(key:Hashable, make_handlers:Callable[[], List[logging.Handler]])->DeferredQueueHandler:
+    """Returns a handler that feeds the background writer thread for key.
+
+    The first call for a key builds the real handlers with make_handlers() and
+    starts a QueueListener that writes to them; later calls share it.
+    """
+    with _listeners_lock:
+        listener = _listeners.get(key)
+        if listener is None:
+            listener = logging.handlers.QueueListener(SimpleQueue(), *make_handlers(), respect_handler_level=True)
+            listener.start()
+            _listeners[key] = listener
+    return DeferredQueueHandler(listener.queue)
+
+
+def stop_listeners()->None:
+    """Writes out the queued records and stops the writer threads."""
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+    for listener in listeners:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(stop_listeners)
+
+
+def _apply_log_level(path:str, settings:Mapping)->None:
+    """Set the level of the loggers configured from the settings file at path."""
+    level = LOG_LEVELS.get(settings['log_level'], logging.ERROR)
+    for name, settings_path in list(_service_loggers.items()):
+        if settings_path == path:
+            logging.getLogger(name).setLevel(level)
+
+
+Settings.on_change(_apply_log_level)
+
+
 class LoggingService():
-    """Provides logging services."""
+    """Provides logging services.
+
+    Records are handed to a queue and written by a background thread. Messages
+    use %-style arguments, which are only formatted when the level is enabled:
+
+        self._logger.log_debug('Retrieving user id %s from database.', user_id)
+    """
 
     def __init__(self, class_name:str, logfile_prefix_name:str=None)->None:
         """Initialize instance."""
-        
+
         self._logger = logging.getLogger(class_name)
         self._logger.propagate = False
-        self._settings_dict = Settings().read_settings_file_from_location()
+        self._settings_path = Settings.path()
+        self._settings_dict = Settings.current(self._settings_path)
         self._logfile_prefix_name = logfile_prefix_name
-        self.log_level = logging.ERROR
-        
-        if self._settings_dict['log_level'] == 'notset':
-            self._logger.setLevel(logging.NOTSET)
-            self.log_level = logging.NOTSET
-        elif self._settings_dict['log_level'] == 'debug':
-            self._logger.setLevel(logging.DEBUG)
-            self.log_level = logging.debug
-        elif self._settings_dict['log_level'] == 'info':
-            self._logger.setLevel(logging.INFO)
-            self.log_level = logging.INFO
-        elif self._settings_dict['log_level'] == 'warning':
-            self._logger.setLevel(logging.WARNING)
-            self.log_level = logging.WARNING
-        elif self._settings_dict['log_level'] == 'error':
-            self._logger.setLevel(logging.ERROR)
-            self.log_level = logging.ERROR
-        elif self._settings_dict['log_level'] == 'critical':
-            self._logger.setLevel(logging.CRITICAL)
-            self.log_level = logging.CRITICAL
-        else:
-            self._logger.setLevel(logging.ERROR)
-            self.log_level = logging.ERROR
-
-        self._formatter = \
-                logging.Formatter('%(levelname)s:%(name)s:%(asctime)s:%(message)s')
+        self._logger.setLevel(LOG_LEVELS.get(self._settings_dict['log_level'], logging.ERROR))
+        _service_loggers[class_name] = self._settings_path
 
-        if not self._logger.handlers:
-            if self._settings_dict['log_to_console']:
-                self._ch = logging.StreamHandler()
-                self._ch.setLevel(logging.DEBUG)
-                self._ch.setFormatter(self._formatter)
-                self._logger.addHandler(self._ch)
+        self._formatter = logging.Formatter(LOG_FORMAT)
 
+        if not self._logger.handlers:
+            log_file = None
             if self._settings_dict['log_to_file']:
-                log_file = os.path.join(self._settings_dict['logs_dir'], 
+                log_file = os.path.join(self._settings_dict['logs_dir'],
                             f"{self._logfile_prefix_name}_" \
                             f"{self._settings_dict['log_filename']}")
-                self._fh = logging.handlers.TimedRotatingFileHandler(log_file, 
-                            when='midnight', backupCount=20)
-                self._fh.setLevel(logging.DEBUG)
-                self._fh.setFormatter(self._formatter)
-                self._logger.addHandler(self._fh)
-        
-
-    
-    def log_debug(self, message):
+            if self._settings_dict['log_to_console'] or log_file:
+                self._logger.addHandler(queue_handler(
+                    (self._settings_dict['log_to_console'], log_file),
+                    lambda: self._make_handlers(log_file)))
+
+    @property
+    def log_level(self)->int:
+        """The current level; follows log_level in the settings when they are reloaded."""
+        return self._logger.level
+
+    def is_enabled_for(self, level:int)->bool:
+        """Return True if messages at level are logged; guards costly argument building."""
+        return self._logger.isEnabledFor(level)
+
+    def log_debug(self, message, *args):
         """Log to debug."""
-        self._logger.debug(message)
+        self._logger.debug(message, *args, stacklevel=2)
 
-    def log_error(self, message):
+    def log_error(self, message, *args):
         """Log to error."""
-        self._logger.error(message)
+        self._logger.error(message, *args, stacklevel=2)
 
-    def log_info(self, message):
+    def log_info(self, message, *args):
         """Log to info."""
-        self._logger.info(message)
+        self._logger.info(message, *args, stacklevel=2)
 
-    def log_warning(self, message):
+    def log_warning(self, message, *args):
         """Log to warning."""
-        self._logger.warning(message)
+        self._logger.warning(message, *args, stacklevel=2)
 
-    def log_critical(self, message):
+    def log_critical(self, message, *args):
         """Log to critical."""
-        self._logger.critical(message)
+        self._logger.critical(message, *args, stacklevel=2)
+
+    ##### Private Utility Methods #####
+
+    def _make_handlers(self, log_file:str)->List[logging.Handler]:
+        """Build the handlers the writer thread writes to."""
+        handlers = []
+        if self._settings_dict['log_to_console']:
+            self._ch = logging.StreamHandler()
+            self._ch.setLevel(logging.DEBUG)
+            self._ch.setFormatter(self._formatter)
+            handlers.append(self._ch)
 
+        if log_file:
+            self._fh = logging.handlers.TimedRotatingFileHandler(log_file,
+                        when='midnight', backupCount=20)
+            self._fh.setLevel(logging.DEBUG)
+            self._fh.setFormatter(self._formatter)
+            handlers.append(self._fh)
+        return handlers
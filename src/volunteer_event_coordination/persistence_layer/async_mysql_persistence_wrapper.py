@@ -0,0 +1,267 @@
+"""Defines the AsyncMySQLPersistenceWrapper class."""
+
+from volunteer_event_coordination.application_base import ApplicationBase
+from volunteer_event_coordination.persistence_layer.storage_backend import StorageBackend, create_storage_backend
+from volunteer_event_coordination.infrastructure_layer.user import User
+from volunteer_event_coordination.infrastructure_layer.event import Event
+from volunteer_event_coordination.infrastructure_layer.registration import Registration
+from volunteer_event_coordination.infrastructure_layer.batch_result import BatchResult
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from datetime import datetime
+from typing import AsyncIterator, Callable, Iterator, List, Tuple
+import asyncio
+
+async def run_in_executor(executor:Executor, function:Callable, *args):
+	"""Runs a synchronous callable on executor and awaits its result."""
+	loop = asyncio.get_running_loop()
+	return await loop.run_in_executor(executor, partial(function, *args))
+
+async def iterate_in_executor(executor:Executor, iterator:Iterator, page_size:int)->AsyncIterator:
+	"""Drains a synchronous iterator on executor one page at a time, so the event loop never blocks on a fetch."""
+	while True:
+		page = await run_in_executor(executor, lambda: list(islice(iterator, page_size)))
+		for item in page:
+			yield item
+		if len(page) < page_size:
+			return
+
+class AsyncMySQLPersistenceWrapper(ApplicationBase):
+	"""Implements the AsyncMySQLPersistenceWrapper class.
+
+	Exposes the StorageBackend method surface (MySQL or SQLite) as coroutines. Each call runs
+	the synchronous method on a bounded thread pool sized to the connection pool, so
+	an event loop can keep hundreds of calls in flight while at most pool-size of
+	them hold a connection. Users are returned with lazily loaded events unless
+	prefetch_events=True; touching User.events on the event loop would block it.
+	"""
+
+	def __init__(self, config:dict, db:StorageBackend=None, executor:ThreadPoolExecutor=None)->None:
+		"""Initializes object. """
+		self._config_dict = config
+		self.META = config["meta"]
+		self.DATABASE = config["database"]
+		super().__init__(subclass_name=self.__class__.__name__,
+				   logfile_prefix_name=self.META["log_prefix"])
+		self._owns_db = db is None
+		self.DB = db or create_storage_backend(config)
+		self._owns_executor = executor is None
+		self._executor = executor or ThreadPoolExecutor(
+			max_workers=self.DATABASE.get("async_max_workers", self.DATABASE["pool"].get("max_size", self.DATABASE["pool"]["size"])),
+			thread_name_prefix=self.__class__.__name__)
+		self._logger.log_debug('It works!')
+
+	# AsyncMySQLPersistenceWrapper Methods
+	async def select_all_users(self, prefetch_events:bool=False)->List[User]:
+		"""Selects all users from the database.
+		With prefetch_events the users' events are loaded in the same query,
+		otherwise each user's events are loaded on first access.
+		"""
+		return await self._run(self.DB.select_all_users, prefetch_events)
+
+	async def select_all_events(self)->List[Event]:
+		"""Selects all events from the database."""
+		return await self._run(self.DB.select_all_events)
+
+	async def select_user_by_id(self, user_id:int, prefetch_events:bool=False)->User:
+		"""Selects a user by ID from the database.
+		Without prefetch_events the user's events are loaded on first access.
+		"""
+		return await self._run(self.DB.select_user_by_id, user_id, prefetch_events)
+
+	async def select_users_in(self, user_ids:List[int])->List[User]:
+		"""Selects the users with the given IDs, in ID order, in one IN-list query per batch."""
+		return await self._run(self.DB.select_users_in, user_ids)
+
+	async def select_user_ids(self, role:str=None)->List[int]:
+		"""Selects the IDs of all users, or of the users with the given role, in ID order."""
+		return await self._run(self.DB.select_user_ids, role)
+
+	async def select_event_by_id(self, event_id:int)->Event:
+		"""Selects an event by ID from the database."""
+		return await self._run(self.DB.select_event_by_id, event_id)
+
+	async def select_events_in(self, event_ids:List[int])->List[Event]:
+		"""Selects the events with the given IDs, in ID order, in one IN-list query per batch."""
+		return await self._run(self.DB.select_events_in, event_ids)
+
+	async def select_all_events_for_user_id(self, user_id:int)->List[Event]:
+		"""Selects all events for a given user ID from the database."""
+		return await self._run(self.DB.select_all_events_for_user_id, user_id)
+
+	async def select_conflicting_events(self, user_id:int, event_id:int)->List[Event]:
+		"""Selects the events a user is registered to whose time overlaps the given event, by start time."""
+		return await self._run(self.DB.select_conflicting_events, user_id, event_id)
+
+	async def iter_users(self, page_size:int=None, prefetch_events:bool=False)->AsyncIterator[User]:
+		"""Yields all users, one keyset page at a time.
+		With prefetch_events each page's events are loaded in the same query.
+		"""
+		async for user in self._iterate(self.DB.iter_users(page_size, prefetch_events), page_size):
+			yield user
+
+	async def iter_events(self, page_size:int=None)->AsyncIterator[Event]:
+		"""Yields all events, one keyset page at a time."""
+		async for event in self._iterate(self.DB.iter_events(page_size), page_size):
+			yield event
+
+	async def select_events_between(self, starts_from:datetime=None, starts_before:datetime=None, limit:int=None, after:Event=None)->List[Event]:
+		"""Selects one page of the events starting at or after starts_from and before starts_before, by start time then ID.
+		Pass the last event of a page as after to select the next page; a page shorter than limit is the last.
+		"""
+		return await self._run(self.DB.select_events_between, starts_from, starts_before, limit, after)
+
+	async def select_upcoming_events(self, limit:int=None, after:Event=None)->List[Event]:
+		"""Selects one page of the events that have not started yet, soonest first."""
+		return await self._run(self.DB.select_upcoming_events, limit, after)
+
+	async def select_events_by_location(self, location:str, starts_from:datetime=None, starts_before:datetime=None, limit:int=None, after:Event=None)->List[Event]:
+		"""Selects one page of the events at a location, optionally within a start time range, by start time then ID."""
+		return await self._run(self.DB.select_events_by_location, location, starts_from, starts_before, limit, after)
+
+	async def iter_registrations(self, page_size:int=None)->AsyncIterator[Registration]:
+		"""Yields all volunteer registrations, one keyset page at a time."""
+		async for registration in self._iterate(self.DB.iter_registrations(page_size), page_size):
+			yield registration
+
+	async def select_event_frame(self):
+		"""Selects all events into a columnar NumPy-backed EventFrame (requires numpy)."""
+		return await self._run(self.DB.select_event_frame)
+
+	async def select_registration_frame(self):
+		"""Selects all registrations into a columnar NumPy-backed RegistrationFrame (requires numpy)."""
+		return await self._run(self.DB.select_registration_frame)
+
+	async def user_exists(self, user_id:int)->bool:
+		"""Returns True if a user with the given ID exists."""
+		return await self._run(self.DB.user_exists, user_id)
+
+	async def event_exists(self, event_id:int)->bool:
+		"""Returns True if an event with the given ID exists."""
+		return await self._run(self.DB.event_exists, event_id)
+
+	async def validate_user_and_event(self, user_id:int, event_id:int)->Tuple[bool, bool]:
+		"""Returns whether the user and the event exist, using a single query."""
+		return await self._run(self.DB.validate_user_and_event, user_id, event_id)
+
+	async def count_registrations(self, event_id:int, status:str=None)->int:
+		"""Counts the registrations for an event, optionally only those with the given status."""
+		return await self._run(self.DB.count_registrations, event_id, status)
+
+	async def get_schema_version(self)->int:
+		"""Returns the highest applied schema version; a database without migrations is at version 1."""
+		return await self._run(self.DB.get_schema_version)
+
+	async def migrate(self, target_version:int=None)->List[int]:
+		"""Applies the pending migrations in version order, up to target_version, and returns the versions applied.
+		Migrations are forward-only; each is recorded in schema_version once its statements have run, and
+		indexes that already exist are skipped so an interrupted migration can be run again.
+		"""
+		return await self._run(self.DB.migrate, target_version)
+
+	async def check_query_plans(self)->dict:
+		"""Explains each of HOT_QUERIES and returns {statement name: [full scans]} for those that scan a whole table or index.
+		An empty result means every hot query uses an index; None means the check could not run. Run it against representative data:
+		on near-empty tables the optimizer may prefer a scan.
+		"""
+		return await self._run(self.DB.check_query_plans)
+
+	def get_pool_stats(self)->dict:
+		"""Returns the connection pool gauges; reads in-process state only."""
+		return self.DB.get_pool_stats()
+
+	def get_query_stats(self, reset:bool=False)->dict:
+		"""Returns per-statement SQL stats; reads in-process state only."""
+		return self.DB.get_query_stats(reset)
+
+	async def insert_user(self, user:User)->User:
+		"""Inserts a new user into the database."""
+		return await self._run(self.DB.insert_user, user)
+
+	async def insert_event(self, event:Event)->Event:
+		"""Inserts a new event into the database."""
+		return await self._run(self.DB.insert_event, event)
+
+	async def update_user(self, user:User)->bool:
+		"""Updates an existing user in the database."""
+		return await self._run(self.DB.update_user, user)
+
+	async def update_event(self, event:Event)->bool:
+		"""Updates an existing event in the database."""
+		return await self._run(self.DB.update_event, event)
+
+	async def delete_user(self, user_id:int)->bool:
+		"""Deletes a user from the database."""
+		return await self._run(self.DB.delete_user, user_id)
+
+	async def delete_event(self, event_id:int)->bool:
+		"""Deletes an event from the database."""
+		return await self._run(self.DB.delete_event, event_id)
+
+	async def register_user_to_event(self, user_id:int, event_id:int, status:str)->bool:
+		"""Registers a user with an event in the database."""
+		return await self._run(self.DB.register_user_to_event, user_id, event_id, status)
+
+	async def update_user_event_registration_status(self, user_id:int, event_id:int, status:str)->bool:
+		"""Updates the status of a user's registration for an event in the database."""
+		return await self._run(self.DB.update_user_event_registration_status, user_id, event_id, status)
+
+	async def unregister_user_from_event(self, user_id:int, event_id:int)->bool:
+		"""Unregisters a user from an event in the database."""
+		return await self._run(self.DB.unregister_user_from_event, user_id, event_id)
+
+	async def insert_users_many(self, users:List[User])->BatchResult:
+		"""Inserts users in chunked multi-row transactions and sets their generated IDs."""
+		return await self._run(self.DB.insert_users_many, users)
+
+	async def insert_events_many(self, events:List[Event])->BatchResult:
+		"""Inserts events in chunked multi-row transactions and sets their generated IDs."""
+		return await self._run(self.DB.insert_events_many, events)
+
+	async def register_many(self, registrations:List[Registration])->BatchResult:
+		"""Registers users with events in chunked multi-row transactions and sets the generated IDs."""
+		return await self._run(self.DB.register_many, registrations)
+
+	async def update_users_many(self, users:List[User])->BatchResult:
+		"""Updates users in chunked transactions."""
+		return await self._run(self.DB.update_users_many, users)
+
+	async def update_events_many(self, events:List[Event])->BatchResult:
+		"""Updates events in chunked transactions."""
+		return await self._run(self.DB.update_events_many, events)
+
+	async def update_registration_status_many(self, registrations:List[Registration])->BatchResult:
+		"""Updates registration statuses in chunked transactions."""
+		return await self._run(self.DB.update_registration_status_many, registrations)
+
+	async def unregister_many(self, registrations:List[Registration])->BatchResult:
+		"""Unregisters users from events in chunked transactions."""
+		return await self._run(self.DB.unregister_many, registrations)
+
+	async def delete_users_many(self, user_ids:List[int])->BatchResult:
+		"""Deletes users with one IN-list statement per chunk."""
+		return await self._run(self.DB.delete_users_many, user_ids)
+
+	async def delete_events_many(self, event_ids:List[int])->BatchResult:
+		"""Deletes events with one IN-list statement per chunk."""
+		return await self._run(self.DB.delete_events_many, event_ids)
+
+	def close(self)->None:
+		"""Shuts down the thread pool and closes the database connections, each only if this object created it."""
+		if self._owns_executor:
+			self._executor.shutdown(wait=True)
+		if self._owns_db:
+			self.DB.close()
+
+
+
+	##### Private Utility Methods #####
+
+	async def _run(self, function:Callable, *args):
+		"""Runs a synchronous wrapper method on the bounded thread pool."""
+		return await run_in_executor(self._executor, function, *args)
+
+	def _iterate(self, iterator:Iterator, page_size:int=None)->AsyncIterator:
+		"""Drains a synchronous iterator on the thread pool one page at a time."""
+		return iterate_in_executor(self._executor, iterator, page_size or self.DB.PAGE_SIZE)
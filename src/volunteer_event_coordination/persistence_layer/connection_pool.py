@@ -0,0 +1,260 @@
+"""Defines the ElasticConnectionPool class."""
+
+from bisect import bisect_left
+from collections import deque
+from threading import Condition
+from typing import Any, Callable
+import time
+
+class PoolError(Exception):
+	"""Base class of the errors raised when the pool cannot hand out a connection.
+	Callers let these propagate so that an unavailable pool is not mistaken for an empty result.
+	"""
+
+
+class PoolTimeoutError(PoolError):
+	"""Raised when no connection becomes available within the checkout timeout."""
+
+
+class PoolClosedError(PoolError):
+	"""Raised when a connection is requested from a closed pool."""
+
+
+class PooledConnection():
+	"""Proxy for a checked-out connection; closing it (or leaving its with block) returns it to the pool."""
+
+	def __init__(self, pool:'ElasticConnectionPool', raw:Any)->None:
+		self._pool = pool
+		self.raw = raw
+		self.last_used = time.monotonic()
+		# Prepared cursors keyed by SQL text; they live as long as the raw connection
+		self.statements = {}
+		self._checked_out = False
+
+	def __enter__(self)->'PooledConnection':
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback)->None:
+		self.close()
+
+	def close(self)->None:
+		"""Returns the connection to the pool. Safe to call more than once."""
+		if self._checked_out:
+			self._checked_out = False
+			self._pool._release(self)
+
+	def __getattr__(self, name:str)->Any:
+		return getattr(self.raw, name)
+
+
+class ElasticConnectionPool():
+	"""Thread-safe connection pool that grows between min_size and max_size.
+
+	When every connection is in use, get_connection() waits up to timeout_seconds
+	for one to be released instead of failing. Idle connections are validated
+	before reuse once they have been idle longer than validation_interval_seconds,
+	and connections above min_size are closed after max_idle_seconds idle.
+	"""
+
+	# Upper bounds, in milliseconds, of the checkout latency histogram buckets
+	LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000, float('inf'))
+
+	def __init__(self, connect:Callable[[], Any], min_size:int=1, max_size:int=10, timeout_seconds:float=10.0,
+			validation_interval_seconds:float=30.0, max_idle_seconds:float=300.0, reset_session:bool=True,
+			name:str='pool', warm_up:bool=True)->None:
+		"""Initializes object and, when warm_up is set, opens min_size connections."""
+		if min_size < 0 or max_size < 1 or min_size > max_size:
+			raise ValueError(f'Invalid pool size: min_size={min_size}, max_size={max_size}')
+		self.name = name
+		self._connect = connect
+		self.min_size = min_size
+		self.max_size = max_size
+		self.timeout_seconds = timeout_seconds
+		self.validation_interval_seconds = validation_interval_seconds
+		self.max_idle_seconds = max_idle_seconds
+		self.reset_session = reset_session
+		self._idle = deque()
+		self._size = 0
+		self._in_use = 0
+		self._waiters = 0
+		self._condition = Condition()
+		self._closed = False
+		self._checkouts = 0
+		self._timeouts = 0
+		self._created = 0
+		self._discarded = 0
+		self._wait_seconds_total = 0.0
+		self._wait_seconds_max = 0.0
+		self._latency_histogram = [0] * len(self.LATENCY_BUCKETS_MS)
+		if warm_up:
+			self.warm_up()
+
+	def warm_up(self, count:int=None)->None:
+		"""Opens connections until count (default min_size) are pooled."""
+		target = self.min_size if count is None else min(count, self.max_size)
+		while True:
+			with self._condition:
+				if self._size >= target:
+					return
+				self._size += 1
+			try:
+				pooled = PooledConnection(self, self._open())
+			except Exception:
+				with self._condition:
+					self._size -= 1
+					self._condition.notify()
+				raise
+			with self._condition:
+				self._idle.append(pooled)
+				self._condition.notify()
+
+	def get_connection(self, timeout:float=None)->PooledConnection:
+		"""Checks out a connection, waiting up to timeout seconds (default timeout_seconds) for one."""
+		timeout = self.timeout_seconds if timeout is None else timeout
+		started = time.monotonic()
+		deadline = started + timeout
+		while True:
+			pooled = None
+			create = False
+			with self._condition:
+				if self._closed:
+					raise PoolClosedError(f'{self.name}: the pool is closed')
+				while not self._idle and self._size >= self.max_size:
+					remaining = deadline - time.monotonic()
+					if remaining <= 0:
+						self._timeouts += 1
+						raise PoolTimeoutError(
+							f'{self.name}: timed out after {timeout}s waiting for a connection '
+							f'({self._in_use} in use of {self.max_size}, {self._waiters} other waiters)')
+					self._waiters += 1
+					try:
+						self._condition.wait(remaining)
+					finally:
+						self._waiters -= 1
+					if self._closed:
+						raise PoolClosedError(f'{self.name}: the pool was closed while waiting for a connection')
+				if self._idle:
+					pooled = self._idle.pop()
+				else:
+					self._size += 1
+					create = True
+				self._in_use += 1
+
+			try:
+				if create:
+					pooled = PooledConnection(self, self._open())
+				elif not self._is_usable(pooled):
+					self._close_raw(pooled)
+					pooled = PooledConnection(self, self._open())
+			except Exception:
+				with self._condition:
+					self._in_use -= 1
+					self._size -= 1
+					self._condition.notify()
+				raise
+
+			pooled._checked_out = True
+			self._record_checkout(time.monotonic() - started)
+			return pooled
+
+	def stats(self)->dict:
+		"""Returns live gauges and counters."""
+		with self._condition:
+			return {
+				"name": self.name,
+				"size": self._size,
+				"idle": len(self._idle),
+				"in_use": self._in_use,
+				"waiters": self._waiters,
+				"min_size": self.min_size,
+				"max_size": self.max_size,
+				"checkouts": self._checkouts,
+				"timeouts": self._timeouts,
+				"created": self._created,
+				"discarded": self._discarded,
+				"wait_seconds_total": self._wait_seconds_total,
+				"wait_seconds_max": self._wait_seconds_max,
+				"checkout_latency_ms_histogram": {
+					(f'<={bound:g}' if bound != float('inf') else 'inf'): count
+					for bound, count in zip(self.LATENCY_BUCKETS_MS, self._latency_histogram)},
+			}
+
+	def close(self)->None:
+		"""Closes every idle connection. Checked-out connections are closed when released,
+		and later checkouts, including those already waiting, raise PoolClosedError.
+		"""
+		with self._condition:
+			self._closed = True
+			idle = list(self._idle)
+			self._idle.clear()
+			self._size -= len(idle)
+			self._condition.notify_all()
+		for pooled in idle:
+			self._close_raw(pooled)
+
+
+
+	##### Private Utility Methods #####
+
+	def _open(self)->Any:
+		"""Opens a new raw connection."""
+		raw = self._connect()
+		with self._condition:
+			self._created += 1
+		return raw
+
+	def _release(self, pooled:PooledConnection)->None:
+		"""Resets a returned connection and puts it back on the idle stack, or discards it."""
+		try:
+			if getattr(pooled.raw, 'in_transaction', False):
+				pooled.raw.rollback()
+			if self.reset_session:
+				pooled.raw.reset_session()
+			healthy = True
+		except Exception:
+			healthy = False
+		now = time.monotonic()
+		pooled.last_used = now
+		expired = []
+		with self._condition:
+			self._in_use -= 1
+			if healthy and not self._closed and self._size <= self.max_size:
+				self._idle.append(pooled)
+			else:
+				self._size -= 1
+				expired.append(pooled)
+			# Shrink towards min_size: the oldest idle connections sit at the left
+			while (self._size > self.min_size and len(self._idle) > 1
+					and now - self._idle[0].last_used > self.max_idle_seconds):
+				expired.append(self._idle.popleft())
+				self._size -= 1
+			self._condition.notify()
+		for stale in expired:
+			self._close_raw(stale)
+
+	def _is_usable(self, pooled:PooledConnection)->bool:
+		"""Validates a connection that has been idle longer than validation_interval_seconds."""
+		if time.monotonic() - pooled.last_used < self.validation_interval_seconds:
+			return True
+		try:
+			return pooled.raw.is_connected()
+		except Exception:
+			return False
+
+	def _close_raw(self, pooled:PooledConnection)->None:
+		"""Closes the underlying connection, ignoring errors."""
+		with self._condition:
+			self._discarded += 1
+		pooled.statements.clear()
+		try:
+			pooled.raw.close()
+		except Exception:
+			pass
+
+	def _record_checkout(self, wait_seconds:float)->None:
+		"""Updates the wait time counters and checkout latency histogram."""
+		with self._condition:
+			self._checkouts += 1
+			self._wait_seconds_total += wait_seconds
+			self._wait_seconds_max = max(self._wait_seconds_max, wait_seconds)
+			self._latency_histogram[bisect_left(self.LATENCY_BUCKETS_MS, wait_seconds * 1000)] += 1
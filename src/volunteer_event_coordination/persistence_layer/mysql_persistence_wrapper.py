@@ -1,16 +1,36 @@
 """Defines the MySQLPersistenceWrapper class."""
 
 from volunteer_event_coordination.application_base import ApplicationBase
-from mysql import connector
-from mysql.connector.pooling import (MySQLConnectionPool)
-import inspect
+import atexit
 import json
+import os
+import re
+import time
 from enum import Enum
 from volunteer_event_coordination.infrastructure_layer.user import User
 from volunteer_event_coordination.infrastructure_layer.event import Event
-from typing import List
+from volunteer_event_coordination.infrastructure_layer.registration import Registration
+from volunteer_event_coordination.infrastructure_layer.batch_result import BatchResult
+from volunteer_event_coordination.persistence_layer.row_mapper import RowMapper
+from volunteer_event_coordination.persistence_layer.storage_backend import StorageBackend
+from volunteer_event_coordination.persistence_layer.connection_pool import ElasticConnectionPool, PooledConnection, PoolError, PoolTimeoutError
+from volunteer_event_coordination.persistence_layer.query_stats import QueryStats, open_slow_query_log
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List, Tuple
 
-class MySQLPersistenceWrapper(ApplicationBase):
+# database/ at the repository root holds the db_version_<N> directories
+MIGRATIONS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../database'))
+MIGRATION_DIR_PATTERN = re.compile(r'db_version_(\d+)')
+
+# Open bounds of the starts_at range queries: the DATETIME range MySQL accepts
+EARLIEST = datetime(1000, 1, 1)
+LATEST = datetime(9999, 12, 31, 23, 59, 59)
+
+# Duplicate key name, can't DROP (does not exist): an index statement that already ran
+DUPLICATE_SCHEMA_OBJECT_ERRORS = (1061, 1091)
+
+class MySQLPersistenceWrapper(ApplicationBase, StorageBackend):
 	"""Implements the MySQLPersistenceWrapper class."""
 
 	def __init__(self, config:dict)->None:
@@ -20,18 +40,21 @@ class MySQLPersistenceWrapper(ApplicationBase):
 		self.DATABASE = config["database"]
 		super().__init__(subclass_name=self.__class__.__name__, 
 				   logfile_prefix_name=self.META["log_prefix"])
-		self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}:It works!')
+		self._logger.log_debug('It works!')
 
 		# Database Configuration Constants
-		self.DB_CONFIG = {}
-		self.DB_CONFIG['database'] = \
-			self.DATABASE["connection"]["config"]["database"]
-		self.DB_CONFIG['user'] = self.DATABASE["connection"]["config"]["user"]
-		self.DB_CONFIG['password'] = self.DATABASE["connection"]["config"]['password']
-		self.DB_CONFIG['host'] = self.DATABASE["connection"]["config"]["host"]
-		self.DB_CONFIG['port'] = self.DATABASE["connection"]["config"]["port"]
+		self.DB_CONFIG = self._read_connection_config()
+
+		# Number of rows fetched per round trip by the iter_* methods
+		self.PAGE_SIZE = self.DATABASE.get("page_size", 1000)
+
+		# Number of rows written per transaction by the *_many methods
+		self.BATCH_SIZE = self.DATABASE.get("batch_size", 500)
+
+		# Reuse server-side prepared statements for the hot SQL constants
+		self.PREPARED_STATEMENTS = self.DATABASE.get("prepared_statements", False)
 
-		self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}: DB Connection Config Dict: {self.DB_CONFIG}')
+		self._logger.log_debug('DB Connection Config Dict: %s', self.DB_CONFIG)
 
 		# Database Connection
 		self._connection_pool = \
@@ -43,6 +66,20 @@ class MySQLPersistenceWrapper(ApplicationBase):
 
 		self.EventColumns = \
 			Enum('EventColumns',[ ('id', 0), ('title', 1), ('description', 2), ('location', 3), ('starts_at', 4), ('ends_at', 5), ('capacity', 6), ('created_by', 7), ('created_at', 8)])
+
+		self.RegistrationColumns = \
+			Enum('RegistrationColumns',[ ('id', 0), ('event_id', 1), ('user_id', 2), ('status', 3), ('registered_at', 4)])
+
+		self.USER_COLUMN_COUNT = len(self.UserColumns)
+		self.REGISTRATION_STATUS_COLUMN = len(self.EventColumns)
+
+		# Row Mappers (column positions bound once)
+		registration_status = [('registration_status', self.REGISTRATION_STATUS_COLUMN)]
+		self._user_mapper = RowMapper.from_enum(User, self.UserColumns)
+		self._event_mapper = RowMapper.from_enum(Event, self.EventColumns)
+		self._registered_event_mapper = RowMapper.from_enum(Event, self.EventColumns, extra_columns=registration_status)
+		self._joined_event_mapper = RowMapper.from_enum(Event, self.EventColumns, self.USER_COLUMN_COUNT, registration_status)
+		self._registration_mapper = RowMapper.from_enum(Registration, self.RegistrationColumns)
 	
 
 		# SQL String Constants
@@ -59,16 +96,88 @@ class MySQLPersistenceWrapper(ApplicationBase):
 			"FROM users "\
 			"WHERE id = %s;"
 		
+		self.SELECT_USERS_IN = \
+			"SELECT id, full_name, email, phone, role, created_at "\
+			"FROM users "\
+			"WHERE id IN ({}) ORDER BY id;"
+		
+		self.SELECT_USER_IDS = \
+			"SELECT id FROM users ORDER BY id;"
+		
+		self.SELECT_USER_IDS_BY_ROLE = \
+			"SELECT id FROM users WHERE role = %s ORDER BY id;"
+		
 		self.SELECT_EVENT_BY_ID = \
 			"SELECT id, title, description, location, starts_at, ends_at, capacity, created_by, created_at "\
 			"FROM events "\
 			"WHERE id = %s;"
 		
+		self.SELECT_EVENTS_IN = \
+			"SELECT id, title, description, location, starts_at, ends_at, capacity, created_by, created_at "\
+			"FROM events "\
+			"WHERE id IN ({}) ORDER BY id;"
+		
 		self.SELECT_REGISTERED_EVENTS_FOR_USER_ID = \
-			"SELECT e.id, e.title, e.description, e.location, e.starts_at, e.ends_at, e.capacity, e.created_by, e.created_at "\
+			"SELECT e.id, e.title, e.description, e.location, e.starts_at, e.ends_at, e.capacity, e.created_by, e.created_at, x.status "\
 			"FROM events e , volunteer_shift_xref x "\
 			"WHERE e.id = x.event_id AND x.user_id = %s;"
 		
+		# A user's 'registered' events whose [starts_at, ends_at) overlaps the given event's (zero-length
+		# events overlap nothing); registrations are reached through idx_xref_user_event, events by primary key
+		self.SELECT_CONFLICTING_EVENTS_FOR_USER_ID = \
+			"SELECT e.id, e.title, e.description, e.location, e.starts_at, e.ends_at, e.capacity, e.created_by, e.created_at, x.status "\
+			"FROM events t "\
+			"JOIN volunteer_shift_xref x ON x.user_id = %s AND x.event_id <> t.id "\
+			"JOIN events e ON e.id = x.event_id "\
+			"WHERE t.id = %s AND x.status = 'registered' AND e.starts_at < t.ends_at AND e.ends_at > t.starts_at "\
+			"AND e.ends_at > e.starts_at AND t.ends_at > t.starts_at "\
+			"ORDER BY e.starts_at, e.id;"
+		
+		self.SELECT_ALL_USERS_WITH_EVENTS = \
+			"SELECT u.id, u.full_name, u.email, u.phone, u.role, u.created_at, "\
+			"e.id, e.title, e.description, e.location, e.starts_at, e.ends_at, e.capacity, e.created_by, e.created_at, x.status "\
+			"FROM users u "\
+			"LEFT JOIN volunteer_shift_xref x ON x.user_id = u.id "\
+			"LEFT JOIN events e ON e.id = x.event_id "\
+			"ORDER BY u.id;"
+		
+		self.SELECT_USERS_PAGE = \
+			"SELECT id, full_name, email, phone, role, created_at "\
+			"FROM users "\
+			"WHERE id > %s ORDER BY id LIMIT %s;"
+		
+		self.SELECT_USERS_WITH_EVENTS_PAGE = \
+			"SELECT u.id, u.full_name, u.email, u.phone, u.role, u.created_at, "\
+			"e.id, e.title, e.description, e.location, e.starts_at, e.ends_at, e.capacity, e.created_by, e.created_at, x.status "\
+			"FROM (SELECT id, full_name, email, phone, role, created_at "\
+			"FROM users WHERE id > %s ORDER BY id LIMIT %s) u "\
+			"LEFT JOIN volunteer_shift_xref x ON x.user_id = u.id "\
+			"LEFT JOIN events e ON e.id = x.event_id "\
+			"ORDER BY u.id;"
+		
+		self.SELECT_EVENTS_PAGE = \
+			"SELECT id, title, description, location, starts_at, ends_at, capacity, created_by, created_at "\
+			"FROM events "\
+			"WHERE id > %s ORDER BY id LIMIT %s;"
+
+		# Keyset pages in (starts_at, id) order over a starts_at range; the first page passes (start, 0) as the key
+		self.SELECT_EVENTS_BETWEEN_PAGE = \
+			"SELECT id, title, description, location, starts_at, ends_at, capacity, created_by, created_at "\
+			"FROM events "\
+			"WHERE starts_at >= %s AND starts_at < %s AND (starts_at > %s OR id > %s) "\
+			"ORDER BY starts_at, id LIMIT %s;"
+
+		self.SELECT_EVENTS_BY_LOCATION_PAGE = \
+			"SELECT id, title, description, location, starts_at, ends_at, capacity, created_by, created_at "\
+			"FROM events "\
+			"WHERE location = %s AND starts_at >= %s AND starts_at < %s AND (starts_at > %s OR id > %s) "\
+			"ORDER BY starts_at, id LIMIT %s;"
+		
+		self.SELECT_REGISTRATIONS_PAGE = \
+			"SELECT id, event_id, user_id, status, registered_at "\
+			"FROM volunteer_shift_xref "\
+			"WHERE id > %s ORDER BY id LIMIT %s;"
+		
 		self.INSERT_USER = \
 			"INSERT INTO users (full_name, email, phone, role) "\
 			"VALUES (%s, %s, %s, %s);"
@@ -107,30 +216,108 @@ class MySQLPersistenceWrapper(ApplicationBase):
 		self.UNREGISTER_USER_FROM_EVENT = \
 			"DELETE FROM volunteer_shift_xref "\
 			"WHERE user_id = %s AND event_id = %s;"
+		
+		self.SELECT_EVENT_FRAME = \
+			"SELECT id, starts_at, ends_at, capacity, created_by "\
+			"FROM events;"
+		
+		self.SELECT_REGISTRATION_FRAME = \
+			"SELECT id, event_id, user_id, status "\
+			"FROM volunteer_shift_xref;"
+		
+		self.USER_EXISTS = \
+			"SELECT EXISTS(SELECT 1 FROM users WHERE id = %s);"
+		
+		self.EVENT_EXISTS = \
+			"SELECT EXISTS(SELECT 1 FROM events WHERE id = %s);"
+		
+		self.USER_AND_EVENT_EXIST = \
+			"SELECT EXISTS(SELECT 1 FROM users WHERE id = %s), "\
+			"EXISTS(SELECT 1 FROM events WHERE id = %s);"
+		
+		self.COUNT_REGISTRATIONS_FOR_EVENT = \
+			"SELECT COUNT(*) FROM volunteer_shift_xref "\
+			"WHERE event_id = %s;"
+		
+		self.COUNT_REGISTRATIONS_FOR_EVENT_BY_STATUS = \
+			"SELECT COUNT(*) FROM volunteer_shift_xref "\
+			"WHERE event_id = %s AND status = %s;"
+		
+		self.DELETE_USERS_IN = \
+			"DELETE FROM users "\
+			"WHERE id IN ({});"
+		
+		self.DELETE_EVENTS_IN = \
+			"DELETE FROM events "\
+			"WHERE id IN ({});"
+
+		# Schema Migration Constants
+		self.CREATE_SCHEMA_VERSION_TABLE = \
+			"CREATE TABLE IF NOT EXISTS schema_version ("\
+			"version INT NOT NULL PRIMARY KEY, "\
+			"description VARCHAR(200), "\
+			"applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);"
+
+		self.SELECT_SCHEMA_VERSION = \
+			"SELECT MAX(version) FROM schema_version;"
+
+		self.INSERT_SCHEMA_VERSION = \
+			"INSERT INTO schema_version (version, description) "\
+			"VALUES (%s, %s);"
+
+		# Migration scripts: <migrations_dir>/db_version_<N>/<MIGRATION_SCRIPT>, applied in version order
+		self.MIGRATIONS_DIR = self.DATABASE.get("migrations_dir", MIGRATIONS_DIR)
+		self.MIGRATION_SCRIPT = 'migrate.sql'
+
+		# Hot statements and sample parameters for check_query_plans()
+		self.HOT_QUERIES = {
+			'SELECT_USER_BY_ID': (1,),
+			'SELECT_EVENT_BY_ID': (1,),
+			'SELECT_REGISTERED_EVENTS_FOR_USER_ID': (1,),
+			'SELECT_CONFLICTING_EVENTS_FOR_USER_ID': (1, 1),
+			'SELECT_USERS_PAGE': (0, self.PAGE_SIZE),
+			'SELECT_EVENTS_PAGE': (0, self.PAGE_SIZE),
+			'SELECT_REGISTRATIONS_PAGE': (0, self.PAGE_SIZE),
+			'SELECT_EVENTS_BETWEEN_PAGE': (EARLIEST, LATEST, EARLIEST, 0, self.PAGE_SIZE),
+			'SELECT_EVENTS_BY_LOCATION_PAGE': ('City Park', EARLIEST, LATEST, EARLIEST, 0, self.PAGE_SIZE),
+			'USER_AND_EVENT_EXIST': (1, 1),
+			'COUNT_REGISTRATIONS_FOR_EVENT': (1,),
+			'COUNT_REGISTRATIONS_FOR_EVENT_BY_STATUS': (1, 'registered'),
+			'UPDATE_USER_EVENT_STATUS': ('registered', 1, 1),
+			'UNREGISTER_USER_FROM_EVENT': (1, 1),
+		}
+
+		# Statement Timing
+		self._query_stats = self._initialize_query_stats()
 
 
 	# MySQLPersistenceWrapper Methods
-	def select_all_users(self)->List[User]:
-		"""Selects all users from the database."""
+	def select_all_users(self, prefetch_events:bool=False)->List[User]:
+		"""Selects all users from the database.
+		With prefetch_events the users' events are loaded in the same query,
+		otherwise each user's events are loaded on first access.
+		"""
 		cursor = None
 		results = None
-		users_list = []
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
-					cursor.execute(self.SELECT_ALL_USERS)
+				with self._cursor(connection) as cursor:
+					if prefetch_events:
+						cursor.execute(self.SELECT_ALL_USERS_WITH_EVENTS)
+					else:
+						cursor.execute(self.SELECT_ALL_USERS)
 					results = cursor.fetchall()
-				users_list = self._pupulate_user_objects(results)
-			for user in users_list:
-				events_list = self.select_all_events_for_user_id(user.id) or []
-				user.events = self._populate_event_objects(events_list)
-				self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}: Retrieved user')
-
+			if prefetch_events:
+				users_list = self._populate_user_objects_with_events(results)
+			else:
+				users_list = self._populate_lazy_user_objects(results)
+			self._logger.log_debug('Retrieved %s users from %s rows', len(users_list), len(results))
 			return users_list
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem selecting all users: {e}')
+			self._logger.log_error('Problem selecting all users: %s', e)
 			return []
 	
 	def select_all_events(self)->List[Event]:
@@ -138,49 +325,90 @@ class MySQLPersistenceWrapper(ApplicationBase):
 		cursor = None
 		results = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection) as cursor:
 					cursor.execute(self.SELECT_ALL_EVENTS)
 					results = cursor.fetchall()
 			return self._populate_event_objects(results)
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem selecting all events: {e}')
+			self._logger.log_error('Problem selecting all events: %s', e)
 			return []
 		
-	def select_user_by_id(self, user_id:int)->User:
-		"""Selects a user by ID from the database."""
+	def select_user_by_id(self, user_id:int, prefetch_events:bool=False)->User:
+		"""Selects a user by ID from the database.
+		Without prefetch_events the user's events are loaded on first access.
+		"""
 		cursor = None
 		result = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.SELECT_USER_BY_ID) as cursor:
 					cursor.execute(self.SELECT_USER_BY_ID, (user_id,))
 					result = cursor.fetchone()
 			if result:
-				users_list = self._pupulate_user_objects([result])
+				users_list = self._populate_lazy_user_objects([result])
 				if users_list:
 					user = users_list[0]
-					events_list = self.select_all_events_for_user_id(user.id) or []
-					user.events = self._populate_event_objects(events_list)
+					if prefetch_events:
+						user.events = self._load_events_for_user(user.id)
 					return user
 			return None
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem selecting user by ID {user_id}: {e}')
+			self._logger.log_error('Problem selecting user by ID %s: %s', user_id, e)
 			return None
 		
+	def select_users_in(self, user_ids:List[int])->List[User]:
+		"""Selects the users with the given IDs, in ID order, in one IN-list query per batch."""
+		users = []
+		try:
+			for start in range(0, len(user_ids), self.BATCH_SIZE):
+				chunk = list(user_ids[start:start + self.BATCH_SIZE])
+				connection = self._get_connection()
+				with connection:
+					with self._cursor(connection) as cursor:
+						cursor.execute(self.SELECT_USERS_IN.format(', '.join(['%s'] * len(chunk))), chunk)
+						users.extend(self._populate_lazy_user_objects(cursor.fetchall()))
+			return users
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem selecting %s users by ID: %s', len(user_ids), e)
+			return []
+
+	def select_user_ids(self, role:str=None)->List[int]:
+		"""Selects the IDs of all users, or of the users with the given role, in ID order."""
+		cursor = None
+		results = None
+		try:
+			connection = self._get_connection()
+			with connection:
+				with self._cursor(connection) as cursor:
+					if role is None:
+						cursor.execute(self.SELECT_USER_IDS)
+					else:
+						cursor.execute(self.SELECT_USER_IDS_BY_ROLE, (role,))
+					results = cursor.fetchall()
+			return [row[0] for row in results]
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem selecting user IDs: %s', e)
+			return []
+
 	def select_event_by_id(self, event_id:int)->Event:
 		"""Selects an event by ID from the database."""
 		cursor = None
 		result = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.SELECT_EVENT_BY_ID) as cursor:
 					cursor.execute(self.SELECT_EVENT_BY_ID, (event_id,))
 					result = cursor.fetchone()
 			if result:
@@ -188,219 +416,913 @@ class MySQLPersistenceWrapper(ApplicationBase):
 				if events_list:
 					return events_list[0]
 			return None
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem selecting event by ID {event_id}: {e}')
+			self._logger.log_error('Problem selecting event by ID %s: %s', event_id, e)
 			return None
 	
+	def select_events_in(self, event_ids:List[int])->List[Event]:
+		"""Selects the events with the given IDs, in ID order, in one IN-list query per batch."""
+		events = []
+		try:
+			for start in range(0, len(event_ids), self.BATCH_SIZE):
+				chunk = list(event_ids[start:start + self.BATCH_SIZE])
+				connection = self._get_connection()
+				with connection:
+					with self._cursor(connection) as cursor:
+						cursor.execute(self.SELECT_EVENTS_IN.format(', '.join(['%s'] * len(chunk))), chunk)
+						events.extend(self._populate_event_objects(cursor.fetchall()))
+			return events
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem selecting %s events by ID: %s', len(event_ids), e)
+			return []
+
 	def select_all_events_for_user_id(self, user_id:int)->List[Event]:
 		"""Selects all events for a given user ID from the database."""
 		cursor = None
 		results = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.SELECT_REGISTERED_EVENTS_FOR_USER_ID) as cursor:
 					cursor.execute(self.SELECT_REGISTERED_EVENTS_FOR_USER_ID, (user_id,))
 					results = cursor.fetchall()
 			return results
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem selecting all modules for user ID %s: %s', user_id, e)
+			return []
+
+	def select_conflicting_events(self, user_id:int, event_id:int)->List[Event]:
+		"""Selects the events a user is registered to whose time overlaps the given event, by start time."""
+		cursor = None
+		results = None
+		try:
+			connection = self._get_connection()
+			with connection:
+				with self._cursor(connection, self.SELECT_CONFLICTING_EVENTS_FOR_USER_ID) as cursor:
+					cursor.execute(self.SELECT_CONFLICTING_EVENTS_FOR_USER_ID, (user_id, event_id))
+					results = cursor.fetchall()
+			return self._populate_registered_event_objects(results)
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem selecting all modules for user ID {user_id}: {e}')
+			self._logger.log_error('Problem selecting events conflicting with event ID %s for user ID %s: %s', event_id, user_id, e)
 			return []
 
+	def iter_users(self, page_size:int=None, prefetch_events:bool=False)->Iterator[User]:
+		"""Yields all users, one keyset page at a time.
+		With prefetch_events each page's events are loaded in the same query.
+		"""
+		page_size = page_size or self.PAGE_SIZE
+		last_id = 0
+		while True:
+			cursor = None
+			results = None
+			try:
+				connection = self._get_connection()
+				with connection:
+					statement = self.SELECT_USERS_WITH_EVENTS_PAGE if prefetch_events else self.SELECT_USERS_PAGE
+					with self._cursor(connection, statement) as cursor:
+						cursor.execute(statement, (last_id, page_size))
+						results = cursor.fetchall()
+				if prefetch_events:
+					users_list = self._populate_user_objects_with_events(results)
+				else:
+					users_list = self._populate_lazy_user_objects(results)
+			except PoolError:
+				raise
+			except Exception as e:
+				self._logger.log_error('Problem selecting users after ID %s: %s', last_id, e)
+				return
+			yield from users_list
+			if len(users_list) < page_size:
+				return
+			last_id = users_list[-1].id
+
+	def iter_events(self, page_size:int=None)->Iterator[Event]:
+		"""Yields all events, one keyset page at a time."""
+		page_size = page_size or self.PAGE_SIZE
+		last_id = 0
+		while True:
+			cursor = None
+			results = None
+			try:
+				connection = self._get_connection()
+				with connection:
+					with self._cursor(connection, self.SELECT_EVENTS_PAGE) as cursor:
+						cursor.execute(self.SELECT_EVENTS_PAGE, (last_id, page_size))
+						results = cursor.fetchall()
+				events_list = self._populate_event_objects(results)
+			except PoolError:
+				raise
+			except Exception as e:
+				self._logger.log_error('Problem selecting events after ID %s: %s', last_id, e)
+				return
+			yield from events_list
+			if len(events_list) < page_size:
+				return
+			last_id = events_list[-1].id
+
+	def select_events_between(self, starts_from:datetime=None, starts_before:datetime=None, limit:int=None, after:Event=None)->List[Event]:
+		"""Selects one page of the events starting at or after starts_from and before starts_before, by start time then ID.
+		Pass the last event of a page as after to select the next page; a page shorter than limit is the last.
+		"""
+		return self._select_events_page(self.SELECT_EVENTS_BETWEEN_PAGE, (), starts_from, starts_before, limit, after)
+
+	def select_upcoming_events(self, limit:int=None, after:Event=None)->List[Event]:
+		"""Selects one page of the events that have not started yet, soonest first."""
+		return self._select_events_page(self.SELECT_EVENTS_BETWEEN_PAGE, (), datetime.now(), None, limit, after)
+
+	def select_events_by_location(self, location:str, starts_from:datetime=None, starts_before:datetime=None, limit:int=None, after:Event=None)->List[Event]:
+		"""Selects one page of the events at a location, optionally within a start time range, by start time then ID."""
+		return self._select_events_page(self.SELECT_EVENTS_BY_LOCATION_PAGE, (location,), starts_from, starts_before, limit, after)
+
+	def iter_registrations(self, page_size:int=None)->Iterator[Registration]:
+		"""Yields all volunteer registrations, one keyset page at a time."""
+		page_size = page_size or self.PAGE_SIZE
+		last_id = 0
+		while True:
+			cursor = None
+			results = None
+			try:
+				connection = self._get_connection()
+				with connection:
+					with self._cursor(connection, self.SELECT_REGISTRATIONS_PAGE) as cursor:
+						cursor.execute(self.SELECT_REGISTRATIONS_PAGE, (last_id, page_size))
+						results = cursor.fetchall()
+				registrations_list = self._populate_registration_objects(results)
+			except PoolError:
+				raise
+			except Exception as e:
+				self._logger.log_error('Problem selecting registrations after ID %s: %s', last_id, e)
+				return
+			yield from registrations_list
+			if len(registrations_list) < page_size:
+				return
+			last_id = registrations_list[-1].id
+
+	def select_event_frame(self)->'EventFrame':
+		"""Selects all events into a columnar NumPy-backed EventFrame (requires numpy)."""
+		from volunteer_event_coordination.infrastructure_layer.frames import EventFrame
+		cursor = None
+		results = []
+		try:
+			connection = self._get_connection()
+			with connection:
+				with self._cursor(connection) as cursor:
+					cursor.execute(self.SELECT_EVENT_FRAME)
+					results = cursor.fetchall()
+			return EventFrame.from_rows(results)
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem selecting event frame: %s', e)
+			return EventFrame.from_rows([])
+
+	def select_registration_frame(self)->'RegistrationFrame':
+		"""Selects all registrations into a columnar NumPy-backed RegistrationFrame (requires numpy)."""
+		from volunteer_event_coordination.infrastructure_layer.frames import RegistrationFrame
+		cursor = None
+		results = []
+		try:
+			connection = self._get_connection()
+			with connection:
+				with self._cursor(connection) as cursor:
+					cursor.execute(self.SELECT_REGISTRATION_FRAME)
+					results = cursor.fetchall()
+			return RegistrationFrame.from_rows(results)
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem selecting registration frame: %s', e)
+			return RegistrationFrame.from_rows([])
+
+	def user_exists(self, user_id:int)->bool:
+		"""Returns True if a user with the given ID exists."""
+		cursor = None
+		result = None
+		try:
+			connection = self._get_connection()
+			with connection:
+				with self._cursor(connection, self.USER_EXISTS) as cursor:
+					cursor.execute(self.USER_EXISTS, (user_id,))
+					result = cursor.fetchone()
+			return bool(result and result[0])
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem checking user ID %s: %s', user_id, e)
+			return False
+
+	def event_exists(self, event_id:int)->bool:
+		"""Returns True if an event with the given ID exists."""
+		cursor = None
+		result = None
+		try:
+			connection = self._get_connection()
+			with connection:
+				with self._cursor(connection, self.EVENT_EXISTS) as cursor:
+					cursor.execute(self.EVENT_EXISTS, (event_id,))
+					result = cursor.fetchone()
+			return bool(result and result[0])
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem checking event ID %s: %s', event_id, e)
+			return False
+
+	def validate_user_and_event(self, user_id:int, event_id:int)->Tuple[bool, bool]:
+		"""Returns whether the user and the event exist, using a single query."""
+		cursor = None
+		result = None
+		try:
+			connection = self._get_connection()
+			with connection:
+				with self._cursor(connection, self.USER_AND_EVENT_EXIST) as cursor:
+					cursor.execute(self.USER_AND_EVENT_EXIST, (user_id, event_id))
+					result = cursor.fetchone()
+			if result:
+				return bool(result[0]), bool(result[1])
+			return False, False
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem checking user ID %s and event ID %s: %s', user_id, event_id, e)
+			return False, False
+
+	def count_registrations(self, event_id:int, status:str=None)->int:
+		"""Counts the registrations for an event, optionally only those with the given status."""
+		cursor = None
+		result = None
+		try:
+			connection = self._get_connection()
+			with connection:
+				if status is None:
+					statement, params = self.COUNT_REGISTRATIONS_FOR_EVENT, (event_id,)
+				else:
+					statement, params = self.COUNT_REGISTRATIONS_FOR_EVENT_BY_STATUS, (event_id, status)
+				with self._cursor(connection, statement) as cursor:
+					cursor.execute(statement, params)
+					result = cursor.fetchone()
+			return result[0] if result else 0
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem counting registrations for event ID %s: %s', event_id, e)
+			return 0
+
+	def get_pool_stats(self)->dict:
+		"""Returns the connection pool gauges and counters."""
+		return self._connection_pool.stats()
+
+	def get_query_stats(self, reset:bool=False)->dict:
+		"""Returns per-statement call counts, rows, latency and checkout time; optionally starts over."""
+		if self._query_stats is None:
+			return {}
+		snapshot = self._query_stats.snapshot()
+		if reset:
+			self._query_stats.reset()
+		return snapshot
+
+	def get_schema_version(self)->int:
+		"""Returns the highest applied schema version; a database without migrations is at version 1."""
+		try:
+			connection = self._get_connection()
+			with connection:
+				with self._cursor(connection) as cursor:
+					version = self._read_schema_version(cursor)
+				connection.commit()
+				return version
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem reading schema version: %s', e)
+			return None
+
+	def migrate(self, target_version:int=None)->List[int]:
+		"""Applies the pending migrations in version order, up to target_version, and returns the versions applied.
+		Migrations are forward-only; each is recorded in schema_version once its statements have run, and
+		indexes that already exist are skipped so an interrupted migration can be run again.
+		"""
+		applied = []
+		try:
+			current = self.get_schema_version()
+			if current is None:
+				return applied
+			for version, description, statements in self._read_migrations(current, target_version):
+				self._logger.log_info('Applying schema version %s: %s', version, description)
+				connection = self._get_connection()
+				with connection:
+					with self._cursor(connection) as cursor:
+						for statement in statements:
+							try:
+								cursor.execute(statement)
+							except Exception as e:
+								if getattr(e, 'errno', None) not in DUPLICATE_SCHEMA_OBJECT_ERRORS:
+									raise
+								self._logger.log_warning('Skipping already applied statement %s: %s', statement, e)
+						cursor.execute(self.INSERT_SCHEMA_VERSION, (version, description))
+					connection.commit()
+				applied.append(version)
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem migrating the schema after versions %s: %s', applied, e)
+		return applied
+
+	def check_query_plans(self)->dict:
+		"""Explains each of HOT_QUERIES and returns {statement name: [full scans]} for those that scan a whole table or index.
+		An empty result means every hot query uses an index; None means the check could not run. Run it against representative data:
+		on near-empty tables the optimizer may prefer a scan.
+		"""
+		problems = {}
+		try:
+			connection = self._get_connection()
+			with connection:
+				with self._cursor(connection) as cursor:
+					for name, params in self.HOT_QUERIES.items():
+						scans = self._explain_full_scans(cursor, getattr(self, name), params)
+						if scans:
+							problems[name] = scans
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem explaining hot queries: %s', e)
+			return None
+		return problems
+
+	def close(self)->None:
+		"""Closes the pooled database connections."""
+		self._connection_pool.close()
+
 	def insert_user(self, user:User)->User:
 		"""Inserts a new user into the database."""
 		cursor = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.INSERT_USER) as cursor:
 					cursor.execute(self.INSERT_USER, (user.full_name, user.email, user.phone, user.role))
+					user.id = cursor.lastrowid
 					connection.commit()
 			return user
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem inserting user: {e}')
+			self._logger.log_error('Problem inserting user: %s', e)
 			return None
 		
 	def insert_event(self, event:Event)->Event:
 		"""Inserts a new event into the database."""
 		cursor = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.INSERT_EVENT) as cursor:
 					cursor.execute(self.INSERT_EVENT, (event.title, event.description, event.location, event.starts_at, event.ends_at, event.capacity, event.created_by))
+					event.id = cursor.lastrowid
 					connection.commit()
 			return event
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem inserting event: {e}')
+			self._logger.log_error('Problem inserting event: %s', e)
 			return None
 
 	def update_user(self, user:User)->bool:
 		"""Updates an existing user in the database."""
 		cursor = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.UPDATE_USER) as cursor:
 					cursor.execute(self.UPDATE_USER, (user.full_name, user.email, user.phone, user.role, user.id))
 					connection.commit()
 			return True
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem updating user: {e}')
+			self._logger.log_error('Problem updating user: %s', e)
 			return False
 		
 	def update_event(self, event:Event)->bool:
 		"""Updates an existing event in the database."""
 		cursor = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.UPDATE_EVENT) as cursor:
 					cursor.execute(self.UPDATE_EVENT, (event.title, event.description, event.location, event.starts_at, event.ends_at, event.capacity, event.id))
 					connection.commit()
 			return True
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem updating event: {e}')
+			self._logger.log_error('Problem updating event: %s', e)
 			return False
 		
 	def delete_user(self, user_id:int)->bool:
 		"""Deletes a user from the database."""
 		cursor = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.DELETE_USER) as cursor:
 					cursor.execute(self.DELETE_USER, (user_id,))
 					connection.commit()
 			return True
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem deleting user ID {user_id}: {e}')
+			self._logger.log_error('Problem deleting user ID %s: %s', user_id, e)
 			return False
 		
 	def delete_event(self, event_id:int)->bool:
 		"""Deletes an event from the database."""
 		cursor = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.DELETE_EVENT) as cursor:
 					cursor.execute(self.DELETE_EVENT, (event_id,))
 					connection.commit()
 			return True
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem deleting event ID {event_id}: {e}')
+			self._logger.log_error('Problem deleting event ID %s: %s', event_id, e)
 			return False
 		
 	def register_user_to_event(self, user_id:int, event_id:int, status:str)->bool:
 		"""Registers a user with an event in the database."""
 		cursor = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.REGISTER_USER_TO_EVENT) as cursor:
 					cursor.execute(self.REGISTER_USER_TO_EVENT, (user_id, event_id, status))
 					connection.commit()
 			return True
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem registering user ID {user_id} with event ID {event_id}: {e}')
+			self._logger.log_error('Problem registering user ID %s with event ID %s: %s', user_id, event_id, e)
 			return False
 		
 	def update_user_event_registration_status(self, user_id:int, event_id:int, status:str)->bool:
 		"""Updates the status of a user's registration for an event in the database."""
 		cursor = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.UPDATE_USER_EVENT_STATUS) as cursor:
 					cursor.execute(self.UPDATE_USER_EVENT_STATUS, (status, user_id, event_id))
 					connection.commit()
 			return True
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem updating status for user ID {user_id} and event ID {event_id}: {e}')
+			self._logger.log_error('Problem updating status for user ID %s and event ID %s: %s', user_id, event_id, e)
 			return False
 		
 	def unregister_user_from_event(self, user_id:int, event_id:int)->bool:
 		"""Unregisters a user from an event in the database."""
 		cursor = None
 		try:
-			connection = self._connection_pool.get_connection()
+			connection = self._get_connection()
 			with connection:
-				cursor = connection.cursor()
-				with cursor:
+				with self._cursor(connection, self.UNREGISTER_USER_FROM_EVENT) as cursor:
 					cursor.execute(self.UNREGISTER_USER_FROM_EVENT, (user_id, event_id))
 					connection.commit()
 			return True
+		except PoolError:
+			raise
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem unregistering user ID {user_id} from event ID {event_id}: {e}')
+			self._logger.log_error('Problem unregistering user ID %s from event ID %s: %s', user_id, event_id, e)
 			return False
 
 
 
+	def insert_users_many(self, users:List[User])->BatchResult:
+		"""Inserts users in chunked multi-row transactions and sets their generated IDs."""
+		params_list = [(user.full_name, user.email, user.phone, user.role) for user in users]
+		result = self._insert_many(self.INSERT_USER, params_list)
+		for user, user_id in zip(users, result.ids):
+			if user_id is not None:
+				user.id = user_id
+		return result
+
+	def insert_events_many(self, events:List[Event])->BatchResult:
+		"""Inserts events in chunked multi-row transactions and sets their generated IDs."""
+		params_list = [(event.title, event.description, event.location, event.starts_at, event.ends_at, event.capacity, event.created_by) for event in events]
+		result = self._insert_many(self.INSERT_EVENT, params_list)
+		for event, event_id in zip(events, result.ids):
+			if event_id is not None:
+				event.id = event_id
+		return result
+
+	def register_many(self, registrations:List[Registration])->BatchResult:
+		"""Registers users with events in chunked multi-row transactions and sets the generated IDs."""
+		params_list = [(registration.user_id, registration.event_id, registration.status) for registration in registrations]
+		result = self._insert_many(self.REGISTER_USER_TO_EVENT, params_list)
+		for registration, registration_id in zip(registrations, result.ids):
+			if registration_id is not None:
+				registration.id = registration_id
+		return result
+
+	def update_users_many(self, users:List[User])->BatchResult:
+		"""Updates users in chunked transactions."""
+		params_list = [(user.full_name, user.email, user.phone, user.role, user.id) for user in users]
+		return self._execute_many(self.UPDATE_USER, params_list)
+
+	def update_events_many(self, events:List[Event])->BatchResult:
+		"""Updates events in chunked transactions."""
+		params_list = [(event.title, event.description, event.location, event.starts_at, event.ends_at, event.capacity, event.id) for event in events]
+		return self._execute_many(self.UPDATE_EVENT, params_list)
+
+	def update_registration_status_many(self, registrations:List[Registration])->BatchResult:
+		"""Updates registration statuses in chunked transactions."""
+		params_list = [(registration.status, registration.user_id, registration.event_id) for registration in registrations]
+		return self._execute_many(self.UPDATE_USER_EVENT_STATUS, params_list)
+
+	def unregister_many(self, registrations:List[Registration])->BatchResult:
+		"""Unregisters users from events in chunked transactions."""
+		params_list = [(registration.user_id, registration.event_id) for registration in registrations]
+		return self._execute_many(self.UNREGISTER_USER_FROM_EVENT, params_list)
+
+	def delete_users_many(self, user_ids:List[int])->BatchResult:
+		"""Deletes users with one IN-list statement per chunk."""
+		params_list = [(user_id,) for user_id in user_ids]
+		return self._execute_many(self.DELETE_USER, params_list, self.DELETE_USERS_IN)
+
+	def delete_events_many(self, event_ids:List[int])->BatchResult:
+		"""Deletes events with one IN-list statement per chunk."""
+		params_list = [(event_id,) for event_id in event_ids]
+		return self._execute_many(self.DELETE_EVENT, params_list, self.DELETE_EVENTS_IN)
+
+
+
 	##### Private Utility Methods #####
 
-	def _initialize_database_connection_pool(self, config:dict)->MySQLConnectionPool:
-		"""Initializes database connection pool."""
-		try:
-			self._logger.log_debug(f'Creating connection pool...')
-			cnx_pool = \
-				MySQLConnectionPool(pool_name = self.DATABASE["pool"]["name"],
-					pool_size=self.DATABASE["pool"]["size"],
-					pool_reset_session=self.DATABASE["pool"]["reset_session"],
-					use_pure=self.DATABASE["pool"]["use_pure"],
-					**config)
-			self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}: Connection pool successfully created!')
+	def _insert_many(self, statement:str, params_list:List[tuple])->BatchResult:
+		"""Inserts rows as one multi-row INSERT per chunk, falling back to row-by-row on failure.
+		A multi-row INSERT is a 'simple insert' for InnoDB, so its auto-increment values are
+		consecutive and start at lastrowid.
+		"""
+		result = BatchResult()
+		for start in range(0, len(params_list), self.BATCH_SIZE):
+			chunk = params_list[start:start + self.BATCH_SIZE]
+			checkpoint = self._checkpoint(result)
+			try:
+				connection = self._get_connection()
+				with connection:
+					with self._cursor(connection) as cursor:
+						try:
+							cursor.execute(self._expand_values(statement, len(chunk)),
+								[value for params in chunk for value in params])
+							first_id = self._first_insert_id(cursor, len(chunk))
+							connection.commit()
+							result.ids.extend(range(first_id, first_id + len(chunk)))
+							result.succeeded += len(chunk)
+							continue
+						except Exception as e:
+							connection.rollback()
+							self._logger.log_debug('Multi-row insert failed, retrying rows %s-%s one by one: %s', start, start + len(chunk) - 1, e)
+						self._execute_rows(connection, cursor, statement, chunk, start, result, True)
+						connection.commit()
+			except Exception as e:
+				self._logger.log_error('Problem inserting rows %s-%s: %s', start, start + len(chunk) - 1, e)
+				self._fail_chunk(chunk, start, result, e, True, checkpoint)
+		return result
+
+	def _execute_many(self, statement:str, params_list:List[tuple], in_list_statement:str=None)->BatchResult:
+		"""Executes a statement for each row in chunked transactions.
+		When in_list_statement is given, each chunk is first tried as a single IN-list statement.
+		"""
+		result = BatchResult()
+		for start in range(0, len(params_list), self.BATCH_SIZE):
+			chunk = params_list[start:start + self.BATCH_SIZE]
+			checkpoint = self._checkpoint(result)
+			try:
+				connection = self._get_connection()
+				with connection:
+					with self._cursor(connection) as cursor:
+						if in_list_statement:
+							try:
+								cursor.execute(in_list_statement.format(', '.join(['%s'] * len(chunk))),
+									[params[0] for params in chunk])
+								if cursor.rowcount == len(chunk):
+									connection.commit()
+									result.succeeded += len(chunk)
+									continue
+								# Some IDs matched no row; find them row by row
+								connection.rollback()
+							except Exception as e:
+								connection.rollback()
+								self._logger.log_debug('IN-list statement failed, retrying rows %s-%s one by one: %s', start, start + len(chunk) - 1, e)
+						self._execute_rows(connection, cursor, statement, chunk, start, result, False)
+						connection.commit()
+			except Exception as e:
+				self._logger.log_error('Problem executing rows %s-%s: %s', start, start + len(chunk) - 1, e)
+				self._fail_chunk(chunk, start, result, e, False, checkpoint)
+		return result
+
+	def _execute_rows(self, connection, cursor, statement:str, chunk:List[tuple], start:int, result:BatchResult, collect_ids:bool)->None:
+		"""Executes a chunk row by row inside the open transaction, recording per-row failures."""
+		for offset, params in enumerate(chunk):
+			try:
+				cursor.execute(statement, params)
+				# An UPDATE or DELETE of a missing ID matches no row (mysql-connector
+				# reports matched rather than changed rows, via the FOUND_ROWS client flag)
+				if cursor.rowcount == 0:
+					result.failures.append((start + offset, 'No matching row'))
+					if collect_ids:
+						result.ids.append(None)
+					continue
+				result.succeeded += 1
+				if collect_ids:
+					result.ids.append(cursor.lastrowid)
+			except Exception as e:
+				result.failures.append((start + offset, str(e)))
+				if collect_ids:
+					result.ids.append(None)
+
+	def _checkpoint(self, result:BatchResult)->Tuple[int, int, int]:
+		"""The lengths of a result's ids and failures and its succeeded count, before a chunk is written."""
+		return len(result.ids), result.succeeded, len(result.failures)
+
+	def _fail_chunk(self, chunk:List[tuple], start:int, result:BatchResult, error:Exception, collect_ids:bool, checkpoint:Tuple[int, int, int])->None:
+		"""Records every row of a chunk that could not be written at all.
+		Anything already recorded for the chunk is discarded first, since its transaction was not committed.
+		"""
+		ids_length, succeeded, failures_length = checkpoint
+		del result.ids[ids_length:]
+		del result.failures[failures_length:]
+		result.succeeded = succeeded
+		for offset in range(len(chunk)):
+			result.failures.append((start + offset, str(error)))
+			if collect_ids:
+				result.ids.append(None)
+
+	def _expand_values(self, statement:str, row_count:int)->str:
+		"""Expands a single-row INSERT ... VALUES (...) statement into a multi-row one."""
+		head, values = statement.rstrip(';').split('VALUES', 1)
+		return f"{head}VALUES {', '.join([values.strip()] * row_count)};"
+
+	def _read_connection_config(self)->dict:
+		"""Reads the connection arguments from the database section of the config."""
+		db_config = {}
+		db_config['database'] = \
+			self.DATABASE["connection"]["config"]["database"]
+		db_config['user'] = self.DATABASE["connection"]["config"]["user"]
+		db_config['password'] = self.DATABASE["connection"]["config"]['password']
+		db_config['host'] = self.DATABASE["connection"]["config"]["host"]
+		db_config['port'] = self.DATABASE["connection"]["config"]["port"]
+		return db_config
+
+	def _initialize_query_stats(self)->QueryStats:
+		"""Creates the per-statement stats named after the SQL constants, or None when disabled."""
+		query_stats_config = self.DATABASE.get("query_stats", {})
+		if not query_stats_config.get("enabled", True):
+			return None
+		logs_dir = self._settings.get('logs_dir', 'logs')
+		slow_query_log = None
+		if query_stats_config.get("slow_query_log", True):
+			slow_query_log = open_slow_query_log(os.path.join(logs_dir, f'{self.META["log_prefix"]}_slow_queries.log'))
+		query_stats = QueryStats(query_stats_config.get("slow_query_ms", 200), slow_query_log)
+		for name, value in vars(self).items():
+			if name.isupper() and isinstance(value, str):
+				query_stats.register(name, value)
+		if query_stats_config.get("dump_at_exit", False):
+			dump_path = os.path.join(logs_dir, f'{self.META["log_prefix"]}_query_stats.json')
+			atexit.register(self._dump_query_stats, query_stats, dump_path)
+		return query_stats
+
+	def _dump_query_stats(self, query_stats:QueryStats, path:str)->None:
+		"""Writes the statement stats snapshot at exit."""
+		try:
+			query_stats.dump(path)
+		except Exception as e:
+			self._logger.log_error('Problem writing query stats to %s: %s', path, e)
+
+	def _select_events_page(self, statement:str, params:tuple, starts_from:datetime, starts_before:datetime, limit:int, after:Event)->List[Event]:
+		"""Selects one (starts_at, id) keyset page of a starts_at range query; open bounds default to EARLIEST and LATEST."""
+		limit = limit or self.PAGE_SIZE
+		starts_from = starts_from if starts_from is not None else EARLIEST
+		starts_before = starts_before if starts_before is not None else LATEST
+		# Later pages start at the previous page's last event, which is already within the range
+		key = (after.starts_at, after.id) if after is not None else (starts_from, 0)
+		cursor = None
+		results = None
+		try:
+			connection = self._get_connection()
+			with connection:
+				with self._cursor(connection, statement) as cursor:
+					cursor.execute(statement, params + (key[0], starts_before) + key + (limit,))
+					results = cursor.fetchall()
+			return self._populate_event_objects(results)
+		except PoolError:
+			raise
+		except Exception as e:
+			self._logger.log_error('Problem selecting events from %s before %s: %s', starts_from, starts_before, e)
+			return []
+
+	def _read_schema_version(self, cursor)->int:
+		"""Creates the schema_version table if needed, recording version 1 (db_version_1) in a new one."""
+		cursor.execute(self.CREATE_SCHEMA_VERSION_TABLE)
+		cursor.execute(self.SELECT_SCHEMA_VERSION)
+		version = cursor.fetchone()[0]
+		if version is None:
+			version = 1
+			cursor.execute(self.INSERT_SCHEMA_VERSION, (version, 'db_version_1 baseline'))
+		return version
+
+	def _read_migrations(self, current_version:int, target_version:int=None)->List[Tuple[int, str, List[str]]]:
+		"""Reads the migrations after current_version as (version, description, statements).
+		The description is the script's first comment line.
+		"""
+		migrations = []
+		for entry in os.listdir(self.MIGRATIONS_DIR):
+			match = MIGRATION_DIR_PATTERN.fullmatch(entry)
+			if match is None:
+				continue
+			version = int(match.group(1))
+			path = os.path.join(self.MIGRATIONS_DIR, entry, self.MIGRATION_SCRIPT)
+			if version <= current_version or (target_version is not None and version > target_version) or not os.path.exists(path):
+				continue
+			with open(path, 'r') as f:
+				lines = f.read().splitlines()
+			comments = [line.lstrip('- ').strip() for line in lines if line.startswith('--')]
+			script = '\n'.join(line for line in lines if not line.lstrip().startswith('--'))
+			statements = [statement.strip() for statement in script.split(';') if statement.strip()]
+			migrations.append((version, comments[0] if comments else entry, statements))
+		return sorted(migrations)
+
+	def _explain_full_scans(self, cursor, statement:str, params:tuple)->List[str]:
+		"""Runs EXPLAIN and describes every table accessed by a full table (type ALL) or full index (type index) scan."""
+		cursor.execute(f'EXPLAIN {statement}', params)
+		columns = cursor.column_names
+		scans = []
+		for row in cursor.fetchall():
+			plan = dict(zip(columns, row))
+			# Derived tables (<derivedN>) are already-filtered intermediate results
+			if plan.get('type') in ('ALL', 'index') and not str(plan.get('table')).startswith('<'):
+				scans.append(f"{plan['table']}: full {'table' if plan['type'] == 'ALL' else 'index'} scan")
+		return scans
+
+	def _first_insert_id(self, cursor, row_count:int)->int:
+		"""Returns the ID generated for the first row of a multi-row INSERT of row_count rows.
+		MySQL reports the first row's ID as lastrowid, so row_count is unused here; it exists
+		for SQLitePersistenceWrapper, which derives the first ID from the last.
+		"""
+		return cursor.lastrowid
+
+	def _initialize_database_connection_pool(self, config:dict)->ElasticConnectionPool:
+		"""Initializes database connection pool.
+		The pool grows from pool.min_size to pool.max_size (default pool.size) connections
+		and callers wait up to pool.timeout_seconds for a free one when all are in use.
+		No connection is opened until first use unless pool.warm_up is set.
+		"""
+		pool = self.DATABASE["pool"]
+
+		def connect():
+			# Imported on the first connection; mysql.connector dominates import time
+			from mysql import connector
+			return connector.connect(use_pure=pool["use_pure"], **config)
+
+		self._logger.log_debug('Creating connection pool...')
+		cnx_pool = \
+			ElasticConnectionPool(connect,
+				min_size=pool.get("min_size", 1),
+				max_size=pool.get("max_size", pool["size"]),
+				timeout_seconds=pool.get("timeout_seconds", 10),
+				validation_interval_seconds=pool.get("validation_interval_seconds", 30),
+				max_idle_seconds=pool.get("max_idle_seconds", 300),
+				# Resetting the session would deallocate the cached prepared statements
+				reset_session=pool["reset_session"] and not self.PREPARED_STATEMENTS,
+				name=pool["name"],
+				warm_up=False)
+		if not pool.get("warm_up", False):
+			# Connections, and the MySQL driver, are loaded on first use
 			return cnx_pool
-		except connector.Error as err:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem creating connection pool: {err}')
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Check DB cnfg:\n{json.dumps(self.DATABASE)}')
+		try:
+			cnx_pool.warm_up()
+			self._logger.log_debug('Connection pool successfully created!')
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}:Problem creating connection pool: {e}')
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}:Check DB conf:\n{json.dumps(self.DATABASE)}')
+			self._logger.log_error('Problem creating connection pool: %s', e)
+			self._logger.log_error('Check DB conf:\n%s', json.dumps(self.DATABASE))
+		# Connections are opened on demand, so the pool recovers once the server is reachable
+		return cnx_pool
+
+	def _get_connection(self)->PooledConnection:
+		"""Checks a connection out of the pool, timing the checkout and logging timeouts with the pool gauges."""
+		started = time.perf_counter()
+		try:
+			connection = self._connection_pool.get_connection()
+			if self._query_stats is not None:
+				self._query_stats.record_checkout(time.perf_counter() - started)
+			return connection
+		except PoolTimeoutError as e:
+			self._logger.log_warning('Connection pool exhausted: %s; stats: %s', e, self._connection_pool.stats())
+			raise
+
+	@contextmanager
+	def _cursor(self, connection:PooledConnection, statement:str=None)->Iterator:
+		"""Yields a cursor, timed per statement when query stats are enabled.
+		In prepared statement mode a cursor for a given statement is a server-side
+		prepared cursor that is cached on the pooled connection and reused across
+		checkouts; otherwise it is a new text cursor that is closed on exit.
+		"""
+		if not self.PREPARED_STATEMENTS or statement is None:
+			cursor = connection.cursor()
+			if self._query_stats is not None:
+				cursor = self._query_stats.wrap(cursor)
+			with cursor:
+				yield cursor
+			return
+		cursor = connection.statements.get(statement)
+		if cursor is None:
+			cursor = connection.cursor(prepared=True)
+			connection.statements[statement] = cursor
+		timed = self._query_stats.wrap(cursor) if self._query_stats is not None else cursor
+		try:
+			yield timed
+			if connection.unread_result:
+				timed.fetchall()
+			if timed is not cursor:
+				timed.flush()
+		except Exception:
+			connection.statements.pop(statement, None)
+			try:
+				cursor.close()
+			except Exception:
+				pass
+			raise
 
 	def _pupulate_user_objects(self, results:List)->List[User]:
 		"""Populates and returns a list of user objects."""
-		users_list = []
 		try:
-			for row in results:
-				user = User()
-				user.id = row[self.UserColumns['id'].value]
-				user.full_name = row[self.UserColumns['full_name'].value]
-				user.email = row[self.UserColumns['email'].value]
-				user.phone = row[self.UserColumns['phone'].value]
-				user.role = row[self.UserColumns['role'].value]
-				user.created_at = row[self.UserColumns['created_at'].value]
-				users_list.append(user)
-			return users_list
+			return self._user_mapper.map_rows(results)
 		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem populating user objects: {e}')
+			self._logger.log_error('Problem populating user objects: %s', e)
 			return []
 		
 	def _populate_event_objects(self, results:List)->List[Event]:
 		"""Populates and returns a list of event objects."""
-		events_list = []
+		try:
+			return self._event_mapper.map_rows(results)
+		except Exception as e:
+			self._logger.log_error('Problem populating event objects: %s', e)
+			return []
+
+	def _populate_lazy_user_objects(self, results:List)->List[User]:
+		"""Populates user objects whose events are loaded on first access."""
+		users_list = self._pupulate_user_objects(results)
+		for user in users_list:
+			user.defer_events(self._load_events_for_user)
+		return users_list
+
+	def _load_events_for_user(self, user_id:int)->List[Event]:
+		"""Loads the registered events of a user."""
+		events_list = self.select_all_events_for_user_id(user_id) or []
+		return self._populate_registered_event_objects(events_list)
+
+	def _populate_registration_objects(self, results:List)->List[Registration]:
+		"""Populates and returns a list of registration objects."""
+		try:
+			return self._registration_mapper.map_rows(results)
+		except Exception as e:
+			self._logger.log_error('Problem populating registration objects: %s', e)
+			return []
+
+	def _populate_registered_event_objects(self, results:List)->List[Event]:
+		"""Populates and returns a list of event objects carrying their registration status."""
+		try:
+			return self._registered_event_mapper.map_rows(results)
+		except Exception as e:
+			self._logger.log_error('Problem populating registered event objects: %s', e)
+			return []
+
+	def _populate_user_objects_with_events(self, results:List)->List[User]:
+		"""Groups joined user/event rows and returns user objects with their events hydrated."""
+		users_by_id = {}
+		map_user = self._user_mapper.map_row
+		map_event = self._joined_event_mapper.map_row
+		event_id_column = self.USER_COLUMN_COUNT + self.EventColumns['id'].value
 		try:
 			for row in results:
-				event = Event()
-				event.id = row[self.EventColumns['id'].value]
-				event.title = row[self.EventColumns['title'].value]
-				event.description = row[self.EventColumns['description'].value]
-				event.location = row[self.EventColumns['location'].value]
-				event.starts_at = row[self.EventColumns['starts_at'].value]
-				event.ends_at = row[self.EventColumns['ends_at'].value]
-				event.capacity = row[self.EventColumns['capacity'].value]
-				event.created_by = row[self.EventColumns['created_by'].value]
-				event.created_at = row[self.EventColumns['created_at'].value]
-				events_list.append(event)
-			return events_list
-		except Exception as e:
-			self._logger.log_error(f'{inspect.currentframe().f_code.co_name}: Problem populating event objects: {e}')
-			return []
\ No newline at end of file
+				user_id = row[0]
+				user = users_by_id.get(user_id)
+				if user is None:
+					user = users_by_id[user_id] = map_user(row)
+				if row[event_id_column] is not None:
+					user.events.append(map_event(row))
+			return list(users_by_id.values())
+		except Exception as e:
+			self._logger.log_error('Problem populating user objects with events: %s', e)
+			return []
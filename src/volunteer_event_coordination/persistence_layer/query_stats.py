@@ -0,0 +1,207 @@
+"""Defines the QueryStats and TimedCursor classes."""
+
+from volunteer_event_coordination.logging import queue_handler
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Callable, Dict
+import json
+import logging
+import logging.handlers
+import os
+import time
+
+# Upper bounds, in milliseconds, of the statement latency histogram buckets
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, float('inf'))
+BUCKET_LABELS = tuple(f'<={bound:g}' if bound != float('inf') else 'inf' for bound in LATENCY_BUCKETS_MS)
+
+# Dynamically built statement texts (multi-row INSERTs, IN lists) resolved to names are cached up to this many
+NAME_CACHE_SIZE = 1024
+
+CHECKOUT = 'connection_checkout'
+
+
+def open_slow_query_log(path:str)->Callable[[str], None]:
+	"""Returns a function that queues warnings for a dedicated, daily rotated slow-query log file."""
+	logger = logging.getLogger(f'SlowQueryLog:{os.path.abspath(path)}')
+	logger.propagate = False
+	logger.setLevel(logging.WARNING)
+	if not logger.handlers:
+		logger.addHandler(queue_handler(('slow_query_log', os.path.abspath(path)), lambda: [_slow_query_handler(path)]))
+	return logger.warning
+
+
+def _slow_query_handler(path:str)->logging.Handler:
+	# delay: the file is only created once a slow query happens
+	handler = logging.handlers.TimedRotatingFileHandler(path, when='midnight', backupCount=20, delay=True)
+	handler.setFormatter(logging.Formatter('%(levelname)s:SlowQueryLog:%(asctime)s:%(message)s'))
+	return handler
+
+
+class StatementStats():
+	"""Counters for one statement name."""
+
+	__slots__ = ('calls', 'errors', 'rows', 'seconds_total', 'seconds_max', 'histogram')
+
+	def __init__(self)->None:
+		self.calls = 0
+		self.errors = 0
+		self.rows = 0
+		self.seconds_total = 0.0
+		self.seconds_max = 0.0
+		self.histogram = [0] * len(LATENCY_BUCKETS_MS)
+
+	def to_dict(self)->dict:
+		return {
+			"calls": self.calls,
+			"errors": self.errors,
+			"rows": self.rows,
+			"total_ms": round(self.seconds_total * 1000, 3),
+			"mean_ms": round(self.seconds_total / self.calls * 1000, 3) if self.calls else 0.0,
+			"max_ms": round(self.seconds_max * 1000, 3),
+			"histogram_ms": dict(zip(BUCKET_LABELS, self.histogram)),
+		}
+
+
+class QueryStats():
+	"""Thread-safe per-statement timing and counters.
+
+	Statements are named after the wrapper's SQL constants (see register()). A
+	statement's time covers execute() and the fetches that follow it. Statements
+	slower than slow_query_ms are passed to slow_query_log.
+	"""
+
+	def __init__(self, slow_query_ms:float=None, slow_query_log:Callable[[str], None]=None)->None:
+		self.slow_query_seconds = None if slow_query_ms is None else slow_query_ms / 1000
+		self._slow_query_log = slow_query_log
+		self._lock = Lock()
+		self._stats: Dict[str, StatementStats] = {}
+		self._names: Dict[str, str] = {}
+		self._templates = []
+		self._started = time.time()
+
+	def register(self, name:str, statement:str)->None:
+		"""Names a SQL text. Formatted ({}) and single-row INSERT texts also name their expansions."""
+		self._names[statement] = name
+		if '{' in statement:
+			self._templates.append((statement.split('{', 1)[0], name))
+		elif statement.startswith('INSERT') and 'VALUES' in statement:
+			self._templates.append((statement.split('VALUES', 1)[0] + 'VALUES', f'{name}_MULTI'))
+
+	def name_for(self, statement:str)->str:
+		name = self._names.get(statement)
+		if name is None:
+			name = next((name for prefix, name in self._templates if statement.startswith(prefix)), 'OTHER')
+			if len(self._names) < NAME_CACHE_SIZE:
+				self._names[statement] = name
+		return name
+
+	def record(self, name:str, seconds:float, rows:int=0, error:bool=False, statement:str=None)->None:
+		"""Adds one execution of a statement."""
+		with self._lock:
+			stats = self._stats.get(name)
+			if stats is None:
+				stats = self._stats[name] = StatementStats()
+			stats.calls += 1
+			stats.rows += rows
+			stats.seconds_total += seconds
+			if seconds > stats.seconds_max:
+				stats.seconds_max = seconds
+			if error:
+				stats.errors += 1
+			stats.histogram[bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+		if (self._slow_query_log is not None and self.slow_query_seconds is not None
+				and seconds >= self.slow_query_seconds and name != CHECKOUT):
+			self._slow_query_log(f'{name} took {seconds * 1000:.1f} ms, {rows} rows'
+				f'{" (failed)" if error else ""}: {(statement or "")[:500]}')
+
+	def record_checkout(self, seconds:float)->None:
+		"""Adds one connection checkout."""
+		self.record(CHECKOUT, seconds)
+
+	def snapshot(self)->dict:
+		"""Returns per-statement counters and totals over all statements."""
+		with self._lock:
+			statements = {name: stats.to_dict() for name, stats in sorted(self._stats.items())}
+		queries = [stats for name, stats in statements.items() if name != CHECKOUT]
+		return {
+			"since": self._started,
+			"total": {
+				"calls": sum(stats["calls"] for stats in queries),
+				"errors": sum(stats["errors"] for stats in queries),
+				"rows": sum(stats["rows"] for stats in queries),
+				"total_ms": round(sum(stats["total_ms"] for stats in queries), 3),
+			},
+			"statements": statements,
+		}
+
+	def reset(self)->None:
+		with self._lock:
+			self._stats = {}
+			self._started = time.time()
+
+	def dump(self, path:str)->None:
+		"""Writes the snapshot to path as JSON."""
+		with open(path, 'w') as f:
+			json.dump(self.snapshot(), f, indent=2)
+
+	def wrap(self, cursor:Any)->'TimedCursor':
+		return TimedCursor(cursor, self)
+
+
+class TimedCursor():
+	"""Cursor proxy that times each statement from execute() through its last fetch."""
+
+	def __init__(self, cursor:Any, stats:QueryStats)->None:
+		self._cursor = cursor
+		self._stats = stats
+		self._statement = None
+		self._seconds = 0.0
+		self._rows = 0
+
+	def __enter__(self)->'TimedCursor':
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback)->None:
+		self.close()
+
+	def execute(self, statement:str, params=None)->Any:
+		self.flush()
+		started = time.perf_counter()
+		try:
+			result = self._cursor.execute(statement, params) if params is not None else self._cursor.execute(statement)
+		except Exception:
+			self._stats.record(self._stats.name_for(statement), time.perf_counter() - started, error=True, statement=statement)
+			raise
+		self._statement = statement
+		self._seconds = time.perf_counter() - started
+		rowcount = getattr(self._cursor, 'rowcount', -1)
+		self._rows = rowcount if rowcount and rowcount > 0 and not statement.lstrip().startswith('SELECT') else 0
+		return result
+
+	def fetchone(self)->Any:
+		started = time.perf_counter()
+		row = self._cursor.fetchone()
+		self._seconds += time.perf_counter() - started
+		if row is not None:
+			self._rows += 1
+		return row
+
+	def fetchall(self)->list:
+		started = time.perf_counter()
+		rows = self._cursor.fetchall()
+		self._seconds += time.perf_counter() - started
+		self._rows += len(rows)
+		return rows
+
+	def flush(self)->None:
+		"""Records the current statement, if any."""
+		if self._statement is not None:
+			self._stats.record(self._stats.name_for(self._statement), self._seconds, self._rows, statement=self._statement)
+			self._statement = None
+
+	def close(self)->None:
+		self.flush()
+		self._cursor.close()
+
+	def __getattr__(self, name:str)->Any:
+		return getattr(self._cursor, name)
@@ -0,0 +1,52 @@
+"""Defines the RowMapper class."""
+
+from operator import itemgetter
+from typing import Iterable, List, Sequence, Tuple
+
+class RowMapper():
+	"""Maps result rows to entity objects with column positions bound once, up front.
+
+	The attribute names and an itemgetter over their row positions are computed
+	when the mapper is built, so mapping a row costs one C-level fetch of all the
+	values and a setattr per column, with no Enum or dict lookups.
+	"""
+
+	def __init__(self, entity_class:type, columns:Sequence[Tuple[str, int]])->None:
+		"""Initializes object with (attribute name, row position) pairs."""
+		self.entity_class = entity_class
+		self.columns = tuple(columns)
+		for attribute, position in self.columns:
+			if not attribute.isidentifier() or not isinstance(position, int):
+				raise ValueError(f'Invalid column mapping: {attribute!r} -> {position!r}')
+		self._attributes = tuple(attribute for attribute, _ in self.columns)
+		positions = [position for _, position in self.columns]
+		# itemgetter returns a bare value, not a tuple, for a single position
+		self._values = itemgetter(*positions) if len(positions) > 1 else lambda row: tuple(row[position] for position in positions)
+
+	@classmethod
+	def from_enum(cls, entity_class:type, columns_enum, offset:int=0, extra_columns:Sequence[Tuple[str, int]]=())->'RowMapper':
+		"""Builds a mapper from a column Enum whose values are row positions, shifted by offset."""
+		columns = [(column.name, column.value + offset) for column in columns_enum]
+		columns.extend((attribute, position + offset) for attribute, position in extra_columns)
+		return cls(entity_class, columns)
+
+	def map_row(self, row:Sequence)->object:
+		"""Maps one row to a new entity object."""
+		obj = self.entity_class()
+		for attribute, value in zip(self._attributes, self._values(row)):
+			setattr(obj, attribute, value)
+		return obj
+
+	def map_rows(self, rows:Iterable[Sequence])->List[object]:
+		"""Maps rows to a list of new entity objects."""
+		new = self.entity_class
+		attributes = self._attributes
+		values = self._values
+		objects = []
+		append = objects.append
+		for row in rows:
+			obj = new()
+			for attribute, value in zip(attributes, values(row)):
+				setattr(obj, attribute, value)
+			append(obj)
+		return objects
@@ -0,0 +1,232 @@
+"""Defines the SQLitePersistenceWrapper class."""
+
+from volunteer_event_coordination.persistence_layer.mysql_persistence_wrapper import MySQLPersistenceWrapper
+from volunteer_event_coordination.persistence_layer.connection_pool import ElasticConnectionPool
+from datetime import date, datetime
+from functools import lru_cache
+from typing import List
+import itertools
+import sqlite3
+
+# sqlite3 stores datetimes as ISO 8601 text; convert the declared DATETIME/TIMESTAMP columns back
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+
+
+def _convert_datetime(value:bytes):
+	text = value.decode('utf-8')
+	try:
+		return datetime.fromisoformat(text)
+	except ValueError:
+		return text
+
+
+sqlite3.register_converter('DATETIME', _convert_datetime)
+sqlite3.register_converter('TIMESTAMP', _convert_datetime)
+
+_memory_database_ids = itertools.count(1)
+
+
+@lru_cache(maxsize=256)
+def _translate(statement:str)->str:
+	"""Rewrites the wrapper's %s placeholders into sqlite3's qmark style."""
+	return statement.replace('%s', '?')
+
+
+class SQLiteCursor():
+	"""Adapts a sqlite3 cursor to the mysql-connector cursor calls the wrapper makes."""
+
+	def __init__(self, raw:sqlite3.Cursor)->None:
+		self._raw = raw
+
+	def __enter__(self)->'SQLiteCursor':
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback)->None:
+		self.close()
+
+	def execute(self, statement:str, params=())->None:
+		self._raw.execute(_translate(statement), params or ())
+
+	def fetchone(self):
+		return self._raw.fetchone()
+
+	def fetchall(self):
+		return self._raw.fetchall()
+
+	@property
+	def lastrowid(self)->int:
+		return self._raw.lastrowid
+
+	@property
+	def rowcount(self)->int:
+		return self._raw.rowcount
+
+	def close(self)->None:
+		self._raw.close()
+
+
+class SQLiteConnection():
+	"""Adapts a sqlite3 connection to the mysql-connector connection calls the wrapper and pool make."""
+
+	unread_result = False
+
+	def __init__(self, raw:sqlite3.Connection)->None:
+		self._raw = raw
+
+	@property
+	def in_transaction(self)->bool:
+		return self._raw.in_transaction
+
+	def cursor(self, **kwargs)->SQLiteCursor:
+		# sqlite3 keeps its own per-connection statement cache, so prepared=True needs no special cursor
+		return SQLiteCursor(self._raw.cursor())
+
+	def commit(self)->None:
+		self._raw.commit()
+
+	def rollback(self)->None:
+		self._raw.rollback()
+
+	def reset_session(self)->None:
+		pass
+
+	def is_connected(self)->bool:
+		try:
+			self._raw.execute('SELECT 1').fetchone()
+			return True
+		except sqlite3.Error:
+			return False
+
+	def close(self)->None:
+		self._raw.close()
+
+
+class SQLitePersistenceWrapper(MySQLPersistenceWrapper):
+	"""Implements the SQLitePersistenceWrapper class.
+
+	Runs the MySQLPersistenceWrapper queries against an embedded SQLite database,
+	either a file (opened in WAL mode so readers do not block the writer) or an
+	in-memory database when database.sqlite.path is ":memory:". The schema mirrors
+	database/db_version_1/create_tables.sql, is created on first use and is then
+	brought to the latest version with the migrate.sqlite.sql migration scripts.
+	"""
+
+	def __init__(self, config:dict)->None:
+		"""Initializes object. """
+		self.SQLITE = config["database"].get("sqlite", {})
+		self._keep_alive = None
+
+		# SQLite Schema (mirrors database/db_version_1/create_tables.sql)
+		self.CREATE_TABLES = [
+			"CREATE TABLE IF NOT EXISTS users ("\
+			"id INTEGER PRIMARY KEY AUTOINCREMENT, "\
+			"full_name VARCHAR(120) NOT NULL, "\
+			"email VARCHAR(160) NOT NULL UNIQUE, "\
+			"phone VARCHAR(30), "\
+			"role TEXT DEFAULT 'volunteer' CHECK (role IN ('admin','organizer','volunteer')), "\
+			"created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);",
+
+			"CREATE TABLE IF NOT EXISTS events ("\
+			"id INTEGER PRIMARY KEY AUTOINCREMENT, "\
+			"title VARCHAR(150) NOT NULL, "\
+			"description TEXT, "\
+			"location VARCHAR(150), "\
+			"starts_at DATETIME NOT NULL, "\
+			"ends_at DATETIME NOT NULL, "\
+			"capacity INT DEFAULT 0, "\
+			"created_by INT REFERENCES users(id) ON DELETE SET NULL ON UPDATE CASCADE, "\
+			"created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);",
+
+			"CREATE TABLE IF NOT EXISTS volunteer_shift_xref ("\
+			"id INTEGER PRIMARY KEY AUTOINCREMENT, "\
+			"event_id INT NOT NULL REFERENCES events(id) ON DELETE CASCADE ON UPDATE CASCADE, "\
+			"user_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE ON UPDATE CASCADE, "\
+			"status TEXT DEFAULT 'registered' CHECK (status IN ('registered','waitlist','cancelled')), "\
+			"registered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "\
+			"UNIQUE (event_id, user_id));",
+		]
+
+		super().__init__(config)
+		# sqlite3 caches compiled statements per connection on its own
+		self.PREPARED_STATEMENTS = False
+
+		# Indexes come from the db_version_<N> migrations, in SQLite syntax
+		self.MIGRATION_SCRIPT = 'migrate.sqlite.sql'
+		self.migrate()
+
+	def close(self)->None:
+		"""Closes the pooled database connections; an in-memory database is discarded."""
+		super().close()
+		if self._keep_alive is not None:
+			self._keep_alive.close()
+			self._keep_alive = None
+
+
+
+	##### Private Utility Methods #####
+
+	def _read_connection_config(self)->dict:
+		"""Reads the database file path from the sqlite section of the config."""
+		return {'database': self.SQLITE.get("path", "volunteer_event_coordination.db")}
+
+	def _explain_full_scans(self, cursor, statement:str, params:tuple)->List[str]:
+		"""Runs EXPLAIN QUERY PLAN and returns the SCAN steps, which read a whole table or index."""
+		cursor.execute(f'EXPLAIN QUERY PLAN {statement}', params)
+		return [detail for _, _, _, detail in cursor.fetchall()
+				if detail.startswith('SCAN ') and detail != 'SCAN CONSTANT ROW']
+
+	def _first_insert_id(self, cursor, row_count:int)->int:
+		"""Returns the ID generated for the first row of a multi-row INSERT.
+		SQLite reports the last row's ID as lastrowid, and a single INSERT assigns consecutive IDs.
+		"""
+		return cursor.lastrowid - row_count + 1
+
+	def _initialize_database_connection_pool(self, config:dict)->ElasticConnectionPool:
+		"""Initializes database connection pool and creates the schema."""
+		pool = self.DATABASE["pool"]
+		path = config["database"]
+		in_memory = path == ':memory:'
+		if in_memory:
+			# A named shared-cache database lets every pooled connection see the same data
+			path = f'file:volunteer_event_coordination_{next(_memory_database_ids)}?mode=memory&cache=shared'
+		timeout = pool.get("timeout_seconds", 10)
+
+		def connect()->SQLiteConnection:
+			raw = sqlite3.connect(path, timeout=timeout, uri=in_memory, check_same_thread=False,
+				detect_types=sqlite3.PARSE_DECLTYPES)
+			raw.execute('PRAGMA foreign_keys = ON;')
+			if not in_memory:
+				raw.execute(f'PRAGMA journal_mode = {self.SQLITE.get("journal_mode", "WAL")};')
+				raw.execute(f'PRAGMA synchronous = {self.SQLITE.get("synchronous", "NORMAL")};')
+			return SQLiteConnection(raw)
+
+		self._logger.log_debug('Opening SQLite database %s', path)
+		try:
+			# The in-memory database lives as long as one connection to it stays open
+			self._keep_alive = connect() if in_memory else None
+			cnx_pool = \
+				ElasticConnectionPool(connect,
+					# Shared-cache connections fail on table locks instead of waiting, so serialize them
+					min_size=1 if in_memory else pool.get("min_size", 1),
+					max_size=1 if in_memory else pool.get("max_size", pool["size"]),
+					timeout_seconds=timeout,
+					validation_interval_seconds=pool.get("validation_interval_seconds", 30),
+					max_idle_seconds=pool.get("max_idle_seconds", 300),
+					reset_session=False,
+					name=pool["name"])
+			with cnx_pool.get_connection() as connection:
+				cursor = connection.cursor()
+				with cursor:
+					for statement in self.CREATE_TABLES:
+						cursor.execute(statement)
+				connection.commit()
+			self._logger.log_debug('Connection pool successfully created!')
+			return cnx_pool
+		except Exception as e:
+			self._logger.log_error('Problem opening SQLite database %s: %s', path, e)
+			if self._keep_alive is not None:
+				self._keep_alive.close()
+				self._keep_alive = None
+			# Without a database every later call would fail on a None pool; fail here instead
+			raise
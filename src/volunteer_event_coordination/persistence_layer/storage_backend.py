@@ -0,0 +1,217 @@
+"""Defines the StorageBackend interface and the backend factory."""
+
+from abc import ABC, abstractmethod
+from volunteer_event_coordination.infrastructure_layer.user import User
+from volunteer_event_coordination.infrastructure_layer.event import Event
+from volunteer_event_coordination.infrastructure_layer.registration import Registration
+from volunteer_event_coordination.infrastructure_layer.batch_result import BatchResult
+from datetime import datetime
+from typing import Iterator, List, Tuple
+
+# Values accepted by the database.backend configuration key
+BACKENDS = ('mysql', 'sqlite')
+
+
+class StorageBackend(ABC):
+	"""Interface the service layer uses to reach the database.
+
+	Implementations also expose PAGE_SIZE and BATCH_SIZE, the default number of
+	rows per keyset page and per write transaction.
+	"""
+
+	# Reads
+	@abstractmethod
+	def select_all_users(self, prefetch_events:bool=False)->List[User]:
+		"""Selects all users; with prefetch_events their events are loaded in the same query."""
+
+	@abstractmethod
+	def select_all_events(self)->List[Event]:
+		"""Selects all events."""
+
+	@abstractmethod
+	def select_user_by_id(self, user_id:int, prefetch_events:bool=False)->User:
+		"""Selects a user by ID, or returns None."""
+
+	@abstractmethod
+	def select_users_in(self, user_ids:List[int])->List[User]:
+		"""Selects the users with the given IDs, in ID order."""
+
+	@abstractmethod
+	def select_user_ids(self, role:str=None)->List[int]:
+		"""Selects the IDs of all users, or of the users with the given role."""
+
+	@abstractmethod
+	def select_event_by_id(self, event_id:int)->Event:
+		"""Selects an event by ID, or returns None."""
+
+	@abstractmethod
+	def select_events_in(self, event_ids:List[int])->List[Event]:
+		"""Selects the events with the given IDs, in ID order."""
+
+	@abstractmethod
+	def select_all_events_for_user_id(self, user_id:int)->List:
+		"""Selects the event rows, with registration status, a user is registered to."""
+
+	@abstractmethod
+	def select_conflicting_events(self, user_id:int, event_id:int)->List[Event]:
+		"""Selects the events a user is registered to whose time overlaps the given event."""
+
+	@abstractmethod
+	def iter_users(self, page_size:int=None, prefetch_events:bool=False)->Iterator[User]:
+		"""Yields all users, one keyset page at a time."""
+
+	@abstractmethod
+	def iter_events(self, page_size:int=None)->Iterator[Event]:
+		"""Yields all events, one keyset page at a time."""
+
+	@abstractmethod
+	def select_events_between(self, starts_from:datetime=None, starts_before:datetime=None, limit:int=None, after:Event=None)->List[Event]:
+		"""Selects one keyset page of the events starting within a time range, by start time."""
+
+	@abstractmethod
+	def select_upcoming_events(self, limit:int=None, after:Event=None)->List[Event]:
+		"""Selects one keyset page of the events that have not started yet, soonest first."""
+
+	@abstractmethod
+	def select_events_by_location(self, location:str, starts_from:datetime=None, starts_before:datetime=None, limit:int=None, after:Event=None)->List[Event]:
+		"""Selects one keyset page of the events at a location, by start time."""
+
+	@abstractmethod
+	def iter_registrations(self, page_size:int=None)->Iterator[Registration]:
+		"""Yields all registrations, one keyset page at a time."""
+
+	@abstractmethod
+	def select_event_frame(self)->'EventFrame':
+		"""Selects all events into an EventFrame."""
+
+	@abstractmethod
+	def select_registration_frame(self)->'RegistrationFrame':
+		"""Selects all registrations into a RegistrationFrame."""
+
+	@abstractmethod
+	def user_exists(self, user_id:int)->bool:
+		"""Returns True if a user with the given ID exists."""
+
+	@abstractmethod
+	def event_exists(self, event_id:int)->bool:
+		"""Returns True if an event with the given ID exists."""
+
+	@abstractmethod
+	def validate_user_and_event(self, user_id:int, event_id:int)->Tuple[bool, bool]:
+		"""Returns whether the user and the event exist."""
+
+	@abstractmethod
+	def count_registrations(self, event_id:int, status:str=None)->int:
+		"""Counts the registrations for an event, optionally only those with the given status."""
+
+	# Single-row writes
+	@abstractmethod
+	def insert_user(self, user:User)->User:
+		"""Inserts a user and sets its generated ID."""
+
+	@abstractmethod
+	def insert_event(self, event:Event)->Event:
+		"""Inserts an event and sets its generated ID."""
+
+	@abstractmethod
+	def update_user(self, user:User)->bool:
+		"""Updates a user."""
+
+	@abstractmethod
+	def update_event(self, event:Event)->bool:
+		"""Updates an event."""
+
+	@abstractmethod
+	def delete_user(self, user_id:int)->bool:
+		"""Deletes a user."""
+
+	@abstractmethod
+	def delete_event(self, event_id:int)->bool:
+		"""Deletes an event."""
+
+	@abstractmethod
+	def register_user_to_event(self, user_id:int, event_id:int, status:str)->bool:
+		"""Registers a user with an event."""
+
+	@abstractmethod
+	def update_user_event_registration_status(self, user_id:int, event_id:int, status:str)->bool:
+		"""Updates the status of a registration."""
+
+	@abstractmethod
+	def unregister_user_from_event(self, user_id:int, event_id:int)->bool:
+		"""Removes a registration."""
+
+	# Batch writes
+	@abstractmethod
+	def insert_users_many(self, users:List[User])->BatchResult:
+		"""Inserts users in chunked transactions."""
+
+	@abstractmethod
+	def insert_events_many(self, events:List[Event])->BatchResult:
+		"""Inserts events in chunked transactions."""
+
+	@abstractmethod
+	def register_many(self, registrations:List[Registration])->BatchResult:
+		"""Inserts registrations in chunked transactions."""
+
+	@abstractmethod
+	def update_users_many(self, users:List[User])->BatchResult:
+		"""Updates users in chunked transactions."""
+
+	@abstractmethod
+	def update_events_many(self, events:List[Event])->BatchResult:
+		"""Updates events in chunked transactions."""
+
+	@abstractmethod
+	def update_registration_status_many(self, registrations:List[Registration])->BatchResult:
+		"""Updates registration statuses in chunked transactions."""
+
+	@abstractmethod
+	def unregister_many(self, registrations:List[Registration])->BatchResult:
+		"""Removes registrations in chunked transactions."""
+
+	@abstractmethod
+	def delete_users_many(self, user_ids:List[int])->BatchResult:
+		"""Deletes users in chunked transactions."""
+
+	@abstractmethod
+	def delete_events_many(self, event_ids:List[int])->BatchResult:
+		"""Deletes events in chunked transactions."""
+
+	# Schema
+	@abstractmethod
+	def get_schema_version(self)->int:
+		"""Returns the highest applied schema version."""
+
+	@abstractmethod
+	def migrate(self, target_version:int=None)->List[int]:
+		"""Applies the pending schema migrations and returns the versions applied."""
+
+	@abstractmethod
+	def check_query_plans(self)->dict:
+		"""Returns the hot queries whose plans scan a whole table or index."""
+
+	# Lifecycle
+	@abstractmethod
+	def get_pool_stats(self)->dict:
+		"""Returns the connection pool gauges and counters."""
+
+	@abstractmethod
+	def get_query_stats(self, reset:bool=False)->dict:
+		"""Returns per-statement call counts, rows and latency histograms."""
+
+	@abstractmethod
+	def close(self)->None:
+		"""Closes the pooled database connections."""
+
+
+def create_storage_backend(config:dict)->StorageBackend:
+	"""Returns the backend named by config["database"]["backend"] (default "mysql")."""
+	backend = config["database"].get("backend", "mysql")
+	if backend == 'mysql':
+		from volunteer_event_coordination.persistence_layer.mysql_persistence_wrapper import MySQLPersistenceWrapper
+		return MySQLPersistenceWrapper(config)
+	if backend == 'sqlite':
+		from volunteer_event_coordination.persistence_layer.sqlite_persistence_wrapper import SQLitePersistenceWrapper
+		return SQLitePersistenceWrapper(config)
+	raise ValueError(f'Unknown database backend {backend!r}; expected one of {", ".join(BACKENDS)}')
@@ -1,8 +1,8 @@
 from volunteer_event_coordination.service_layer.app_services import AppServices
 from volunteer_event_coordination.application_base import ApplicationBase
+from volunteer_event_coordination.persistence_layer.connection_pool import PoolError
 from volunteer_event_coordination.infrastructure_layer.user import User
 from volunteer_event_coordination.infrastructure_layer.event import Event
-from prettytable import PrettyTable
 import sys
 
 
@@ -16,6 +16,8 @@ class ConsoleUI(ApplicationBase):
         super().__init__(subclass_name=self.__class__.__name__, 
                 logfile_prefix_name=self.META["log_prefix"])
         self.app_services = AppServices(config)
+        # Events shown per page by list_events
+        self.EVENTS_PAGE_SIZE = 20
 
     # Public Methods
     def display_menu(self)->None:
@@ -28,21 +30,23 @@ class ConsoleUI(ApplicationBase):
         print(f"\t3. Update User")
         print(f"\t4. Delete User")
         print()
-        print(f"\t5. List all events")
+        print(f"\t5. List upcoming events")
         print(f"\t6. Add Event")
         print(f"\t7. Update Event")
         print(f"\t8. Delete Event")
+        print(f"\t9. Search Events")
         print()
-        print(f"\t9. Register User to Event")
-        print(f"\t10. Update User Event Registration Status")
-        print(f"\t11. Unregister User from Event")
+        print(f"\t10. Register User to Event")
+        print(f"\t11. Update User Event Registration Status")
+        print(f"\t12. Unregister User from Event")
         print()
-        print(f"\t12. Exit")
+        print(f"\t13. Exit")
         print()
 
     def process_menu_choice(self)->None:
         """ Process users menu choice. """
-        choice = input("\tEnter your choice (1-12): ")
+        choice = input("\tEnter your choice (1-13): ")
+        queries_before = self.app_services.get_query_stats().get("total", {}).get("calls", 0)
 
         match choice:
             case '1': self.list_users()
@@ -54,19 +58,24 @@ class ConsoleUI(ApplicationBase):
             case '6': self.add_event()
             case '7': self.update_event()
             case '8': self.delete_event()
+            case '9': self.search_events()
 
-            case '9': self.register_user_to_event()
-            case '10': self.update_user_event_registration_status()
-            case '11': self.unregister_user_from_event()
+            case '10': self.register_user_to_event()
+            case '11': self.update_user_event_registration_status()
+            case '12': self.unregister_user_from_event()
 
-            case '12': sys.exit(0)
+            case '13': sys.exit(0)
 
             case _: print("\tInvalid Menu choice {choice}. Please try again.")
 
+        queries = self.app_services.get_query_stats().get("total", {}).get("calls", 0) - queries_before
+        self._logger.log_debug('Menu choice %s issued %s SQL statements', choice, queries)
+
     def list_users(self)->None:
         """ List all users. """
+        from prettytable import PrettyTable
         print("\tListing all users...")
-        users = self.app_services.get_all_users()
+        users = self.app_services.get_all_users(prefetch_events=True)
         users_table = PrettyTable()
         users_table.field_names = ["ID", "Full Name", "Email", "Phone", "Role", "Events"]
         events_table = PrettyTable()
@@ -94,7 +103,7 @@ class ConsoleUI(ApplicationBase):
             else:
                 print("\tFailed to create user.")
         except Exception as ex:
-            self._logger.log_error(f"Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
 
     def update_user(self)->None:
         """ Update an existing user. """
@@ -112,7 +121,7 @@ class ConsoleUI(ApplicationBase):
             else:
                 print(f"\tFailed to update user ID {user_id}.")
         except Exception as ex:
-            self._logger.log_error(f"Exception occurred: {ex}")    
+            self._logger.log_error("Exception occurred: %s", ex)    
 
     def delete_user(self)->None:
         """ Delete a user. """
@@ -126,18 +135,24 @@ class ConsoleUI(ApplicationBase):
             else:
                 print(f"\tFailed to delete user ID {user_id}.")
         except Exception as ex:
-            self._logger.log_error(f"Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
 
 
     def list_events(self)->None:
-        """ List all events. """
-        print("\tListing all events...")
-        events = self.app_services.get_all_events()
-        events_table = PrettyTable()
-        events_table.field_names = ["ID", "Title", "Description", "Location", "Starts At", "Ends At", "Capacity", "Created By", "Created At"]
-        for event in events:
-            events_table.add_row([event.id, event.title, event.description, event.location, event.starts_at, event.ends_at, event.capacity, event.created_by, event.created_at])
-        print(events_table)
+        """ List upcoming events, one page at a time, soonest first. """
+        from prettytable import PrettyTable
+        print("\tListing upcoming events...")
+        page_size = self.EVENTS_PAGE_SIZE
+        events = self.app_services.get_upcoming_events(limit=page_size)
+        while events:
+            events_table = PrettyTable()
+            events_table.field_names = ["ID", "Title", "Description", "Location", "Starts At", "Ends At", "Capacity", "Created By", "Created At"]
+            for event in events:
+                events_table.add_row([event.id, event.title, event.description, event.location, event.starts_at, event.ends_at, event.capacity, event.created_by, event.created_at])
+            print(events_table)
+            if len(events) < page_size or input("\tPress Enter for more events, or q to stop: ").strip().lower() == 'q':
+                break
+            events = self.app_services.get_upcoming_events(limit=page_size, after=events[-1])
 
     def add_event(self)->None:
         """ Add a new event. """
@@ -157,7 +172,7 @@ class ConsoleUI(ApplicationBase):
             else:
                 print("\tFailed to create event.")
         except Exception as ex:
-            self._logger.log_error(f"Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
 
     def update_event(self)->None:
         """ Update an existing event. """
@@ -178,7 +193,7 @@ class ConsoleUI(ApplicationBase):
                 print(f"\tFailed to update event ID {event_id}.")
 
         except Exception as ex:
-            self._logger.log_error(f"Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
 
     def delete_event(self)->None:
         """ Delete an event. """
@@ -192,7 +207,21 @@ class ConsoleUI(ApplicationBase):
             else:
                 print(f"\tFailed to delete event ID {event_id}.")
         except Exception as ex:
-            self._logger.log_error(f"Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
+
+    def search_events(self)->None:
+        """ Search events by title, location and description. """
+        from prettytable import PrettyTable
+        query = input("\tEnter search words: ")
+        events = self.app_services.search_events(query, limit=self.EVENTS_PAGE_SIZE)
+        if not events:
+            print(f"\tNo events match '{query}'.")
+            return
+        events_table = PrettyTable()
+        events_table.field_names = ["ID", "Title", "Location", "Starts At", "Ends At", "Capacity"]
+        for event in events:
+            events_table.add_row([event.id, event.title, event.location, event.starts_at, event.ends_at, event.capacity])
+        print(events_table)
 
     def register_user_to_event(self)->None:
         """ Register a user to an event. """
@@ -211,7 +240,7 @@ class ConsoleUI(ApplicationBase):
                 print(f"\tFailed to register User ID {user_id} to Event ID {event_id}.")
 
         except Exception as ex:
-            self._logger.log_error(f"Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
 
     def update_user_event_registration_status(self)->None:
         """ Update a user's event registration status. """
@@ -231,7 +260,7 @@ class ConsoleUI(ApplicationBase):
                 print(f"\tFailed to update registration status for User ID {user_id} and Event ID {event_id}.")
 
         except Exception as ex:
-            self._logger.log_error(f"Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
 
 
     def unregister_user_from_event(self)->None:
@@ -248,9 +277,13 @@ class ConsoleUI(ApplicationBase):
                 print(f"\tFailed to unregister User ID {user_id} from Event ID {event_id}.")
 
         except Exception as ex:
-            self._logger.log_error(f"Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
 
     def start(self)->None:
         while True:
             self.display_menu()
-            self.process_menu_choice()
\ No newline at end of file
+            try:
+                self.process_menu_choice()
+            except PoolError as ex:
+                self._logger.log_error("Database unavailable: %s", ex)
+                print("\tThe database is busy or unavailable. Please try again.")
\ No newline at end of file
@@ -2,7 +2,6 @@
 
 from volunteer_event_coordination.application_base import ApplicationBase
 from volunteer_event_coordination.service_layer.app_services import AppServices
-import inspect
 import json
 
 class UserInterface(ApplicationBase):
@@ -14,11 +13,11 @@ class UserInterface(ApplicationBase):
         super().__init__(subclass_name=self.__class__.__name__, 
 				   logfile_prefix_name=self.META["log_prefix"])
         self.DB = AppServices(config)
-        self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}:It works!')
+        self._logger.log_debug('It works!')
 
 
 
 
     def start(self):
         """Start main user interface."""
-        self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}: User interface started!')
\ No newline at end of file
+        self._logger.log_debug('User interface started!')
\ No newline at end of file
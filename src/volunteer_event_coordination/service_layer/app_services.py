@@ -1,11 +1,17 @@
 """Implements AppServices Class."""
 
 from volunteer_event_coordination.application_base import ApplicationBase
-from volunteer_event_coordination.persistence_layer.mysql_persistence_wrapper import MySQLPersistenceWrapper
+from volunteer_event_coordination.persistence_layer.storage_backend import create_storage_backend
+from volunteer_event_coordination.persistence_layer.connection_pool import PoolError
+from volunteer_event_coordination.service_layer.entity_cache import EntityCache
 from volunteer_event_coordination.infrastructure_layer.user import User
 from volunteer_event_coordination.infrastructure_layer.event import Event
-from typing import List
-import inspect
+from volunteer_event_coordination.infrastructure_layer.registration import Registration
+from volunteer_event_coordination.infrastructure_layer.batch_result import BatchResult
+from volunteer_event_coordination.infrastructure_layer.serialization import dump_json_array, dump_jsonl
+from datetime import datetime
+import copy
+from typing import BinaryIO, Iterator, List, Tuple
 
 class AppServices(ApplicationBase):
     """AppServices Class Definition."""
@@ -15,75 +21,199 @@ class AppServices(ApplicationBase):
         self.META = config["meta"]
         super().__init__(subclass_name=self.__class__.__name__, 
 				   logfile_prefix_name=self.META["log_prefix"])
-        self.DB = MySQLPersistenceWrapper(config)
-        self._logger.log_debug(f'{inspect.currentframe().f_code.co_name}:It works!')
+        self.DB = create_storage_backend(config)
+        self.CACHE = config.get("cache", {})
+        cache_size = self.CACHE.get("max_size", 10000) if self.CACHE.get("enabled", True) else 0
+        cache_ttl = self.CACHE.get("ttl_seconds", 30)
+        self._user_cache = EntityCache(cache_size, cache_ttl)
+        self._event_cache = EntityCache(cache_size, cache_ttl)
+        # Free/busy bitsets for find_available_volunteers, built on first use
+        self.AVAILABILITY = config.get("availability", {})
+        self._availability = None
+        # Inverted index for search_events, built on first use
+        self.SEARCH = config.get("search", {})
+        self._search = None
+        self._logger.log_debug('It works!')
     
-    def get_all_users(self)->List[User]:
-        """ Return a list of user objects. """
+    def get_all_users(self, prefetch_events:bool=False)->List[User]:
+        """ Return a list of user objects, with their events loaded up front if prefetch_events. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Retrieving all users from database.")
+        self._logger.log_debug("Retrieving all users from database.")
         user_dict = {}
         user_dict['users'] = []
 
         try:
-            results = self.DB.select_all_users()
+            results = self.DB.select_all_users(prefetch_events)
             return results
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
 
     def get_all_events(self)->List[Event]:
         """ Return a list of event objects. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Retrieving all events from database.")
+        self._logger.log_debug("Retrieving all events from database.")
         event_dict = {}
         event_dict['events'] = []
 
         try:
             results = self.DB.select_all_events()
             return results
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
+
+    def get_events_between(self, start:datetime, end:datetime, limit:int=None, after:Event=None)->List[Event]:
+        """ Return one page of the events starting at or after start and before end, earliest first.
+        Pass the last event of a page as after to get the next page.
+        """
+
+        self._logger.log_debug("Retrieving events starting from %s before %s.", start, end)
+
+        try:
+            return self.DB.select_events_between(start, end, limit, after)
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return []
+
+    def get_upcoming_events(self, limit:int=None, after:Event=None)->List[Event]:
+        """ Return one page of the events that have not started yet, soonest first. """
+
+        self._logger.log_debug("Retrieving upcoming events.")
+
+        try:
+            return self.DB.select_upcoming_events(limit, after)
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return []
+
+    def get_events_by_location(self, location:str, start:datetime=None, end:datetime=None, limit:int=None, after:Event=None)->List[Event]:
+        """ Return one page of the events at a location, optionally within a start time range, earliest first. """
+
+        self._logger.log_debug("Retrieving events at %s.", location)
+
+        try:
+            return self.DB.select_events_by_location(location, start, end, limit, after)
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return []
+
+    def iter_users(self, page_size:int=None, prefetch_events:bool=False)->Iterator[User]:
+        """ Stream user objects from the database in constant memory. """
+
+        self._logger.log_debug("Streaming all users from database.")
+
+        try:
+            yield from self.DB.iter_users(page_size, prefetch_events)
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+
+    def iter_events(self, page_size:int=None)->Iterator[Event]:
+        """ Stream event objects from the database in constant memory. """
+
+        self._logger.log_debug("Streaming all events from database.")
+
+        try:
+            yield from self.DB.iter_events(page_size)
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+
+    def iter_registrations(self, page_size:int=None)->Iterator[Registration]:
+        """ Stream registration objects from the database in constant memory. """
+
+        self._logger.log_debug("Streaming all registrations from database.")
+
+        try:
+            yield from self.DB.iter_registrations(page_size)
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+
+    def export_users(self, fp:BinaryIO, json_lines:bool=True, page_size:int=None)->int:
+        """ Stream every user, with their registered events, to a binary file as JSON Lines or a JSON array. """
+
+        self._logger.log_debug("Exporting all users.")
+
+        try:
+            users = self.iter_users(page_size, prefetch_events=True)
+            return dump_jsonl(users, fp) if json_lines else dump_json_array(users, fp)
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return 0
+
+    def export_events(self, fp:BinaryIO, json_lines:bool=True, page_size:int=None)->int:
+        """ Stream every event to a binary file as JSON Lines or a JSON array. """
+
+        self._logger.log_debug("Exporting all events.")
+
+        try:
+            events = self.iter_events(page_size)
+            return dump_jsonl(events, fp) if json_lines else dump_json_array(events, fp)
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return 0
 
     def get_user_by_id(self, user_id:int)->User:
         """ Return a user object by ID. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Retrieving user id {user_id} from database.")
+        self._logger.log_debug("Retrieving user id %s from database.", user_id)
 
         try:
-            result = self.DB.select_user_by_id(user_id)
-            return result
+            return self._get_user(user_id)
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return None
 
     def get_event_by_id(self, event_id:int)->Event:
         """ Return an event object by ID. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Retrieving event id {event_id} from database.")
+        self._logger.log_debug("Retrieving event id %s from database.", event_id)
 
         try:
-            result = self.DB.select_event_by_id(event_id)
-            return result
+            return self._get_event(event_id)
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return None
     
     def get_registered_events_for_user_id(self, user_id:int):
         """ Return a list of event objects for a given user ID. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Retrieving registered events for user id {user_id} from database.")
+        self._logger.log_debug("Retrieving registered events for user id %s from database.", user_id)
 
         try:
             results = self.DB.select_all_events_for_user_id(user_id)
             return results
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return []
         
     def create_user(self, full_name:str, email:str, phone:str, role:str)->User:
         """ Create a new user in the database. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Creating new user {full_name}.")
+        self._logger.log_debug("Creating new user %s.", full_name)
 
         try:
             user = User()
@@ -93,21 +223,24 @@ class AppServices(ApplicationBase):
             user.role = role
             inserted_user = self.DB.insert_user(user)
             if inserted_user:
+                if self._availability is not None and role == 'volunteer':
+                    self._availability.add_users([user.id])
                 return user
             return None
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return None
         
     def create_event(self, title:str, description:str, location:str, starts_at:str, ends_at:str, capacity:int, created_by:int):
         """ Create a new event in the database. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Creating new event {title}.")
+        self._logger.log_debug("Creating new event %s.", title)
 
         try:
-            user = self.DB.select_user_by_id(created_by)
-            if not user:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Creator user id {created_by} does not exist.")
+            if not self._user_exists(created_by):
+                self._logger.log_error("Creator user id %s does not exist.", created_by)
                 return None
             event = Event()
             event.title = title
@@ -119,44 +252,127 @@ class AppServices(ApplicationBase):
             event.created_by = created_by
             inserted_event = self.DB.insert_event(event)
             if inserted_event:
+                if self._search is not None:
+                    self._search.add(event)
                 return event
             return None
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return None
+
+    def create_users_many(self, users:List[User])->BatchResult:
+        """ Create many users in batched transactions. """
+
+        self._logger.log_debug("Creating %s users.", len(users))
+
+        try:
+            result = self.DB.insert_users_many(users)
+            if self._availability is not None:
+                self._availability.add_users([user.id for user in users if user.id and user.role == 'volunteer'])
+            return result
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
+            return None
+
+    def create_events_many(self, events:List[Event])->BatchResult:
+        """ Create many events in batched transactions. """
+
+        self._logger.log_debug("Creating %s events.", len(events))
+
+        try:
+            result = self.DB.insert_events_many(events)
+            if self._search is not None:
+                for event in events:
+                    if event.id:
+                        self._search.add(event)
+            return result
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return None
+
+    def register_many(self, registrations:List[Registration])->BatchResult:
+        """ Register many users to events in batched transactions.
+        A 'registered' row that overlaps another event the user is registered to, or an earlier
+        row of the batch, is not written and is reported as a failure.
+        """
+
+        self._logger.log_debug("Creating %s registrations.", len(registrations))
+
+        try:
+            conflicts = self._find_batch_schedule_conflicts(registrations)
+            accepted = [index for index in range(len(registrations)) if index not in conflicts]
+            written = self.DB.register_many([registrations[index] for index in accepted])
+            for registration in registrations:
+                self._user_cache.invalidate(registration.user_id)
+            self._availability = None
+            if not conflicts:
+                return written
+            result = BatchResult()
+            result.succeeded = written.succeeded
+            result.ids = [None] * len(registrations)
+            for index, registration_id in zip(accepted, written.ids):
+                result.ids[index] = registration_id
+            result.failures = sorted([(accepted[offset], reason) for offset, reason in written.failures]
+                                     + [(index, f"Overlaps event id {other_event_id} already registered to the user")
+                                        for index, other_event_id in conflicts.items()])
+            return result
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
             return None
 
     def update_user(self, user_id:int, full_name:str, email:str, phone:str, role:str)->User:
         """ Update an existing user in the database. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Updating user id {user_id}.")
+        self._logger.log_debug("Updating user id %s.", user_id)
 
         try:
-            user = self.DB.select_user_by_id(user_id)
+            user = self._get_user(user_id)
             if not user:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: User id {user_id} does not exist.")
+                self._logger.log_error("User id %s does not exist.", user_id)
                 return False
+            # Edit a copy so the cached user, and anyone holding it, never sees unsaved changes
+            self._user_cache.invalidate(user_id)
+            user = copy.copy(user)
             if full_name != "": user.full_name = full_name
             if email != "": user.email = email
             if phone != "": user.phone = phone
-            if role != "": user.role = role
+            if role != "":
+                user.role = role
+                self._availability = None
             updated_user = self.DB.update_user(user)
             if updated_user is None:
                 return None
             return user
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return None
 
     def update_event(self, event_id:int, title:str, description:str, location:str, starts_at:str, ends_at:str, capacity:str)->Event:
         """ Update an existing event in the database. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Updating event id {event_id}.")
+        self._logger.log_debug("Updating event id %s.", event_id)
 
         try:
-            event = self.DB.select_event_by_id(event_id)
+            event = self._get_event(event_id)
             if not event:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Event id {event_id} does not exist.")
+                self._logger.log_error("Event id %s does not exist.", event_id)
                 return False
+            # Edit a copy so the cached event, and anyone holding it, never sees unsaved changes
+            self._event_cache.invalidate(event_id)
+            event = copy.copy(event)
+            # Cached users hold their own copies of registered events
+            self._user_cache.clear()
+            self._availability = None
             if title != "": event.title = title
             if description != "": event.description = description
             if location != "": event.location = location
@@ -166,100 +382,373 @@ class AppServices(ApplicationBase):
             updated_event = self.DB.update_event(event)
             if updated_event is None:
                 return None
+            if updated_event and self._search is not None:
+                self._search.add(event)
             return event
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return None
         
     def delete_user(self, user_id:int)->bool:
         """ Delete a user from the database. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Deleting user id {user_id}.")
+        self._logger.log_debug("Deleting user id %s.", user_id)
 
         try:
-            user = self.DB.select_user_by_id(user_id)
-            if not user:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: User id {user_id} does not exist.")
+            if not self._user_exists(user_id):
+                self._logger.log_error("User id %s does not exist.", user_id)
                 return False
             deleted = self.DB.delete_user(user_id)
+            self._user_cache.invalidate(user_id)
+            if deleted and self._availability is not None:
+                self._availability.remove_user(user_id)
+            # Events created by the user now have created_by set to NULL
+            self._event_cache.clear()
             return deleted
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return False
         
     def delete_event(self, event_id:int)->bool:
         """ Delete an event from the database. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Deleting event id {event_id}.")
+        self._logger.log_debug("Deleting event id %s.", event_id)
 
         try:
-            event = self.DB.select_event_by_id(event_id)
-            if not event:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Event id {event_id} does not exist.")
+            if not self._event_exists(event_id):
+                self._logger.log_error("Event id %s does not exist.", event_id)
                 return False
             deleted = self.DB.delete_event(event_id)
+            self._event_cache.invalidate(event_id)
+            # Registrations for the event were deleted along with it
+            self._user_cache.clear()
+            self._availability = None
+            if deleted and self._search is not None:
+                self._search.remove(event_id)
             return deleted
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return False
 
     def register_user_to_event(self, user_id:int, event_id:int, status:str)->bool:
-        """ Register a user to an event. """
+        """ Register a user to an event.
+        A 'registered' status is refused when it overlaps another event the user is registered to.
+        """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Registering user id {user_id} to event id {event_id}.")
+        self._logger.log_debug("Registering user id %s to event id %s.", user_id, event_id)
 
         try:
-            user = self.DB.select_user_by_id(user_id)
-            if not user:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: User id {user_id} does not exist.")
+            user_exists, event_exists = self._validate_user_and_event(user_id, event_id)
+            if not user_exists:
+                self._logger.log_error("User id %s does not exist.", user_id)
                 return False
-            event = self.DB.select_event_by_id(event_id)
-            if not event:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Event id {event_id} does not exist.")
+            if not event_exists:
+                self._logger.log_error("Event id %s does not exist.", event_id)
+                return False
+            if status == 'registered' and self._has_schedule_conflict(user_id, event_id):
                 return False
             registered = self.DB.register_user_to_event(user_id, event_id, status)
+            self._user_cache.invalidate(user_id)
+            if registered and status == 'registered':
+                event = self._get_event(event_id)
+                if event is not None:
+                    self._mark_busy(user_id, [event])
             return registered
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return False
         
     def update_user_event_registration_status(self, user_id:int, event_id:int, status:str)->bool:
-        """ Update a user's registration status for an event. """
+        """ Update a user's registration status for an event.
+        Changing it to 'registered' is refused when the event overlaps another event the user is registered to.
+        """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Updating registration status for user id {user_id} to event id {event_id}.")
+        self._logger.log_debug("Updating registration status for user id %s to event id %s.", user_id, event_id)
 
         try:
-            user = self.DB.select_user_by_id(user_id)
-            if not user:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: User id {user_id} does not exist.")
+            user_exists, event_exists = self._validate_user_and_event(user_id, event_id)
+            if not user_exists:
+                self._logger.log_error("User id %s does not exist.", user_id)
                 return False
-            event = self.DB.select_event_by_id(event_id)
-            if not event:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Event id {event_id} does not exist.")
+            if not event_exists:
+                self._logger.log_error("Event id %s does not exist.", event_id)
+                return False
+            if status == 'registered' and self._has_schedule_conflict(user_id, event_id):
                 return False
             updated = self.DB.update_user_event_registration_status(user_id, event_id, status)
+            self._user_cache.invalidate(user_id)
+            if updated:
+                self._refresh_availability(user_id)
             return updated
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return False
 
     def unregister_user_from_event(self, user_id:int, event_id:int)->bool:  
         """ Unregister a user from an event. """
 
-        self._logger.log_debug(f"{inspect.currentframe().f_code.co_name}: Unregistering user id {user_id} from event id {event_id}.")
+        self._logger.log_debug("Unregistering user id %s from event id %s.", user_id, event_id)
 
         try:
-            user = self.DB.select_user_by_id(user_id)
-            if not user:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: User id {user_id} does not exist.")
+            user_exists, event_exists = self._validate_user_and_event(user_id, event_id)
+            if not user_exists:
+                self._logger.log_error("User id %s does not exist.", user_id)
                 return False
-            event = self.DB.select_event_by_id(event_id)
-            if not event:
-                self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Event id {event_id} does not exist.")
+            if not event_exists:
+                self._logger.log_error("Event id %s does not exist.", event_id)
                 return False
             unregistered = self.DB.unregister_user_from_event(user_id, event_id)
+            self._user_cache.invalidate(user_id)
+            if unregistered:
+                self._refresh_availability(user_id)
             return unregistered
+        except PoolError:
+            raise
         except Exception as ex:
-            self._logger.log_error(f"{inspect.currentframe().f_code.co_name}: Exception occurred: {ex}")
+            self._logger.log_error("Exception occurred: %s", ex)
             return False
 
+    def count_registrations(self, event_id:int, status:str=None)->int:
+        """ Return the number of registrations for an event, optionally filtered by status. """
+
+        self._logger.log_debug("Counting registrations for event id %s.", event_id)
+
+        try:
+            return self.DB.count_registrations(event_id, status)
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return 0
+
+    def get_event_frame(self):
+        """ Return all events as a columnar EventFrame for analytics. """
+
+        self._logger.log_debug("Retrieving event frame from database.")
+
+        try:
+            return self.DB.select_event_frame()
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return None
+
+    def get_registration_frame(self):
+        """ Return all registrations as a columnar RegistrationFrame for analytics. """
+
+        self._logger.log_debug("Retrieving registration frame from database.")
+
+        try:
+            return self.DB.select_registration_frame()
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return None
+
+    def get_schedule_conflicts(self, user_id:int, event_id:int)->List[Event]:
+        """ Return the events a user is registered to whose time overlaps an event, earliest first. """
+
+        self._logger.log_debug("Checking schedule conflicts for user id %s and event id %s.", user_id, event_id)
+
+        try:
+            return self.DB.select_conflicting_events(user_id, event_id)
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return []
+
+    def get_schedule_conflict_report(self)->List[Tuple[int, int, int]]:
+        """ Return every (user_id, event_id, other_event_id) pair of overlapping events a volunteer is registered to.
+        Built by a sweep over all registrations sorted by user and start time.
+        """
+
+        self._logger.log_debug("Building schedule conflict report.")
+
+        try:
+            events = self.DB.select_event_frame()
+            registrations = self.DB.select_registration_frame()
+            user_ids, event_ids, other_event_ids = events.schedule_conflicts(registrations)
+            return list(zip(user_ids.tolist(), event_ids.tolist(), other_event_ids.tolist()))
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return []
+
+    def search_events(self, query:str, limit:int=20)->List[Event]:
+        """ Return the events whose title, location or description best match query, best first.
+        Every query word also matches the words it begins; ranking is BM25 over an in-memory inverted index.
+        """
+
+        self._logger.log_debug("Searching events for %s.", query)
+
+        try:
+            event_ids = self._get_search_index().search(query, limit)
+            events_by_id = {event.id: event for event in self.DB.select_events_in(event_ids)}
+            return [events_by_id[event_id] for event_id in event_ids if event_id in events_by_id]
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return []
+
+    def find_available_volunteers(self, starts_at:datetime, ends_at:datetime, limit:int=None)->List[User]:
+        """ Return the volunteers with no registered event between starts_at and ends_at, by user id.
+        Answered from in-memory free/busy bitsets at availability.slot_minutes resolution.
+        """
+
+        self._logger.log_debug("Finding volunteers available from %s to %s.", starts_at, ends_at)
+
+        try:
+            if ends_at <= starts_at:
+                self._logger.log_error("Availability window %s to %s is empty.", starts_at, ends_at)
+                return []
+            user_ids = self._get_availability_index().free_user_ids(starts_at, ends_at, limit)
+            return self.DB.select_users_in(user_ids.tolist())
+        except PoolError:
+            raise
+        except Exception as ex:
+            self._logger.log_error("Exception occurred: %s", ex)
+            return []
+
+    def get_cache_stats(self)->dict:
+        """ Return hit/miss/eviction counters for the user and event caches. """
+
+        return {"users": self._user_cache.stats(), "events": self._event_cache.stats()}
+
+    def get_pool_stats(self)->dict:
+        """ Return in-use/idle/waiter gauges and checkout latency for the connection pool. """
+
+        return self.DB.get_pool_stats()
+
+    def get_query_stats(self, reset:bool=False)->dict:
+        """ Return per-statement call counts, rows and latency histograms from the storage backend. """
+
+        return self.DB.get_query_stats(reset)
+
+    ##### Private Utility Methods #####
+
+    def _get_user(self, user_id:int)->User:
+        """ Return a user from the cache, reading through to the database on a miss. """
+
+        user = self._user_cache.get(user_id)
+        if user is None:
+            user = self.DB.select_user_by_id(user_id)
+            self._user_cache.put(user_id, user)
+        return user
+
+    def _get_event(self, event_id:int)->Event:
+        """ Return an event from the cache, reading through to the database on a miss. """
+
+        event = self._event_cache.get(event_id)
+        if event is None:
+            event = self.DB.select_event_by_id(event_id)
+            self._event_cache.put(event_id, event)
+        return event
+
+    def _has_schedule_conflict(self, user_id:int, event_id:int)->bool:
+        """ Return True, logging the clashing events, if the event overlaps one the user is registered to. """
+
+        conflicts = self.DB.select_conflicting_events(user_id, event_id)
+        if conflicts:
+            self._logger.log_warning("Event id %s overlaps event ids %s already registered to user id %s.",
+                                     event_id, [event.id for event in conflicts], user_id)
+        return bool(conflicts)
+
+    def _find_batch_schedule_conflicts(self, registrations:List[Registration])->dict:
+        """ Return {index: id of the overlapped event} for the 'registered' rows of a batch that overlap
+        an event the user is registered to or an earlier row of the batch, logging each one.
+        """
+
+        indexes = [index for index, registration in enumerate(registrations) if registration.status == 'registered']
+        if not indexes:
+            return {}
+        events = self.DB.select_event_frame()
+        conflicts = events.new_registration_conflicts(self.DB.select_registration_frame(),
+                                                      [registrations[index].user_id for index in indexes],
+                                                      [registrations[index].event_id for index in indexes])
+        conflicts = {indexes[offset]: other_event_id for offset, other_event_id in conflicts.items()}
+        for index, other_event_id in conflicts.items():
+            self._logger.log_warning("Event id %s overlaps event id %s already registered to user id %s.",
+                                     registrations[index].event_id, other_event_id, registrations[index].user_id)
+        return conflicts
+
+    def _get_search_index(self)->'EventSearchIndex':
+        """ Return the event search index, rebuilding it from the events when missing or older than max_age_seconds.
+        Changes made through this service are applied as they happen; the rebuild picks up other writers.
+        """
+        from volunteer_event_coordination.service_layer.search_index import EventSearchIndex
+
+        index = self._search
+        if index is None or index.age_seconds() > self.SEARCH.get("max_age_seconds", 3600):
+            self._logger.log_debug("Building event search index.")
+            index = EventSearchIndex.from_events(self.DB.iter_events())
+            self._search = index
+        return index
+
+    def _get_availability_index(self)->'AvailabilityIndex':
+        """ Return the free/busy index, rebuilding it from the frames when missing or older than max_age_seconds.
+        Changes made through this service are applied as they happen; the rebuild picks up other writers.
+        """
+        from volunteer_event_coordination.service_layer.availability_index import AvailabilityIndex
+
+        index = self._availability
+        if index is None or index.age_seconds() > self.AVAILABILITY.get("max_age_seconds", 300):
+            self._logger.log_debug("Building availability index.")
+            index = AvailabilityIndex.from_frames(self.DB.select_user_ids('volunteer'), self.DB.select_event_frame(),
+                                                  self.DB.select_registration_frame(), self.AVAILABILITY.get("slot_minutes", 30))
+            self._availability = index
+        return index
+
+    def _mark_busy(self, user_id:int, events:List[Event])->None:
+        """ Mark a user busy during events in the free/busy index, if it is built. """
+
+        index = self._availability
+        if index is not None and events:
+            index.mark_busy([user_id] * len(events), [event.starts_at for event in events], [event.ends_at for event in events])
+
+    def _refresh_availability(self, user_id:int)->None:
+        """ Rebuild a user's free/busy row from their registered events, if the index is built. """
+
+        index = self._availability
+        if index is not None:
+            user = self.DB.select_user_by_id(user_id, prefetch_events=True)
+            index.clear_user(user_id)
+            if user is not None:
+                self._mark_busy(user_id, [event for event in user.events if event.registration_status == 'registered'])
+
+    def _user_exists(self, user_id:int)->bool:
+        """ Return True if the user is cached or exists in the database. """
+
+        return self._user_cache.get(user_id) is not None or self.DB.user_exists(user_id)
+
+    def _event_exists(self, event_id:int)->bool:
+        """ Return True if the event is cached or exists in the database. """
+
+        return self._event_cache.get(event_id) is not None or self.DB.event_exists(event_id)
+
+    def _validate_user_and_event(self, user_id:int, event_id:int)->Tuple[bool, bool]:
+        """ Return whether the user and event exist, answering from the caches when possible. """
+
+        user_cached = self._user_cache.get(user_id) is not None
+        event_cached = self._event_cache.get(event_id) is not None
+        if user_cached and event_cached:
+            return True, True
+        if user_cached:
+            return True, self.DB.event_exists(event_id)
+        if event_cached:
+            return self.DB.user_exists(user_id), True
+        return self.DB.validate_user_and_event(user_id, event_id)
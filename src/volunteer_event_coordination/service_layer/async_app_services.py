@@ -0,0 +1,203 @@
+"""Implements AsyncAppServices Class."""
+
+from volunteer_event_coordination.application_base import ApplicationBase
+from volunteer_event_coordination.service_layer.app_services import AppServices
+from volunteer_event_coordination.persistence_layer.async_mysql_persistence_wrapper import AsyncMySQLPersistenceWrapper, iterate_in_executor, run_in_executor
+from volunteer_event_coordination.infrastructure_layer.user import User
+from volunteer_event_coordination.infrastructure_layer.event import Event
+from volunteer_event_coordination.infrastructure_layer.registration import Registration
+from volunteer_event_coordination.infrastructure_layer.batch_result import BatchResult
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import AsyncIterator, BinaryIO, Callable, Iterator, List, Tuple
+
+class AsyncAppServices(ApplicationBase):
+    """AsyncAppServices Class Definition.
+
+    Exposes the AppServices method surface as coroutines. Calls run the synchronous
+    service methods (validation, caching and persistence) on a thread pool bounded
+    by the connection pool size, which it shares with self.DB, an
+    AsyncMySQLPersistenceWrapper over the same connection pool.
+    """
+    def __init__(self, config:dict, app_services:AppServices=None)->None:
+        """Initializes object. """
+        self._config_dict = config
+        self.META = config["meta"]
+        super().__init__(subclass_name=self.__class__.__name__,
+				   logfile_prefix_name=self.META["log_prefix"])
+        self.app_services = app_services or AppServices(config)
+        database = config["database"]
+        self._executor = ThreadPoolExecutor(
+            max_workers=database.get("async_max_workers", database["pool"].get("max_size", database["pool"]["size"])),
+            thread_name_prefix=self.__class__.__name__)
+        self.DB = AsyncMySQLPersistenceWrapper(config, self.app_services.DB, self._executor)
+        self._logger.log_debug('It works!')
+
+    async def get_all_users(self, prefetch_events:bool=False)->List[User]:
+        """ Return a list of user objects, with their events loaded up front if prefetch_events. """
+        return await self._run(self.app_services.get_all_users, prefetch_events)
+
+    async def get_all_events(self)->List[Event]:
+        """ Return a list of event objects. """
+        return await self._run(self.app_services.get_all_events)
+
+    async def get_events_between(self, start:datetime, end:datetime, limit:int=None, after:Event=None)->List[Event]:
+        """ Return one page of the events starting at or after start and before end, earliest first.
+        Pass the last event of a page as after to get the next page.
+        """
+        return await self._run(self.app_services.get_events_between, start, end, limit, after)
+
+    async def get_upcoming_events(self, limit:int=None, after:Event=None)->List[Event]:
+        """ Return one page of the events that have not started yet, soonest first. """
+        return await self._run(self.app_services.get_upcoming_events, limit, after)
+
+    async def get_events_by_location(self, location:str, start:datetime=None, end:datetime=None, limit:int=None, after:Event=None)->List[Event]:
+        """ Return one page of the events at a location, optionally within a start time range, earliest first. """
+        return await self._run(self.app_services.get_events_by_location, location, start, end, limit, after)
+
+    async def iter_users(self, page_size:int=None, prefetch_events:bool=False)->AsyncIterator[User]:
+        """ Stream user objects from the database in constant memory. """
+        async for user in self._iterate(self.app_services.iter_users(page_size, prefetch_events), page_size):
+            yield user
+
+    async def iter_events(self, page_size:int=None)->AsyncIterator[Event]:
+        """ Stream event objects from the database in constant memory. """
+        async for event in self._iterate(self.app_services.iter_events(page_size), page_size):
+            yield event
+
+    async def iter_registrations(self, page_size:int=None)->AsyncIterator[Registration]:
+        """ Stream registration objects from the database in constant memory. """
+        async for registration in self._iterate(self.app_services.iter_registrations(page_size), page_size):
+            yield registration
+
+    async def export_users(self, fp:BinaryIO, json_lines:bool=True, page_size:int=None)->int:
+        """ Stream every user, with their registered events, to a binary file as JSON Lines or a JSON array. """
+        return await self._run(self.app_services.export_users, fp, json_lines, page_size)
+
+    async def export_events(self, fp:BinaryIO, json_lines:bool=True, page_size:int=None)->int:
+        """ Stream every event to a binary file as JSON Lines or a JSON array. """
+        return await self._run(self.app_services.export_events, fp, json_lines, page_size)
+
+    async def get_user_by_id(self, user_id:int)->User:
+        """ Return a user object by ID. """
+        return await self._run(self.app_services.get_user_by_id, user_id)
+
+    async def get_event_by_id(self, event_id:int)->Event:
+        """ Return an event object by ID. """
+        return await self._run(self.app_services.get_event_by_id, event_id)
+
+    async def get_registered_events_for_user_id(self, user_id:int):
+        """ Return a list of event objects for a given user ID. """
+        return await self._run(self.app_services.get_registered_events_for_user_id, user_id)
+
+    async def create_user(self, full_name:str, email:str, phone:str, role:str)->User:
+        """ Create a new user in the database. """
+        return await self._run(self.app_services.create_user, full_name, email, phone, role)
+
+    async def create_event(self, title:str, description:str, location:str, starts_at:str, ends_at:str, capacity:int, created_by:int)->Event:
+        """ Create a new event in the database. """
+        return await self._run(self.app_services.create_event, title, description, location, starts_at, ends_at, capacity, created_by)
+
+    async def create_users_many(self, users:List[User])->BatchResult:
+        """ Create many users in batched transactions. """
+        return await self._run(self.app_services.create_users_many, users)
+
+    async def create_events_many(self, events:List[Event])->BatchResult:
+        """ Create many events in batched transactions. """
+        return await self._run(self.app_services.create_events_many, events)
+
+    async def register_many(self, registrations:List[Registration])->BatchResult:
+        """ Register many users to events in batched transactions. """
+        return await self._run(self.app_services.register_many, registrations)
+
+    async def update_user(self, user_id:int, full_name:str, email:str, phone:str, role:str)->User:
+        """ Update an existing user in the database. """
+        return await self._run(self.app_services.update_user, user_id, full_name, email, phone, role)
+
+    async def update_event(self, event_id:int, title:str, description:str, location:str, starts_at:str, ends_at:str, capacity:str)->Event:
+        """ Update an existing event in the database. """
+        return await self._run(self.app_services.update_event, event_id, title, description, location, starts_at, ends_at, capacity)
+
+    async def delete_user(self, user_id:int)->bool:
+        """ Delete a user from the database. """
+        return await self._run(self.app_services.delete_user, user_id)
+
+    async def delete_event(self, event_id:int)->bool:
+        """ Delete an event from the database. """
+        return await self._run(self.app_services.delete_event, event_id)
+
+    async def register_user_to_event(self, user_id:int, event_id:int, status:str)->bool:
+        """ Register a user to an event.
+        A 'registered' status is refused when it overlaps another event the user is registered to.
+        """
+        return await self._run(self.app_services.register_user_to_event, user_id, event_id, status)
+
+    async def update_user_event_registration_status(self, user_id:int, event_id:int, status:str)->bool:
+        """ Update a user's registration status for an event.
+        Changing it to 'registered' is refused when the event overlaps another event the user is registered to.
+        """
+        return await self._run(self.app_services.update_user_event_registration_status, user_id, event_id, status)
+
+    async def unregister_user_from_event(self, user_id:int, event_id:int)->bool:
+        """ Unregister a user from an event. """
+        return await self._run(self.app_services.unregister_user_from_event, user_id, event_id)
+
+    async def count_registrations(self, event_id:int, status:str=None)->int:
+        """ Return the number of registrations for an event, optionally filtered by status. """
+        return await self._run(self.app_services.count_registrations, event_id, status)
+
+    async def get_event_frame(self):
+        """ Return all events as a columnar EventFrame for analytics. """
+        return await self._run(self.app_services.get_event_frame)
+
+    async def get_registration_frame(self):
+        """ Return all registrations as a columnar RegistrationFrame for analytics. """
+        return await self._run(self.app_services.get_registration_frame)
+
+    async def search_events(self, query:str, limit:int=20)->List[Event]:
+        """ Return the events whose title, location or description best match query, best first.
+        Every query word also matches the words it begins; ranking is BM25 over an in-memory inverted index.
+        """
+        return await self._run(self.app_services.search_events, query, limit)
+
+    async def find_available_volunteers(self, starts_at:datetime, ends_at:datetime, limit:int=None)->List[User]:
+        """ Return the volunteers with no registered event between starts_at and ends_at, by user id.
+        Answered from in-memory free/busy bitsets at availability.slot_minutes resolution.
+        """
+        return await self._run(self.app_services.find_available_volunteers, starts_at, ends_at, limit)
+
+    async def get_schedule_conflicts(self, user_id:int, event_id:int)->List[Event]:
+        """ Return the events a user is registered to whose time overlaps an event, earliest first. """
+        return await self._run(self.app_services.get_schedule_conflicts, user_id, event_id)
+
+    async def get_schedule_conflict_report(self)->List[Tuple[int, int, int]]:
+        """ Return every (user_id, event_id, other_event_id) pair of overlapping events a volunteer is registered to.
+        Built by a sweep over all registrations sorted by user and start time.
+        """
+        return await self._run(self.app_services.get_schedule_conflict_report)
+
+    def get_cache_stats(self)->dict:
+        """ Return cache counters; reads in-process state only, so it does not need the thread pool. """
+        return self.app_services.get_cache_stats()
+
+    def get_pool_stats(self)->dict:
+        """ Return connection pool gauges; reads in-process state only. """
+        return self.app_services.get_pool_stats()
+
+    def get_query_stats(self, reset:bool=False)->dict:
+        """ Return per-statement SQL stats; reads in-process state only. """
+        return self.app_services.get_query_stats(reset)
+
+    def close(self)->None:
+        """ Shut down the thread pool. """
+        self._executor.shutdown(wait=True)
+
+    ##### Private Utility Methods #####
+
+    async def _run(self, function:Callable, *args):
+        """ Run a synchronous service method on the bounded thread pool. """
+        return await run_in_executor(self._executor, function, *args)
+
+    def _iterate(self, iterator:Iterator, page_size:int=None)->AsyncIterator:
+        """ Drain a synchronous iterator on the thread pool one page at a time. """
+        return iterate_in_executor(self._executor, iterator, page_size or self.app_services.DB.PAGE_SIZE)
@@ -0,0 +1,176 @@
+"""Implements AvailabilityIndex Class."""
+
+from volunteer_event_coordination.infrastructure_layer.frames import EventFrame, RegistrationFrame, REGISTRATION_STATUS_CODES
+from datetime import datetime
+from threading import Lock
+from typing import Callable, Iterable
+import numpy as np
+import time
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+class AvailabilityIndex():
+    """Per-volunteer free/busy bitsets for answering "who is free between A and B?".
+
+    Time is cut into fixed slots (30 minutes by default). Each day with any
+    booking holds the sorted rows of the volunteers busy that day and a uint64
+    matrix with one bit per slot for each of them, so a query ANDs the busy
+    rows with a mask of the requested slots in a single vectorised operation
+    per day. Days before today are dropped. Bookings are rounded out to whole
+    slots: a volunteer busy until 9:10 is not offered for a shift from 9:20.
+    """
+
+    def __init__(self, slot_minutes:int=30, clock:Callable[[], float]=time.monotonic,
+                 now:Callable[[], datetime]=datetime.now)->None:
+        """Initializes object. slot_minutes must divide a day evenly."""
+        if slot_minutes <= 0 or SECONDS_PER_DAY % (slot_minutes * 60):
+            raise ValueError(f'slot_minutes must divide a day evenly, got {slot_minutes}')
+        self._slot_seconds = slot_minutes * 60
+        self._slots_per_day = SECONDS_PER_DAY // self._slot_seconds
+        self._words_per_day = -(-self._slots_per_day // 64)
+        self._clock = clock
+        self._now = now
+        self._lock = Lock()
+        self._rows = {}
+        # Row -> user ID; 0 marks the row of a removed user
+        self._user_ids = np.empty(0, dtype=np.int64)
+        # Days since the epoch -> (sorted busy rows, (busy rows, words per day) busy bits)
+        self._days = {}
+        # Days before this one have been dropped
+        self._first_day = None
+        self.built_at = clock()
+
+    @classmethod
+    def from_frames(cls, user_ids:Iterable[int], events:EventFrame, registrations:RegistrationFrame, slot_minutes:int=30)->'AvailabilityIndex':
+        """ Build from the volunteers' IDs and every 'registered' registration. """
+        index = cls(slot_minutes)
+        index.add_users(user_ids)
+        registered = registrations.status == REGISTRATION_STATUS_CODES['registered']
+        positions = events.positions(registrations.event_id[registered])
+        found = positions >= 0
+        index.mark_busy(registrations.user_id[registered][found], events.starts_at[positions[found]], events.ends_at[positions[found]])
+        return index
+
+    def __len__(self)->int:
+        return len(self._rows)
+
+    def add_users(self, user_ids:Iterable[int])->None:
+        """Add volunteers, free at all times, ignoring IDs already present."""
+        with self._lock:
+            new_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id not in self._rows]
+            for row, user_id in enumerate(new_ids, len(self._user_ids)):
+                self._rows[user_id] = row
+            self._user_ids = np.concatenate([self._user_ids, np.asarray(new_ids, dtype=np.int64)])
+
+    def remove_user(self, user_id:int)->None:
+        """Drop a volunteer; their row is cleared and never offered again."""
+        with self._lock:
+            row = self._rows.pop(user_id, None)
+            if row is not None:
+                self._user_ids[row] = 0
+                self._clear_row(row)
+
+    def clear_user(self, user_id:int)->None:
+        """Mark a volunteer free at all times, before re-marking their remaining bookings."""
+        with self._lock:
+            row = self._rows.get(user_id)
+            if row is not None:
+                self._clear_row(row)
+
+    def mark_busy(self, user_ids:np.ndarray, starts_at:np.ndarray, ends_at:np.ndarray)->None:
+        """Set the slots covered by each [starts_at, ends_at) booking; users not in the index are skipped."""
+        with self._lock:
+            rows = np.fromiter((self._rows.get(user_id, -1) for user_id in np.asarray(user_ids).tolist()), dtype=np.int64, count=len(user_ids))
+            known = rows >= 0
+            first, stop = self._slot_range(np.asarray(starts_at, dtype='datetime64[s]')[known], np.asarray(ends_at, dtype='datetime64[s]')[known])
+            counts = np.maximum(stop - first, 0)
+            # One entry per (row, slot) the bookings cover
+            rows = np.repeat(rows[known], counts)
+            slots = np.repeat(first, counts) + np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+            days, slots = np.divmod(slots, self._slots_per_day)
+            words, bits = np.divmod(slots, 64)
+            masks = np.left_shift(np.uint64(1), bits.astype(np.uint64))
+            today = self._evict_past_days()
+            current = days >= today
+            days, rows, words, masks = days[current], rows[current], words[current], masks[current]
+            order = np.argsort(days, kind='stable')
+            days, rows, words, masks = days[order], rows[order], words[order], masks[order]
+            bounds = np.flatnonzero(np.diff(days)) + 1
+            for start, end in zip(np.concatenate([[0], bounds]), np.concatenate([bounds, [len(days)]])):
+                if start == end:
+                    continue
+                self._merge_day(int(days[start]), rows[start:end], words[start:end], masks[start:end])
+
+    def free_user_ids(self, starts_at:datetime, ends_at:datetime, limit:int=None)->np.ndarray:
+        """Return the IDs, in ascending order, of the volunteers with no booking in [starts_at, ends_at)."""
+        first, stop = self._slot_range(np.array([starts_at], dtype='datetime64[s]'), np.array([ends_at], dtype='datetime64[s]'))
+        first, stop = int(first[0]), int(stop[0])
+        with self._lock:
+            self._evict_past_days()
+            busy = np.zeros(len(self._user_ids), dtype=bool)
+            for day in range(first // self._slots_per_day, (stop - 1) // self._slots_per_day + 1):
+                entry = self._days.get(day)
+                if entry is None:
+                    continue
+                rows, bits = entry
+                mask = self._day_mask(max(first - day * self._slots_per_day, 0), min(stop - day * self._slots_per_day, self._slots_per_day))
+                busy[rows[((bits & mask) != 0).any(axis=1)]] = True
+            free = np.sort(self._user_ids[~busy & (self._user_ids != 0)])
+        return free if limit is None else free[:limit]
+
+    def age_seconds(self)->float:
+        """Seconds since the index was built."""
+        return self._clock() - self.built_at
+
+    ##### Private Utility Methods #####
+
+    def _slot_range(self, starts_at:np.ndarray, ends_at:np.ndarray):
+        """First slot and one past the last slot of each interval, rounded out to whole slots."""
+        starts = starts_at.astype(np.int64)
+        ends = ends_at.astype(np.int64)
+        return starts // self._slot_seconds, -(-ends // self._slot_seconds)
+
+    def _merge_day(self, day:int, rows:np.ndarray, words:np.ndarray, masks:np.ndarray)->None:
+        """OR one day's (row, word, mask) bits into its busy rows."""
+        busy_rows, inverse = np.unique(rows, return_inverse=True)
+        bits = np.zeros((len(busy_rows), self._words_per_day), dtype=np.uint64)
+        np.bitwise_or.at(bits, (inverse, words), masks)
+        entry = self._days.get(day)
+        if entry is not None:
+            old_rows, old_bits = entry
+            merged_rows = np.union1d(old_rows, busy_rows)
+            merged = np.zeros((len(merged_rows), self._words_per_day), dtype=np.uint64)
+            merged[np.searchsorted(merged_rows, old_rows)] = old_bits
+            merged[np.searchsorted(merged_rows, busy_rows)] |= bits
+            busy_rows, bits = merged_rows, merged
+        self._days[day] = (busy_rows, bits)
+
+    def _evict_past_days(self)->int:
+        """Drop the days before today and return today; the caller holds the lock."""
+        today = int(np.datetime64(self._now(), 's').astype(np.int64)) // SECONDS_PER_DAY
+        if self._first_day != today:
+            for day in [day for day in self._days if day < today]:
+                del self._days[day]
+            self._first_day = today
+        return today
+
+    def _day_mask(self, first:int, stop:int)->np.ndarray:
+        """Words with the bits of slots first .. stop-1 of a day set."""
+        mask = np.zeros(self._words_per_day, dtype=np.uint64)
+        for word in range(self._words_per_day):
+            low = max(first - word * 64, 0)
+            high = min(stop - word * 64, 64)
+            if high > low:
+                mask[word] = np.uint64(((1 << (high - low)) - 1) << low)
+        return mask
+
+    def _clear_row(self, row:int)->None:
+        """Drop a row from every day it is busy on."""
+        for day, (rows, bits) in list(self._days.items()):
+            position = np.searchsorted(rows, row)
+            if position == len(rows) or rows[position] != row:
+                continue
+            if len(rows) == 1:
+                del self._days[day]
+            else:
+                self._days[day] = (np.delete(rows, position), np.delete(bits, position, axis=0))
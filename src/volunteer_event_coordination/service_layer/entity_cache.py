@@ -0,0 +1,82 @@
+"""Implements EntityCache Class."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable
+import time
+
+class EntityCache():
+    """Bounded in-process cache with LRU eviction, per-entry TTL and hit/miss/eviction counters."""
+
+    def __init__(self, max_size:int=10000, ttl_seconds:float=60.0, clock:Callable[[], float]=time.monotonic)->None:
+        """Initializes object. A max_size of 0 disables caching."""
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key:Hashable)->Any:
+        """Return the cached value for key, or None when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key:Hashable, value:Any)->None:
+        """Cache value under key, evicting the least recently used entries beyond max_size."""
+        if self._max_size <= 0 or value is None:
+            return
+        with self._lock:
+            self._entries[key] = (value, self._clock() + self._ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key:Hashable)->None:
+        """Drop the entry for key if present."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self)->None:
+        """Drop every entry."""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def __len__(self)->int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self)->dict:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "ttl_seconds": self._ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
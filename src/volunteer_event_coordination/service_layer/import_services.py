@@ -0,0 +1,328 @@
+"""Implements ImportServices Class."""
+
+from volunteer_event_coordination.application_base import ApplicationBase
+from volunteer_event_coordination.service_layer.app_services import AppServices
+from volunteer_event_coordination.infrastructure_layer.user import User
+from volunteer_event_coordination.infrastructure_layer.event import Event
+from volunteer_event_coordination.infrastructure_layer.registration import Registration
+from volunteer_event_coordination.infrastructure_layer.import_report import ImportReport
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Iterator, List, NamedTuple, Tuple
+import csv
+import json
+import os
+import time
+
+# Enum values from database/db_version_1/create_tables.sql
+USER_ROLES = ('admin', 'organizer', 'volunteer')
+REGISTRATION_STATUSES = ('registered', 'waitlist', 'cancelled')
+
+
+class MalformedLine(NamedTuple):
+    """A JSONL line that could not be parsed; validators send it to the rejects."""
+    text: str
+    error: str
+
+
+class ImportServices(ApplicationBase):
+    """ImportServices Class Definition."""
+    def __init__(self, config:dict, app_services:AppServices=None)->None:
+        """Initializes object. """
+        self._config_dict = config
+        self.META = config["meta"]
+        super().__init__(subclass_name=self.__class__.__name__,
+				   logfile_prefix_name=self.META["log_prefix"])
+        self.app_services = app_services or AppServices(config)
+        self.CHUNK_SIZE = config["database"].get("batch_size", 500)
+        self.PROGRESS_INTERVAL_SECONDS = 2.0
+        self._logger.log_debug('It works!')
+
+    def import_users(self, path:str, rejects_path:str, workers:int=None, chunk_size:int=None)->ImportReport:
+        """ Stream users from a CSV or JSONL file into the database. """
+
+        seen_emails = set()
+
+        def write_chunk(rows:List[Tuple[int, dict]], rejects:List[Tuple[int, dict, str]])->List[Tuple[int, dict]]:
+            users = []
+            written = []
+            for line_number, row in rows:
+                email = row['email'].lower()
+                if email in seen_emails:
+                    rejects.append((line_number, row, f"duplicate email {row['email']} in file"))
+                    continue
+                seen_emails.add(email)
+                user = User()
+                user.full_name = row['full_name']
+                user.email = row['email']
+                user.phone = row['phone']
+                user.role = row['role']
+                users.append(user)
+                written.append((line_number, row))
+            return self._bulk_write(self.app_services.create_users_many, users, written, rejects)
+
+        return self._run_import('users', path, rejects_path, validate_user_rows, write_chunk, workers, chunk_size)
+
+    def import_events(self, path:str, rejects_path:str, workers:int=None, chunk_size:int=None)->ImportReport:
+        """ Stream events from a CSV or JSONL file into the database. """
+
+        def write_chunk(rows:List[Tuple[int, dict]], rejects:List[Tuple[int, dict, str]])->List[Tuple[int, dict]]:
+            events = []
+            for line_number, row in rows:
+                event = Event()
+                event.title = row['title']
+                event.description = row['description']
+                event.location = row['location']
+                event.starts_at = row['starts_at']
+                event.ends_at = row['ends_at']
+                event.capacity = row['capacity']
+                event.created_by = row['created_by']
+                events.append(event)
+            return self._bulk_write(self.app_services.create_events_many, events, rows, rejects)
+
+        return self._run_import('events', path, rejects_path, validate_event_rows, write_chunk, workers, chunk_size)
+
+    def import_registrations(self, path:str, rejects_path:str, workers:int=None, chunk_size:int=None)->ImportReport:
+        """ Stream registrations from a CSV or JSONL file into the database. """
+
+        seen_pairs = set()
+
+        def write_chunk(rows:List[Tuple[int, dict]], rejects:List[Tuple[int, dict, str]])->List[Tuple[int, dict]]:
+            registrations = []
+            written = []
+            for line_number, row in rows:
+                pair = (row['event_id'], row['user_id'])
+                if pair in seen_pairs:
+                    rejects.append((line_number, row, f"duplicate registration of user {row['user_id']} to event {row['event_id']} in file"))
+                    continue
+                seen_pairs.add(pair)
+                registration = Registration()
+                registration.user_id = row['user_id']
+                registration.event_id = row['event_id']
+                registration.status = row['status']
+                registrations.append(registration)
+                written.append((line_number, row))
+            return self._bulk_write(self.app_services.register_many, registrations, written, rejects)
+
+        return self._run_import('registrations', path, rejects_path, validate_registration_rows, write_chunk, workers, chunk_size)
+
+    ##### Private Utility Methods #####
+
+    def _run_import(self, entity:str, path:str, rejects_path:str, validate:Callable, write_chunk:Callable, workers:int, chunk_size:int)->ImportReport:
+        """ Read, validate in a worker pool and bulk write one file, reporting progress. """
+
+        self._logger.log_info("Importing %s from %s.", entity, path)
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        report = ImportReport()
+        report.entity = entity
+        report.path = path
+        started = time.perf_counter()
+        last_progress = started
+
+        chunks = _chunked(_read_rows(path), chunk_size)
+        with open(rejects_path, 'a') as rejects_file:
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = _bounded_map(executor, validate, chunks, workers * 2)
+                    for valid, rejects in results:
+                        self._write_validated_chunk(entity, valid, rejects, write_chunk, rejects_file, report)
+                        last_progress = self._report_progress(report, started, last_progress)
+            else:
+                for chunk in chunks:
+                    valid, rejects = validate(chunk)
+                    self._write_validated_chunk(entity, valid, rejects, write_chunk, rejects_file, report)
+                    last_progress = self._report_progress(report, started, last_progress)
+
+        report.elapsed_seconds = time.perf_counter() - started
+        self._report_progress(report, started, None)
+        self._logger.log_info("Finished importing %s: %s", entity, report)
+        return report
+
+    def _write_validated_chunk(self, entity:str, valid:List[Tuple[int, dict]], rejects:List[Tuple[int, dict, str]], write_chunk:Callable, rejects_file, report:ImportReport)->None:
+        """ Bulk write the valid rows of one chunk and record every reject. """
+
+        report.rows_read += len(valid) + len(rejects)
+        if valid:
+            written = write_chunk(valid, rejects)
+            report.rows_imported += len(written)
+        for line_number, row, reason in rejects:
+            rejects_file.write(json.dumps({"entity": entity, "line": line_number, "row": row, "reason": reason}, default=str))
+            rejects_file.write('\n')
+        report.rows_rejected += len(rejects)
+
+    def _bulk_write(self, write_many:Callable, entities:List, rows:List[Tuple[int, dict]], rejects:List[Tuple[int, dict, str]])->List[Tuple[int, dict]]:
+        """ Write entities with a batch method and move failed rows to the rejects. """
+
+        if not entities:
+            return []
+        result = write_many(entities)
+        if result is None:
+            for line_number, row in rows:
+                rejects.append((line_number, row, "batch write failed"))
+            return []
+        failed = dict(result.failures)
+        for index, reason in result.failures:
+            line_number, row = rows[index]
+            rejects.append((line_number, row, reason))
+        return [row for index, row in enumerate(rows) if index not in failed]
+
+    def _report_progress(self, report:ImportReport, started:float, last_progress:float)->float:
+        """ Print a progress line at most every PROGRESS_INTERVAL_SECONDS, or always when last_progress is None. """
+
+        now = time.perf_counter()
+        if last_progress is not None and now - last_progress < self.PROGRESS_INTERVAL_SECONDS:
+            return last_progress
+        elapsed = now - started
+        rate = report.rows_read / elapsed if elapsed > 0 else 0.0
+        print(f"\t{report.entity}: {report.rows_read} read, {report.rows_imported} imported, "
+              f"{report.rows_rejected} rejected, {rate:,.0f} rows/s")
+        return now
+
+
+##### Worker Functions #####
+# Module level so that ProcessPoolExecutor can pickle them.
+
+def validate_user_rows(chunk:List[Tuple[int, dict]])->Tuple[List[Tuple[int, dict]], List[Tuple[int, dict, str]]]:
+    """Validate and normalize a chunk of user rows."""
+    valid = []
+    rejects = []
+    for line_number, row in chunk:
+        reject = _reject_unusable_row(line_number, row)
+        if reject:
+            rejects.append(reject)
+            continue
+        full_name = _text(row.get('full_name'))
+        email = _text(row.get('email'))
+        phone = _text(row.get('phone')) or None
+        role = _text(row.get('role')) or 'volunteer'
+        if not full_name or len(full_name) > 120:
+            rejects.append((line_number, row, "full_name is required and at most 120 characters"))
+        elif not email or len(email) > 160 or '@' not in email:
+            rejects.append((line_number, row, "email is required, at most 160 characters and must contain '@'"))
+        elif phone and len(phone) > 30:
+            rejects.append((line_number, row, "phone is at most 30 characters"))
+        elif role not in USER_ROLES:
+            rejects.append((line_number, row, f"role must be one of {', '.join(USER_ROLES)}"))
+        else:
+            valid.append((line_number, {'full_name': full_name, 'email': email, 'phone': phone, 'role': role}))
+    return valid, rejects
+
+def validate_event_rows(chunk:List[Tuple[int, dict]])->Tuple[List[Tuple[int, dict]], List[Tuple[int, dict, str]]]:
+    """Validate and normalize a chunk of event rows."""
+    valid = []
+    rejects = []
+    for line_number, row in chunk:
+        reject = _reject_unusable_row(line_number, row)
+        if reject:
+            rejects.append(reject)
+            continue
+        title = _text(row.get('title'))
+        location = _text(row.get('location')) or None
+        try:
+            starts_at = _datetime(row.get('starts_at'))
+            ends_at = _datetime(row.get('ends_at'))
+            capacity = int(row.get('capacity') or 0)
+            created_by = _optional_int(row.get('created_by'))
+        except (TypeError, ValueError) as ex:
+            rejects.append((line_number, row, str(ex)))
+            continue
+        if not title or len(title) > 150:
+            rejects.append((line_number, row, "title is required and at most 150 characters"))
+        elif location and len(location) > 150:
+            rejects.append((line_number, row, "location is at most 150 characters"))
+        elif not starts_at < ends_at:
+            rejects.append((line_number, row, "starts_at must be before ends_at"))
+        elif capacity < 0:
+            rejects.append((line_number, row, "capacity must not be negative"))
+        else:
+            valid.append((line_number, {'title': title, 'description': _text(row.get('description')) or None,
+                'location': location, 'starts_at': starts_at, 'ends_at': ends_at,
+                'capacity': capacity, 'created_by': created_by}))
+    return valid, rejects
+
+def validate_registration_rows(chunk:List[Tuple[int, dict]])->Tuple[List[Tuple[int, dict]], List[Tuple[int, dict, str]]]:
+    """Validate and normalize a chunk of registration rows."""
+    valid = []
+    rejects = []
+    for line_number, row in chunk:
+        reject = _reject_unusable_row(line_number, row)
+        if reject:
+            rejects.append(reject)
+            continue
+        status = _text(row.get('status')) or 'registered'
+        try:
+            user_id = int(row.get('user_id'))
+            event_id = int(row.get('event_id'))
+        except (TypeError, ValueError):
+            rejects.append((line_number, row, "user_id and event_id must be integers"))
+            continue
+        if status not in REGISTRATION_STATUSES:
+            rejects.append((line_number, row, f"status must be one of {', '.join(REGISTRATION_STATUSES)}"))
+        else:
+            valid.append((line_number, {'user_id': user_id, 'event_id': event_id, 'status': status}))
+    return valid, rejects
+
+
+##### Private Helper Functions #####
+
+def _read_rows(path:str)->Iterator[Tuple[int, dict]]:
+    """Stream (line number, row dict) pairs from a CSV or JSONL file."""
+    with open(path, 'r', newline='') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            for line_number, line in enumerate(f, start=1):
+                if line.strip():
+                    try:
+                        yield line_number, json.loads(line)
+                    except json.JSONDecodeError as ex:
+                        yield line_number, MalformedLine(line.rstrip('\r\n'), str(ex))
+        else:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+
+def _reject_unusable_row(line_number:int, row)->Tuple[int, object, str]:
+    """Return the reject for a line that is malformed JSON or not an object, or None for a row dict."""
+    if isinstance(row, MalformedLine):
+        return (line_number, row.text, f"malformed JSON: {row.error}")
+    if not isinstance(row, dict):
+        return (line_number, row, "row must be a JSON object")
+    return None
+
+def _chunked(rows:Iterator, chunk_size:int)->Iterator[List]:
+    """Group an iterator into lists of at most chunk_size items."""
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def _bounded_map(executor, fn:Callable, items:Iterator, max_in_flight:int)->Iterator:
+    """Like Executor.map, but keeps at most max_in_flight tasks queued so input is consumed lazily."""
+    in_flight = deque()
+    for item in items:
+        in_flight.append(executor.submit(fn, item))
+        if len(in_flight) >= max_in_flight:
+            yield in_flight.popleft().result()
+    while in_flight:
+        yield in_flight.popleft().result()
+
+def _text(value)->str:
+    """Return value as a stripped string, or an empty string for None."""
+    if value is None:
+        return ''
+    return str(value).strip()
+
+def _optional_int(value)->int:
+    """Return value as an int, or None when empty."""
+    value = _text(value)
+    return int(value) if value else None
+
+def _datetime(value)->datetime:
+    """Parse a 'YYYY-MM-DD HH:MM:SS' or ISO 8601 date time."""
+    value = _text(value)
+    if not value:
+        raise ValueError("starts_at and ends_at are required")
+    return datetime.fromisoformat(value)
@@ -0,0 +1,174 @@
+"""Implements EventSearchIndex Class."""
+
+from volunteer_event_coordination.infrastructure_layer.event import Event
+from bisect import bisect_left, insort
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Tuple
+import math
+import numpy as np
+import re
+import time
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Term frequency weight of a token in each searchable field
+FIELD_WEIGHTS = (('title', 3.0), ('location', 2.0), ('description', 1.0))
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# A query token also matches up to this many longer terms it is a prefix of (the most frequent
+# first), each scored at PREFIX_WEIGHT of an exact match
+MAX_PREFIX_TERMS = 50
+PREFIX_WEIGHT = 0.8
+
+
+def tokenize(text:str)->List[str]:
+    """Lower-cased word tokens of text."""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class EventSearchIndex():
+    """In-process inverted index over event title, location and description.
+
+    Postings map each term to the events containing it and a field-weighted term
+    frequency. Events are numbered by dense row positions, reused after removal,
+    so the per-query score arrays are sized by the number of events rather than
+    the largest event ID. Queries are ranked with BM25; every query token also matches the
+    terms it is a prefix of, so "clean" finds "cleanup". Events are added,
+    replaced and removed one at a time as they change.
+    """
+
+    def __init__(self, clock:Callable[[], float]=time.monotonic)->None:
+        """Initializes object."""
+        self._clock = clock
+        self._lock = Lock()
+        # Term -> {row: frequency}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._terms: List[str] = []
+        self._documents: Dict[int, Dict[str, float]] = {}
+        # Event ID -> row, row -> event ID, and the rows freed by removals
+        self._rows: Dict[int, int] = {}
+        self._row_ids = np.zeros(0, dtype=np.int64)
+        self._free_rows: List[int] = []
+        # Term -> (rows, frequencies) arrays of its postings, built when first queried
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        # Row -> weighted length; 0 for free rows
+        self._lengths = np.zeros(0, dtype=np.float64)
+        self._total_length = 0.0
+        self.built_at = clock()
+
+    @classmethod
+    def from_events(cls, events:Iterable[Event])->'EventSearchIndex':
+        """ Build from an iterable of events. """
+        index = cls()
+        for event in events:
+            index.add(event)
+        return index
+
+    def __len__(self)->int:
+        return len(self._documents)
+
+    def add(self, event:Event)->None:
+        """Index an event, replacing its previous version."""
+        frequencies = {}
+        for field, weight in FIELD_WEIGHTS:
+            for term in tokenize(getattr(event, field)):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+        event_id = event.id
+        with self._lock:
+            self._remove(event_id)
+            row = self._free_rows.pop() if self._free_rows else len(self._rows)
+            if row >= len(self._lengths):
+                grow = max(1, len(self._lengths))
+                self._lengths = np.concatenate([self._lengths, np.zeros(grow)])
+                self._row_ids = np.concatenate([self._row_ids, np.zeros(grow, dtype=np.int64)])
+            self._rows[event_id] = row
+            self._row_ids[row] = event_id
+            postings_by_term = self._postings
+            for term, frequency in frequencies.items():
+                postings = postings_by_term.get(term)
+                if postings is None:
+                    postings = postings_by_term[term] = {}
+                    insort(self._terms, term)
+                elif term in self._arrays:
+                    del self._arrays[term]
+                postings[row] = frequency
+            self._documents[event_id] = frequencies
+            length = sum(frequencies.values())
+            self._lengths[row] = length
+            self._total_length += length
+
+    def remove(self, event_id:int)->None:
+        """Drop an event from the index."""
+        with self._lock:
+            self._remove(event_id)
+
+    def search(self, query:str, limit:int=20)->List[int]:
+        """Return the IDs of the events matching any query token, best BM25 score first."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            if not tokens or not self._documents:
+                return []
+            count = len(self._documents)
+            normalizer = K1 * (1 - B + B * self._lengths / (self._total_length / count))
+            scores = np.zeros(len(self._lengths))
+            for token in tokens:
+                token_scores = np.zeros(len(self._lengths))
+                # A document matching several expansions of a token counts its best one
+                for term in self._expand(token):
+                    rows, frequencies = self._term_arrays(term)
+                    idf = math.log(1 + (count - len(rows) + 0.5) / (len(rows) + 0.5))
+                    term_scores = idf * frequencies * (K1 + 1) / (frequencies + normalizer[rows])
+                    if term != token:
+                        term_scores *= PREFIX_WEIGHT
+                    token_scores[rows] = np.maximum(token_scores[rows], term_scores)
+                scores += token_scores
+            matches = np.flatnonzero(scores > 0)
+            if limit is not None and len(matches) > limit:
+                matches = matches[np.argpartition(-scores[matches], limit - 1)[:limit]]
+            ids = self._row_ids[matches]
+        return ids[np.lexsort((ids, -scores[matches]))].tolist()
+
+    def age_seconds(self)->float:
+        """Seconds since the index was built."""
+        return self._clock() - self.built_at
+
+    ##### Private Utility Methods #####
+
+    def _remove(self, event_id:int)->None:
+        """Drop an event's postings; the caller holds the lock."""
+        frequencies = self._documents.pop(event_id, None)
+        if frequencies is None:
+            return
+        row = self._rows.pop(event_id)
+        for term in frequencies:
+            postings = self._postings[term]
+            del postings[row]
+            self._arrays.pop(term, None)
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect_left(self._terms, term)]
+        self._total_length -= self._lengths[row]
+        self._lengths[row] = 0.0
+        self._free_rows.append(row)
+
+    def _term_arrays(self, term:str)->Tuple[np.ndarray, np.ndarray]:
+        """A term's postings as (rows, frequencies) arrays; the caller holds the lock."""
+        arrays = self._arrays.get(term)
+        if arrays is None:
+            postings = self._postings[term]
+            arrays = self._arrays[term] = (np.fromiter(postings.keys(), dtype=np.int64, count=len(postings)),
+                                           np.fromiter(postings.values(), dtype=np.float64, count=len(postings)))
+        return arrays
+
+    def _expand(self, token:str)->List[str]:
+        """The token itself, if indexed, and the most frequent terms it is a prefix of."""
+        start = bisect_left(self._terms, token)
+        stop = bisect_left(self._terms, token + '\U0010ffff', start)
+        longer = [term for term in self._terms[start:stop] if term != token]
+        if len(longer) > MAX_PREFIX_TERMS:
+            longer.sort(key=lambda term: len(self._postings[term]), reverse=True)
+            longer = longer[:MAX_PREFIX_TERMS]
+        return ([token] if token in self._postings else []) + longer
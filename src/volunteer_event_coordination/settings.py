@@ -1,11 +1,49 @@
 """Manage applicaion settings."""
 
 import json
+import os
 import platform
+import threading
+import time
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, List, Mapping
+
+# Used when the settings file is missing or unreadable; Settings.current() never writes them to disk
+DEFAULT_SETTINGS = MappingProxyType({
+    'logs_dir': 'logs',
+    'log_filename': 'app.log',
+    'log_level': 'debug',
+    'log_to_console': True,
+    'log_to_file': True,
+    'deployed_to_production': False,
+})
+
+_snapshots = {}
+_listeners: List[Callable[[str, Mapping], None]] = []
+_lock = threading.Lock()
+_watcher = None
+
+
+class _Snapshot():
+    """Immutable settings and the file version they were read from."""
+
+    __slots__ = ('values', 'version')
+
+    def __init__(self, values:Mapping, version:tuple)->None:
+        self.values = values
+        self.version = version
+
 
 class Settings():
-    """Manage application settings."""
+    """Manage application settings.
+
+    Settings.current() returns the process-wide settings, read from the file once
+    and then served from memory as a read-only mapping. Settings.watch() polls the
+    file's modification time in a background thread and swaps in a new mapping
+    when it changes; Settings.on_change() callbacks (such as LoggingService's log
+    level update) run after each swap with the path of the file that changed.
+    """
 
     def __init__(self, default_settings_filename:str='app_settings.json'):
         """Initialize instance."""
@@ -57,5 +95,82 @@ class Settings():
 
         return settings
 
+    @classmethod
+    def path(cls, filename:str='app_settings.json')->str:
+        """Return the absolute path the settings for filename are cached and reported under."""
+        return os.path.abspath(filename)
+
+    @classmethod
+    def current(cls, filename:str='app_settings.json')->Mapping:
+        """Return the cached, read-only settings, reading the file on first use only."""
+        path = cls.path(filename)
+        snapshot = _snapshots.get(path)
+        if snapshot is None:
+            with _lock:
+                snapshot = _snapshots.get(path)
+                if snapshot is None:
+                    snapshot = _snapshots[path] = _read_snapshot(path)
+        return snapshot.values
 
+    @classmethod
+    def reload(cls, filename:str='app_settings.json')->bool:
+        """Re-read the file if its modification time or size changed; return True if the settings changed."""
+        path = cls.path(filename)
+        with _lock:
+            previous = _snapshots.get(path)
+            if previous is None or previous.version == _file_version(path):
+                return False
+            snapshot = _read_snapshot(path, previous.values)
+            _snapshots[path] = snapshot
+            listeners = list(_listeners)
+        if snapshot.values == previous.values:
+            return False
+        for listener in listeners:
+            listener(path, snapshot.values)
+        return True
 
+    @classmethod
+    def on_change(cls, listener:Callable[[str, Mapping], None])->None:
+        """Call listener(path, settings) with the file's absolute path and new settings after every reload that changes them."""
+        with _lock:
+            _listeners.append(listener)
+
+    @classmethod
+    def watch(cls, filename:str='app_settings.json', interval_seconds:float=2.0)->None:
+        """Start a daemon thread that calls reload() every interval_seconds; later calls do nothing."""
+        global _watcher
+        with _lock:
+            if _watcher is not None:
+                return
+            _watcher = threading.Thread(target=_poll, args=(filename, interval_seconds),
+                                        name='SettingsWatcher', daemon=True)
+        cls.current(filename)
+        _watcher.start()
+
+
+def _file_version(path:str)->tuple:
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+def _read_snapshot(path:str, fallback:Mapping=DEFAULT_SETTINGS)->_Snapshot:
+    """Read the file; a missing or malformed file keeps the fallback values."""
+    version = _file_version(path)
+    try:
+        with open(path, 'r') as f:
+            values = json.loads(f.read())
+    except Exception:
+        return _Snapshot(fallback, version)
+    return _Snapshot(MappingProxyType({**DEFAULT_SETTINGS, **values}), version)
+
+
+def _poll(filename:str, interval_seconds:float)->None:
+    while True:
+        time.sleep(interval_seconds)
+        try:
+            Settings.reload(filename)
+        except Exception:
+            pass
@@ -4,6 +4,26 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
 
 from volunteer_event_coordination.persistence_layer.mysql_persistence_wrapper import MySQLPersistenceWrapper
+from volunteer_event_coordination.persistence_layer.sqlite_persistence_wrapper import SQLitePersistenceWrapper, SQLiteConnection
+from volunteer_event_coordination.persistence_layer.storage_backend import create_storage_backend
 from volunteer_event_coordination.service_layer.app_services import AppServices
+from volunteer_event_coordination.service_layer.async_app_services import AsyncAppServices
+from volunteer_event_coordination.persistence_layer.async_mysql_persistence_wrapper import AsyncMySQLPersistenceWrapper
+from volunteer_event_coordination.service_layer.entity_cache import EntityCache
+from volunteer_event_coordination.service_layer.import_services import ImportServices
+from volunteer_event_coordination.service_layer import import_services
+from volunteer_event_coordination.service_layer.availability_index import AvailabilityIndex
+from volunteer_event_coordination.service_layer.search_index import EventSearchIndex
+from volunteer_event_coordination.persistence_layer.connection_pool import ElasticConnectionPool, PoolTimeoutError, PoolClosedError
+from volunteer_event_coordination.persistence_layer.row_mapper import RowMapper
+from volunteer_event_coordination.persistence_layer.query_stats import QueryStats
+from volunteer_event_coordination.persistence_layer import query_stats
 from volunteer_event_coordination.infrastructure_layer.user import User
-from volunteer_event_coordination.infrastructure_layer.event import Event
\ No newline at end of file
+from volunteer_event_coordination.infrastructure_layer.event import Event
+from volunteer_event_coordination.infrastructure_layer.registration import Registration
+from volunteer_event_coordination.infrastructure_layer.batch_result import BatchResult
+from volunteer_event_coordination.infrastructure_layer.frames import EventFrame, RegistrationFrame
+from volunteer_event_coordination.infrastructure_layer import serialization
+from volunteer_event_coordination.settings import Settings
+from volunteer_event_coordination.logging import LoggingService
+from volunteer_event_coordination import logging as app_logging
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""Async Services Unit Tests."""
+from tests.context import AsyncAppServices
+from tests.context import AsyncMySQLPersistenceWrapper
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import pytest
+import json
+import os
+
+def load_config()->dict:
+    config_dir_path = os.path.join(os.getcwd(), 'config', 'volunteer_event_coordination_app_config.json')
+    with open(config_dir_path, 'r') as f:
+        config_dict = json.loads(f.read())
+    config_dict["database"]["backend"] = 'sqlite'
+    config_dict["database"]["sqlite"] = {"path": ':memory:'}
+    return config_dict
+
+@pytest.fixture
+def async_app_services():
+    services = AsyncAppServices(load_config())
+    yield services
+    services.close()
+    services.app_services.DB.close()
+
+async def create_volunteers(services:AsyncAppServices, count:int)->list:
+    return await asyncio.gather(*(services.create_user(f'Volunteer {n}', f'volunteer{n}@example.com', '555-0100', 'volunteer')
+                                  for n in range(count)))
+
+class TestAsyncServices:
+    """Async Services Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_run_on_thread_pool(self, async_app_services):
+        """Test: coroutines run the service methods on the thread pool and return their results"""
+
+        async def scenario():
+            users = await create_volunteers(async_app_services, 3)
+            fetched = await async_app_services.get_user_by_id(users[1].id)
+            exists = await async_app_services.DB.user_exists(users[2].id)
+            return users, fetched, exists
+
+        users, fetched, exists = asyncio.run(scenario())
+        assert len({user.id for user in users}) == 3
+        assert fetched.email == users[1].email
+        assert exists
+
+    def test_iterate_pages(self, async_app_services):
+        """Test: async iteration yields every row across pages, including a short last page"""
+
+        async def scenario():
+            await create_volunteers(async_app_services, 5)
+            services = [user.id async for user in async_app_services.iter_users(page_size=2)]
+            wrapper = [user.id async for user in async_app_services.DB.iter_users(page_size=2)]
+            return services, wrapper
+
+        services, wrapper = asyncio.run(scenario())
+        assert services == wrapper
+        assert len(services) == 5 and services == sorted(services)
+
+    def test_wrapper_schema_methods(self, async_app_services):
+        """Test: the schema version, migration and query plan checks run as coroutines"""
+        wrapper = async_app_services.DB
+
+        async def scenario():
+            return await wrapper.get_schema_version(), await wrapper.migrate(), await wrapper.check_query_plans()
+
+        version, applied, problems = asyncio.run(scenario())
+        assert version == async_app_services.app_services.DB.get_schema_version()
+        assert applied == []
+        assert problems == {}
+
+    # Edge Case Tests
+
+    def test_iterate_exact_multiple_of_page_size(self, async_app_services):
+        """Test: iteration ends after a final empty page when the rows fill whole pages"""
+
+        async def scenario():
+            await create_volunteers(async_app_services, 4)
+            return [user.id async for user in async_app_services.iter_users(page_size=2)]
+
+        assert len(asyncio.run(scenario())) == 4
+
+    def test_close_shuts_down_thread_pool(self, async_app_services):
+        """Test: calls after close fail instead of hanging"""
+        async_app_services.close()
+        with pytest.raises(RuntimeError):
+            asyncio.run(async_app_services.count_registrations(1))
+
+    def test_wrapper_close_keeps_shared_executor(self, async_app_services):
+        """Test: the wrapper shuts down only a thread pool it created"""
+        executor = ThreadPoolExecutor(max_workers=1)
+        shared = AsyncMySQLPersistenceWrapper(load_config(), async_app_services.app_services.DB, executor)
+        shared.close()
+        assert asyncio.run(shared.count_registrations(1)) == 0
+        owned = AsyncMySQLPersistenceWrapper(load_config(), async_app_services.app_services.DB)
+        owned.close()
+        with pytest.raises(RuntimeError):
+            asyncio.run(owned.count_registrations(1))
+        executor.shutdown()
+
+    def test_wrapper_close_closes_owned_database(self):
+        """Test: the wrapper closes the database connections only when it created the backend"""
+        owned = AsyncMySQLPersistenceWrapper(load_config())
+        owned.close()
+        assert owned.DB._connection_pool._closed
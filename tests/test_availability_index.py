@@ -0,0 +1,87 @@
+"""Availability Index Unit Tests."""
+from tests.context import AvailabilityIndex
+from tests.context import EventFrame
+from tests.context import RegistrationFrame
+from datetime import datetime
+import numpy as np
+import pytest
+
+def busy(index:AvailabilityIndex, user_id:int, starts_at:str, ends_at:str)->None:
+    index.mark_busy([user_id], np.array([starts_at], dtype='datetime64[s]'), np.array([ends_at], dtype='datetime64[s]'))
+
+class Today:
+    """Settable stand-in for datetime.now."""
+
+    def __init__(self, now:datetime)->None:
+        self.now = now
+
+    def __call__(self)->datetime:
+        return self.now
+
+@pytest.fixture
+def today():
+    return Today(datetime(2030, 3, 1))
+
+@pytest.fixture
+def index(today):
+    index = AvailabilityIndex(slot_minutes=30, now=today)
+    index.add_users([1, 2, 3, 4])
+    busy(index, 1, '2030-03-02T09:00', '2030-03-02T11:00')
+    busy(index, 2, '2030-03-02T12:30', '2030-03-02T14:00')
+    # Crosses midnight into the next day's bitset
+    busy(index, 3, '2030-03-02T23:00', '2030-03-03T01:00')
+    return index
+
+class TestAvailabilityIndex:
+    """Availability Index Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_free_user_ids(self, index):
+        """Test: volunteers booked inside the window are busy; one ending as it starts is free"""
+        assert index.free_user_ids(datetime(2030, 3, 2, 9), datetime(2030, 3, 2, 12, 30)).tolist() == [2, 3, 4]
+        assert index.free_user_ids(datetime(2030, 3, 3, 0, 30), datetime(2030, 3, 3, 2)).tolist() == [1, 2, 4]
+        assert index.free_user_ids(datetime(2030, 3, 2, 8), datetime(2030, 3, 4), limit=1).tolist() == [4]
+
+    def test_from_frames_uses_registered_only(self):
+        """Test: waitlisted registrations and users outside the index do not make anyone busy"""
+        events = EventFrame.from_rows([(1, datetime(2030, 3, 2, 9), datetime(2030, 3, 2, 12), 10, 1)])
+        registrations = RegistrationFrame.from_rows([(1, 1, 1, 'registered'), (2, 1, 2, 'waitlist'), (3, 1, 9, 'registered')])
+        index = AvailabilityIndex.from_frames([1, 2, 3], events, registrations)
+        assert index.free_user_ids(datetime(2030, 3, 2, 10), datetime(2030, 3, 2, 11)).tolist() == [2, 3]
+
+    def test_clear_and_remove_user(self, index):
+        """Test: clear_user frees a volunteer and remove_user stops offering them"""
+        index.clear_user(1)
+        index.remove_user(4)
+        index.add_users([5])
+        assert index.free_user_ids(datetime(2030, 3, 2, 9), datetime(2030, 3, 2, 10)).tolist() == [1, 2, 3, 5]
+        assert len(index) == 4
+
+    # Edge Case Tests
+
+    def test_bookings_round_out_to_slots(self, index):
+        """Test: a booking ending inside a slot keeps the whole slot busy"""
+        busy(index, 4, '2030-03-05T09:00', '2030-03-05T09:10')
+        assert 4 not in index.free_user_ids(datetime(2030, 3, 5, 9, 20), datetime(2030, 3, 5, 10)).tolist()
+        assert 4 in index.free_user_ids(datetime(2030, 3, 5, 9, 30), datetime(2030, 3, 5, 10)).tolist()
+
+    def test_days_store_busy_rows_only(self, index):
+        """Test: a day holds bits only for the volunteers booked on it"""
+        rows, bits = index._days[np.datetime64('2030-03-03', 'D').astype(np.int64)]
+        assert rows.tolist() == [2] and bits.shape == (1, 1)
+        index.clear_user(3)
+        assert np.datetime64('2030-03-03', 'D').astype(np.int64) not in index._days
+
+    def test_past_days_dropped(self, index, today):
+        """Test: bookings before today are ignored and days are evicted as the date moves on"""
+        busy(index, 4, '2030-02-28T09:00', '2030-02-28T10:00')
+        assert 4 in index.free_user_ids(datetime(2030, 2, 28, 9), datetime(2030, 2, 28, 10)).tolist()
+        today.now = datetime(2030, 3, 3, 8)
+        assert index.free_user_ids(datetime(2030, 3, 2, 9), datetime(2030, 3, 3, 1)).tolist() == [1, 2, 4]
+        assert sorted(index._days) == [np.datetime64('2030-03-03', 'D').astype(np.int64)]
+
+    def test_invalid_slot_minutes(self):
+        """Test: slots must divide a day evenly"""
+        with pytest.raises(ValueError):
+            AvailabilityIndex(slot_minutes=7)
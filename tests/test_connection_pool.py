@@ -0,0 +1,117 @@
+"""Elastic Connection Pool Unit Tests."""
+from tests.context import ElasticConnectionPool, PoolTimeoutError, PoolClosedError
+import threading
+import pytest
+
+class FakeConnection:
+    """Stands in for a mysql-connector connection."""
+    def __init__(self):
+        self.connected = True
+        self.in_transaction = False
+        self.rollbacks = 0
+        self.resets = 0
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def reset_session(self):
+        self.resets += 1
+
+    def close(self):
+        self.closed = True
+
+@pytest.fixture
+def opened():
+    return []
+
+@pytest.fixture
+def connect(opened):
+    def factory():
+        connection = FakeConnection()
+        opened.append(connection)
+        return connection
+    return factory
+
+class TestElasticConnectionPool:
+    """Elastic Connection Pool Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_warm_up_opens_min_size(self, connect, opened):
+        """Test: the pool opens min_size connections up front"""
+        pool = ElasticConnectionPool(connect, min_size=2, max_size=4)
+        assert len(opened) == 2
+        assert pool.stats()['idle'] == 2
+
+    def test_grows_to_max_size(self, connect, opened):
+        """Test: checkouts beyond min_size open new connections up to max_size"""
+        pool = ElasticConnectionPool(connect, min_size=1, max_size=3)
+        connections = [pool.get_connection() for _ in range(3)]
+        assert len(opened) == 3
+        assert pool.stats()['in_use'] == 3
+        for connection in connections:
+            connection.close()
+        assert pool.stats()['in_use'] == 0
+
+    def test_with_block_returns_connection(self, connect, opened):
+        """Test: leaving the with block rolls back and resets the connection"""
+        pool = ElasticConnectionPool(connect, min_size=1, max_size=1)
+        with pool.get_connection() as connection:
+            connection.raw.in_transaction = True
+        assert opened[0].rollbacks == 1
+        assert opened[0].resets == 1
+        assert pool.get_connection().raw is opened[0]
+
+    def test_waiter_gets_released_connection(self, connect):
+        """Test: a caller waits for a connection instead of failing"""
+        pool = ElasticConnectionPool(connect, min_size=1, max_size=1, timeout_seconds=5)
+        held = pool.get_connection()
+        threading.Timer(0.05, held.close).start()
+        connection = pool.get_connection()
+        assert connection.raw is held.raw
+        assert pool.stats()['wait_seconds_max'] > 0
+
+    # Edge Case Tests
+
+    def test_timeout_when_exhausted(self, connect):
+        """Test: checkout raises PoolTimeoutError once the timeout expires"""
+        pool = ElasticConnectionPool(connect, min_size=1, max_size=1, timeout_seconds=0.01)
+        pool.get_connection()
+        with pytest.raises(PoolTimeoutError):
+            pool.get_connection()
+        assert pool.stats()['timeouts'] == 1
+
+    def test_stale_connection_replaced(self, connect, opened):
+        """Test: an idle connection that fails validation is discarded"""
+        pool = ElasticConnectionPool(connect, min_size=1, max_size=1, validation_interval_seconds=0)
+        opened[0].connected = False
+        connection = pool.get_connection()
+        assert connection.raw is opened[1]
+        assert opened[0].closed
+
+    def test_close_with_connections_checked_out(self, connect, opened):
+        """Test: close() closes idle connections now and checked-out ones when they are released"""
+        pool = ElasticConnectionPool(connect, min_size=2, max_size=2)
+        held = pool.get_connection()
+        pool.close()
+        idle = next(connection for connection in opened if connection is not held.raw)
+        assert idle.closed and not held.raw.closed
+        held.close()
+        assert held.raw.closed
+        assert pool.stats()['size'] == 0 and pool.stats()['idle'] == 0
+
+    def test_checkout_after_close(self, connect):
+        """Test: checkouts after close(), and those waiting when it is called, raise PoolClosedError"""
+        pool = ElasticConnectionPool(connect, min_size=1, max_size=1, timeout_seconds=5)
+        held = pool.get_connection()
+        threading.Timer(0.05, pool.close).start()
+        with pytest.raises(PoolClosedError):
+            pool.get_connection()
+        held.close()
+        with pytest.raises(PoolClosedError):
+            pool.get_connection()
@@ -0,0 +1,73 @@
+"""Entity Cache Unit Tests."""
+from tests.context import EntityCache
+import pytest
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+class TestEntityCache:
+    """Entity Cache Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_get_after_put(self, clock):
+        """Test: get returns a cached value and counts a hit"""
+        cache = EntityCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.put(1, 'one')
+        assert cache.get(1) == 'one'
+        assert cache.stats()['hits'] == 1
+
+    def test_lru_eviction(self, clock):
+        """Test: the least recently used entry is evicted first"""
+        cache = EntityCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.put(1, 'one')
+        cache.put(2, 'two')
+        cache.get(1)
+        cache.put(3, 'three')
+        assert cache.get(2) is None
+        assert cache.get(1) == 'one'
+        assert cache.get(3) == 'three'
+        assert cache.stats()['evictions'] == 1
+
+    def test_ttl_expiry(self, clock):
+        """Test: entries expire after ttl_seconds"""
+        cache = EntityCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.put(1, 'one')
+        clock.now = 10.0
+        assert cache.get(1) is None
+        assert cache.stats()['expirations'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_invalidate_and_clear(self, clock):
+        """Test: invalidate and clear drop entries"""
+        cache = EntityCache(max_size=3, ttl_seconds=10, clock=clock)
+        cache.put(1, 'one')
+        cache.put(2, 'two')
+        cache.invalidate(1)
+        assert cache.get(1) is None
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats()['invalidations'] == 2
+
+    # Edge Case Tests
+
+    def test_disabled_cache_stores_nothing(self, clock):
+        """Test: max_size 0 disables caching"""
+        cache = EntityCache(max_size=0, ttl_seconds=10, clock=clock)
+        cache.put(1, 'one')
+        assert cache.get(1) is None
+
+    def test_none_is_not_cached(self, clock):
+        """Test: missing entities are not cached"""
+        cache = EntityCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.put(1, None)
+        assert len(cache) == 0
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""Columnar Frame Unit Tests."""
+from tests.context import EventFrame
+from tests.context import RegistrationFrame
+from datetime import datetime
+import numpy as np
+import pytest
+
+@pytest.fixture
+def events():
+    return EventFrame.from_rows([
+        (2, datetime(2025, 11, 22, 9, 0), datetime(2025, 11, 22, 12, 30), 30, 1),
+        (1, datetime(2025, 11, 20, 10, 0), datetime(2025, 11, 20, 14, 0), 50, 1),
+        (3, datetime(2025, 11, 22, 13, 0), datetime(2025, 11, 22, 15, 0), 0, None),
+    ])
+
+@pytest.fixture
+def registrations():
+    return RegistrationFrame.from_rows([
+        (1, 1, 2, 'registered'),
+        (2, 1, 3, 'registered'),
+        (3, 2, 2, 'waitlist'),
+        (4, 2, 3, 'registered'),
+    ])
+
+class TestFrames:
+    """Columnar Frame Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_events_sorted_by_id(self, events):
+        """Test: EventFrame rows are sorted by id"""
+        assert events.id.tolist() == [1, 2, 3]
+        assert events.created_by.tolist() == [1, 1, 0]
+
+    def test_fill_rate(self, events, registrations):
+        """Test: fill_rate divides registered count by capacity"""
+        fill_rate = events.fill_rate(registrations)
+        assert fill_rate[:2].tolist() == [2 / 50, 1 / 30]
+        assert np.isnan(fill_rate[2])
+
+    def test_volunteer_hours(self, events, registrations):
+        """Test: volunteer_hours sums event length over registrations"""
+        assert events.volunteer_hours(registrations) == 2 * 4.0 + 3.5
+        assert events.volunteer_hours(registrations, 'waitlist') == 3.5
+
+    def test_events_per_bucket(self, events):
+        """Test: events_per_bucket counts events per day"""
+        buckets, counts = events.events_per_bucket('D')
+        assert [str(bucket) for bucket in buckets] == ['2025-11-20', '2025-11-22']
+        assert counts.tolist() == [1, 2]
+
+    def test_status_counts(self, registrations):
+        """Test: status_counts"""
+        assert registrations.status_counts() == {'registered': 3, 'waitlist': 1, 'cancelled': 0}
+
+    def test_schedule_conflicts(self):
+        """Test: schedule_conflicts pairs each volunteer's overlapping registered events; touching events do not overlap"""
+        events = EventFrame.from_rows([
+            (1, datetime(2025, 11, 22, 9, 0), datetime(2025, 11, 22, 12, 30), 10, 1),
+            (2, datetime(2025, 11, 22, 12, 0), datetime(2025, 11, 22, 13, 30), 10, 1),
+            (3, datetime(2025, 11, 22, 13, 0), datetime(2025, 11, 22, 15, 0), 10, 1),
+            (4, datetime(2025, 11, 22, 15, 0), datetime(2025, 11, 22, 16, 0), 10, 1),
+        ])
+        registrations = RegistrationFrame.from_rows([
+            (1, 3, 7, 'registered'), (2, 1, 7, 'registered'), (3, 2, 7, 'registered'), (4, 4, 7, 'registered'),
+            (5, 1, 8, 'registered'), (6, 2, 8, 'waitlist'), (7, 2, 9, 'registered'),
+        ])
+        user_ids, event_ids, other_event_ids = events.schedule_conflicts(registrations)
+        assert list(zip(user_ids.tolist(), event_ids.tolist(), other_event_ids.tolist())) == [(7, 1, 2), (7, 2, 3)]
+        assert len(events.schedule_conflicts(registrations, None)[0]) == 3
+
+    def test_new_registration_conflicts(self):
+        """Test: new registrations are checked against registered ones and earlier accepted new ones"""
+        events = EventFrame.from_rows([
+            (1, datetime(2025, 11, 22, 9, 0), datetime(2025, 11, 22, 12, 30), 10, 1),
+            (2, datetime(2025, 11, 22, 12, 0), datetime(2025, 11, 22, 13, 30), 10, 1),
+            (3, datetime(2025, 11, 22, 13, 0), datetime(2025, 11, 22, 15, 0), 10, 1),
+            (4, datetime(2025, 11, 22, 15, 0), datetime(2025, 11, 22, 16, 0), 10, 1),
+        ])
+        registrations = RegistrationFrame.from_rows([(1, 1, 7, 'registered'), (2, 3, 8, 'waitlist')])
+        conflicts = events.new_registration_conflicts(registrations, [7, 7, 8, 8, 7, 9], [2, 3, 3, 2, 4, 99])
+        assert conflicts == {0: 1, 3: 3}
+
+    # Edge Case Tests
+
+    def test_unknown_event_ids_are_ignored(self, events):
+        """Test: registrations for events outside the frame are not counted"""
+        registrations = RegistrationFrame.from_rows([(1, 99, 2, 'registered')])
+        assert events.registration_counts(registrations).tolist() == [0, 0, 0]
+
+    def test_empty_frames(self):
+        """Test: empty frames"""
+        events = EventFrame.from_rows([])
+        registrations = RegistrationFrame.from_rows([])
+        assert len(events.fill_rate(registrations)) == 0
+        assert events.volunteer_hours(registrations) == 0.0
+        assert [len(column) for column in events.schedule_conflicts(registrations)] == [0, 0, 0]
\ No newline at end of file
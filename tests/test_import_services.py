@@ -0,0 +1,119 @@
+"""Import Services Unit Tests."""
+from tests.context import ImportServices
+from tests.context import import_services
+from tests.context import AppServices
+from tests.context import BatchResult
+from datetime import datetime
+import pytest
+import json
+import os
+
+def load_config()->dict:
+    config_dir_path = os.path.join(os.getcwd(), 'config', 'volunteer_event_coordination_app_config.json')
+    with open(config_dir_path, 'r') as f:
+        config_dict = json.loads(f.read())
+    config_dict["database"]["backend"] = 'sqlite'
+    config_dict["database"]["sqlite"] = {"path": ':memory:'}
+    return config_dict
+
+@pytest.fixture
+def import_service():
+    service = ImportServices(load_config(), AppServices(load_config()))
+    yield service
+    service.app_services.DB.close()
+
+def write_lines(path, lines):
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+class TestImportServices:
+    """Import Services Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_validate_user_rows(self):
+        """Test: user rows are normalized and invalid ones rejected with a reason"""
+        valid, rejects = import_services.validate_user_rows([
+            (1, {'full_name': ' Ada ', 'email': 'ada@example.com', 'phone': '', 'role': ''}),
+            (2, {'full_name': 'Bob', 'email': 'bob.example.com', 'role': 'volunteer'}),
+            (3, {'full_name': 'Cy', 'email': 'cy@example.com', 'role': 'guest'}),
+        ])
+        assert valid == [(1, {'full_name': 'Ada', 'email': 'ada@example.com', 'phone': None, 'role': 'volunteer'})]
+        assert [(line_number, 'email' in reason or 'role' in reason) for line_number, _, reason in rejects] == [(2, True), (3, True)]
+
+    def test_validate_event_rows(self):
+        """Test: event rows get parsed times and integers; bad times and ranges are rejected"""
+        valid, rejects = import_services.validate_event_rows([
+            (1, {'title': 'Cleanup', 'starts_at': '2030-01-01 09:00:00', 'ends_at': '2030-01-01T12:00', 'capacity': '10', 'created_by': ''}),
+            (2, {'title': 'Cleanup', 'starts_at': 'soon', 'ends_at': '2030-01-01 12:00:00'}),
+            (3, {'title': 'Cleanup', 'starts_at': '2030-01-01 12:00:00', 'ends_at': '2030-01-01 09:00:00'}),
+        ])
+        assert valid[0][1]['starts_at'] == datetime(2030, 1, 1, 9)
+        assert valid[0][1]['capacity'] == 10 and valid[0][1]['created_by'] is None
+        assert [line_number for line_number, _, _ in rejects] == [2, 3]
+
+    def test_validate_registration_rows(self):
+        """Test: registration IDs must be integers and the status one of the enum values"""
+        valid, rejects = import_services.validate_registration_rows([
+            (1, {'user_id': '4', 'event_id': 7}),
+            (2, {'user_id': 'x', 'event_id': 7}),
+            (3, {'user_id': 4, 'event_id': 7, 'status': 'maybe'}),
+        ])
+        assert valid == [(1, {'user_id': 4, 'event_id': 7, 'status': 'registered'})]
+        assert [line_number for line_number, _, _ in rejects] == [2, 3]
+
+    def test_read_rows_csv(self, tmp_path):
+        """Test: CSV rows come back as dicts with their line numbers"""
+        path = str(tmp_path / 'users.csv')
+        write_lines(path, ['full_name,email', 'Ada,ada@example.com', 'Bob,bob@example.com'])
+        assert list(import_services._read_rows(path)) == [
+            (2, {'full_name': 'Ada', 'email': 'ada@example.com'}), (3, {'full_name': 'Bob', 'email': 'bob@example.com'})]
+
+    def test_bulk_write_moves_failures_to_rejects(self, import_service):
+        """Test: rows the batch write reports as failed become rejects and the rest are returned"""
+        result = BatchResult()
+        result.succeeded = 2
+        result.failures = [(1, 'duplicate email')]
+        rows = [(2, {'n': 0}), (3, {'n': 1}), (4, {'n': 2})]
+        rejects = []
+        written = import_service._bulk_write(lambda entities: result, ['a', 'b', 'c'], rows, rejects)
+        assert written == [(2, {'n': 0}), (4, {'n': 2})]
+        assert rejects == [(3, {'n': 1}, 'duplicate email')]
+
+    # Edge Case Tests
+
+    def test_read_rows_keeps_malformed_jsonl_lines(self, tmp_path):
+        """Test: a malformed JSONL line is yielded for rejection instead of ending the read"""
+        path = str(tmp_path / 'users.jsonl')
+        write_lines(path, ['{"full_name": "Ada"}', '{"full_name": ', '', '[1, 2]'])
+        rows = list(import_services._read_rows(path))
+        assert [line_number for line_number, _ in rows] == [1, 2, 4]
+        assert isinstance(rows[1][1], import_services.MalformedLine)
+
+    def test_unusable_rows_rejected(self):
+        """Test: every validator rejects malformed JSON and rows that are not objects"""
+        chunk = [(1, import_services.MalformedLine('{"x": ', 'Expecting value')), (2, [1, 2]), (3, 'text')]
+        for validate in (import_services.validate_user_rows, import_services.validate_event_rows,
+                         import_services.validate_registration_rows):
+            valid, rejects = validate(chunk)
+            assert valid == []
+            assert [(line_number, row) for line_number, row, _ in rejects] == [(1, '{"x": '), (2, [1, 2]), (3, 'text')]
+            assert rejects[0][2].startswith('malformed JSON')
+
+    def test_bulk_write_failed_batch(self, import_service):
+        """Test: a batch write that returns None rejects every row"""
+        rejects = []
+        assert import_service._bulk_write(lambda entities: None, ['a'], [(2, {'n': 0})], rejects) == []
+        assert rejects == [(2, {'n': 0}, 'batch write failed')]
+
+    def test_import_continues_past_malformed_line(self, import_service, tmp_path):
+        """Test: an import with a malformed line imports the other rows and writes the line to the rejects file"""
+        path = str(tmp_path / 'users.jsonl')
+        rejects_path = str(tmp_path / 'rejects.jsonl')
+        write_lines(path, ['{"full_name": "Ada", "email": "ada@example.com"}', '{"full_name": ',
+                           '{"full_name": "Bob", "email": "bob@example.com"}'])
+        report = import_service.import_users(path, rejects_path, workers=1)
+        assert (report.rows_read, report.rows_imported, report.rows_rejected) == (3, 2, 1)
+        with open(rejects_path, 'r') as f:
+            reject = json.loads(f.readline())
+        assert reject['line'] == 2 and reject['reason'].startswith('malformed JSON')
@@ -0,0 +1,85 @@
+"""Logging Service Unit Tests."""
+from tests.context import LoggingService
+from tests.context import app_logging
+import logging
+import pytest
+import json
+
+class CountingArgument:
+    """Counts how many times it is formatted into a message."""
+
+    def __init__(self)->None:
+        self.formatted = 0
+
+    def __str__(self)->str:
+        self.formatted += 1
+        return 'argument'
+
+class RecordingHandler(logging.Handler):
+    """Keeps the formatted messages it is handed."""
+
+    def __init__(self)->None:
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record:logging.LogRecord)->None:
+        self.messages.append(record.getMessage())
+
+def make_service(tmp_path, monkeypatch, name:str, log_level:str)->LoggingService:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(app_logging, '_service_loggers', dict(app_logging._service_loggers))
+    with open('app_settings.json', 'w') as f:
+        f.write(json.dumps({"log_level": log_level, "log_to_console": False, "log_to_file": False}))
+    return LoggingService(name, 'test')
+
+@pytest.fixture
+def listeners(monkeypatch):
+    """Isolates the background writer threads started by a test from the rest of the process."""
+    monkeypatch.setattr(app_logging, '_listeners', {})
+    yield
+    app_logging.stop_listeners()
+
+class TestLoggingService:
+    """Logging Service Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_debug_level_name(self, tmp_path, monkeypatch):
+        """Test: log_level 'debug' in the settings maps to logging.DEBUG"""
+        assert app_logging.LOG_LEVELS['debug'] == logging.DEBUG
+        service = make_service(tmp_path, monkeypatch, 'LoggingDebugLevelTest', 'debug')
+        assert service.log_level == logging.DEBUG
+        assert service.is_enabled_for(logging.DEBUG)
+
+    def test_args_formatted_only_when_enabled(self, tmp_path, monkeypatch, listeners):
+        """Test: %-style arguments are formatted for enabled levels and never for disabled ones"""
+        service = make_service(tmp_path, monkeypatch, 'LoggingLazyArgsTest', 'error')
+        handler = RecordingHandler()
+        service._logger.addHandler(app_logging.queue_handler('lazy', lambda: [handler]))
+        skipped, logged = CountingArgument(), CountingArgument()
+        service.log_debug('Skipped %s', skipped)
+        service.log_error('Logged %s', logged)
+        app_logging.stop_listeners()
+        service._logger.handlers.clear()
+        assert skipped.formatted == 0
+        assert logged.formatted == 1
+        assert handler.messages == ['Logged argument']
+
+    def test_stop_listeners_flushes_queue(self, listeners):
+        """Test: stop_listeners writes every queued record before returning"""
+        handler = RecordingHandler()
+        logger = logging.getLogger('LoggingFlushTest')
+        logger.propagate = False
+        logger.addHandler(app_logging.queue_handler('flush', lambda: [handler]))
+        for n in range(1000):
+            logger.error('Record %d', n)
+        app_logging.stop_listeners()
+        logger.handlers.clear()
+        assert handler.messages == [f'Record {n}' for n in range(1000)]
+
+    # Edge Case Tests
+
+    def test_unknown_level_name_defaults_to_error(self, tmp_path, monkeypatch):
+        """Test: an unrecognised log_level falls back to logging.ERROR"""
+        service = make_service(tmp_path, monkeypatch, 'LoggingUnknownLevelTest', 'verbose')
+        assert service.log_level == logging.ERROR
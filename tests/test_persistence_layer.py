@@ -2,6 +2,7 @@
 from tests.context import MySQLPersistenceWrapper
 from tests.context import User
 from tests.context import Event
+from tests.context import Registration
 import pytest
 import json
 import os
@@ -31,11 +32,45 @@ class TestPersistenceLayer:
         users = mysql_persistence_wrapper.select_all_users()
         assert len(users) > 0
 
+    def test_select_all_users_hydrates_registered_events(self, mysql_persistence_wrapper):
+        """Test: select_all_users loads each user's events with registration status"""
+        users = mysql_persistence_wrapper.select_all_users(prefetch_events=True)
+        assert all(user.events_loaded for user in users)
+        events = [event for user in users for event in user.events]
+        assert len(events) > 0
+        assert all(event.registration_status in ('registered', 'waitlist', 'cancelled') for event in events)
+
+    def test_select_all_users_loads_events_lazily(self, mysql_persistence_wrapper):
+        """Test: select_all_users defers loading events until first access"""
+        users = mysql_persistence_wrapper.select_all_users()
+        prefetched = {user.id: sorted(event.id for event in user.events)
+                      for user in mysql_persistence_wrapper.select_all_users(prefetch_events=True)}
+        assert not any(user.events_loaded for user in users)
+        assert {user.id: sorted(event.id for event in user.events) for user in users} == prefetched
+
     def test_select_all_events(self, mysql_persistence_wrapper):
         """Test: select_all_events"""
         events = mysql_persistence_wrapper.select_all_events()
         assert len(events) > 0
 
+    def test_iter_users_matches_select_all_users(self, mysql_persistence_wrapper):
+        """Test: iter_users pages through the same users as select_all_users"""
+        users = mysql_persistence_wrapper.select_all_users()
+        streamed = list(mysql_persistence_wrapper.iter_users(page_size=2))
+        assert [user.id for user in streamed] == [user.id for user in users]
+
+    def test_iter_events_matches_select_all_events(self, mysql_persistence_wrapper):
+        """Test: iter_events pages through the same events as select_all_events"""
+        events = mysql_persistence_wrapper.select_all_events()
+        streamed = list(mysql_persistence_wrapper.iter_events(page_size=1))
+        assert sorted(event.id for event in streamed) == sorted(event.id for event in events)
+
+    def test_iter_registrations(self, mysql_persistence_wrapper):
+        """Test: iter_registrations"""
+        registrations = list(mysql_persistence_wrapper.iter_registrations(page_size=2))
+        assert len(registrations) > 0
+        assert all(isinstance(registration, Registration) for registration in registrations)
+
     def test_select_user_by_id(self, mysql_persistence_wrapper):
         """Test: select_user_by_id"""
         # First ensure we have a user to select
@@ -60,6 +95,31 @@ class TestPersistenceLayer:
         event = mysql_persistence_wrapper.select_event_by_id(1)
         assert event is not None
 
+    def test_select_event_and_registration_frames(self, mysql_persistence_wrapper):
+        """Test: select_event_frame and select_registration_frame"""
+        events = mysql_persistence_wrapper.select_event_frame()
+        registrations = mysql_persistence_wrapper.select_registration_frame()
+        assert len(events) == len(mysql_persistence_wrapper.select_all_events())
+        assert len(registrations) == len(list(mysql_persistence_wrapper.iter_registrations()))
+        assert events.registration_counts(registrations, None).sum() == len(registrations)
+
+    def test_exists_probes(self, mysql_persistence_wrapper):
+        """Test: user_exists, event_exists and validate_user_and_event"""
+        user_id = mysql_persistence_wrapper.select_all_users()[0].id
+        event_id = mysql_persistence_wrapper.select_all_events()[0].id
+        assert mysql_persistence_wrapper.user_exists(user_id)
+        assert mysql_persistence_wrapper.event_exists(event_id)
+        assert mysql_persistence_wrapper.validate_user_and_event(user_id, event_id) == (True, True)
+        assert mysql_persistence_wrapper.validate_user_and_event(user_id, 0) == (True, False)
+
+    def test_count_registrations(self, mysql_persistence_wrapper):
+        """Test: count_registrations with and without a status filter"""
+        total = mysql_persistence_wrapper.count_registrations(1)
+        by_status = sum(mysql_persistence_wrapper.count_registrations(1, status)
+                        for status in ('registered', 'waitlist', 'cancelled'))
+        assert total > 0
+        assert total == by_status
+
     def test_insert_user(self, mysql_persistence_wrapper):
         """Test: insert_user"""
         user = User()
@@ -98,6 +158,36 @@ class TestPersistenceLayer:
         inserted_event = mysql_persistence_wrapper.insert_event(event)
         assert inserted_event is not None
 
+    def test_insert_user_sets_generated_id(self, mysql_persistence_wrapper):
+        """Test: insert_user returns the user with its generated ID"""
+        user = User()
+        user.full_name = 'Generated Id User'
+        user.email = f'generated_{time.time_ns()}@user.com'
+        user.phone = '123-456-7890'
+        user.role = 'volunteer'
+        inserted_user = mysql_persistence_wrapper.insert_user(user)
+        assert inserted_user.id > 0
+        assert mysql_persistence_wrapper.select_user_by_id(inserted_user.id).email == user.email
+
+    def test_insert_users_many(self, mysql_persistence_wrapper):
+        """Test: insert_users_many returns generated IDs and reports failed rows"""
+        stamp = time.time_ns()
+        users = []
+        for email in [f'batch_a_{stamp}@user.com', f'batch_b_{stamp}@user.com', f'batch_a_{stamp}@user.com']:
+            user = User()
+            user.full_name = 'Batch User'
+            user.email = email
+            user.phone = '123-456-7890'
+            user.role = 'volunteer'
+            users.append(user)
+        result = mysql_persistence_wrapper.insert_users_many(users)
+        assert result.succeeded == 2
+        assert [index for index, _ in result.failures] == [2]
+        assert result.ids[2] is None
+        assert mysql_persistence_wrapper.select_user_by_id(result.ids[1]).email == users[1].email
+        mysql_persistence_wrapper.delete_users_many(result.ids[:2])
+        assert mysql_persistence_wrapper.select_user_by_id(result.ids[0]) is None
+
     def test_update_user(self, mysql_persistence_wrapper):
         """Test: update_user"""
         # First ensure we have a user to update
@@ -145,6 +235,12 @@ class TestPersistenceLayer:
         event = mysql_persistence_wrapper.select_event_by_id(0)
         assert event is None
 
+    def test_exists_probes_for_invalid_ids(self, mysql_persistence_wrapper):
+        """Test: exists probes return False for missing IDs"""
+        assert not mysql_persistence_wrapper.user_exists(0)
+        assert not mysql_persistence_wrapper.event_exists(0)
+        assert mysql_persistence_wrapper.validate_user_and_event(0, 0) == (False, False)
+
     def test_delete_nonexistent_user(self, mysql_persistence_wrapper):
         """Test: delete_nonexistent_user"""
         mysql_persistence_wrapper.delete_user(99999)
@@ -0,0 +1,143 @@
+"""Prepared Statement Cursor Unit Tests."""
+from tests.context import create_storage_backend
+from tests.context import ElasticConnectionPool
+import pytest
+import json
+import os
+
+STATEMENT = 'SELECT id FROM users WHERE id = %s'
+
+class FakeCursor:
+    """Stands in for a mysql-connector prepared cursor."""
+    def __init__(self, connection):
+        self.connection = connection
+        self.executed = []
+        self.fetches = 0
+        self.closed = False
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def execute(self, statement, params=None):
+        if self.connection.fail:
+            raise RuntimeError('lost connection')
+        self.executed.append((statement, params))
+        self.connection.unread_result = True
+
+    def fetchone(self):
+        self.connection.unread_result = False
+        return (1,)
+
+    def fetchall(self):
+        self.fetches += 1
+        self.connection.unread_result = False
+        return [(1,)]
+
+    def close(self):
+        self.closed = True
+
+class FakeConnection:
+    """Stands in for a mysql-connector connection that hands out prepared cursors."""
+    def __init__(self):
+        self.unread_result = False
+        self.fail = False
+        self.cursors = []
+
+    def cursor(self, prepared=False):
+        assert prepared
+        cursor = FakeCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+    def is_connected(self):
+        return True
+
+    def rollback(self):
+        pass
+
+    def reset_session(self):
+        pass
+
+    def close(self):
+        pass
+
+def load_config(query_stats:bool)->dict:
+    config_dir_path = os.path.join(os.getcwd(), 'config', 'volunteer_event_coordination_app_config.json')
+    with open(config_dir_path, 'r') as f:
+        config_dict = json.loads(f.read())
+    config_dict["database"]["backend"] = 'sqlite'
+    config_dict["database"]["sqlite"] = {"path": ':memory:'}
+    config_dict["database"].setdefault("query_stats", {})["enabled"] = query_stats
+    return config_dict
+
+@pytest.fixture(params=[False, True], ids=['untimed', 'timed'])
+def wrapper(request):
+    """A wrapper in prepared statement mode, with and without query stats."""
+    db = create_storage_backend(load_config(request.param))
+    db.PREPARED_STATEMENTS = True
+    yield db
+    db.close()
+
+@pytest.fixture
+def connection():
+    pool = ElasticConnectionPool(FakeConnection, min_size=1, max_size=1)
+    connection = pool.get_connection()
+    yield connection
+    connection.close()
+
+class TestPreparedStatements:
+    """Prepared Statement Cursor Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_cursor_cached_per_statement(self, wrapper, connection):
+        """Test: a statement reuses its prepared cursor across uses; another statement gets its own"""
+        for user_id in (1, 2):
+            with wrapper._cursor(connection, STATEMENT) as cursor:
+                cursor.execute(STATEMENT, (user_id,))
+                cursor.fetchone()
+        with wrapper._cursor(connection, 'SELECT 1') as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchall()
+        assert len(connection.raw.cursors) == 2
+        assert connection.statements[STATEMENT].executed == [(STATEMENT, (1,)), (STATEMENT, (2,))]
+        assert not any(cursor.closed for cursor in connection.raw.cursors)
+
+    def test_unread_result_drained(self, wrapper, connection):
+        """Test: rows left unread by the caller are fetched before the cursor is reused"""
+        with wrapper._cursor(connection, STATEMENT) as cursor:
+            cursor.execute(STATEMENT, (1,))
+        assert not connection.unread_result
+        assert connection.statements[STATEMENT].fetches == 1
+
+    # Edge Case Tests
+
+    def test_cursor_evicted_after_error(self, wrapper, connection):
+        """Test: a statement that fails closes and forgets its cursor, so the next use prepares a new one"""
+        with wrapper._cursor(connection, STATEMENT) as cursor:
+            cursor.execute(STATEMENT, (1,))
+            cursor.fetchone()
+        failed = connection.statements[STATEMENT]
+        connection.raw.fail = True
+        with pytest.raises(RuntimeError):
+            with wrapper._cursor(connection, STATEMENT) as cursor:
+                cursor.execute(STATEMENT, (2,))
+        assert failed.closed
+        assert STATEMENT not in connection.statements
+        connection.raw.fail = False
+        with wrapper._cursor(connection, STATEMENT) as cursor:
+            cursor.execute(STATEMENT, (3,))
+        assert connection.statements[STATEMENT] is not failed
+
+    def test_text_cursor_without_statement(self, wrapper, connection, monkeypatch):
+        """Test: without a statement key the cursor is a plain one that is not cached"""
+        plain = []
+        monkeypatch.setattr(FakeConnection, 'cursor', lambda self, prepared=False: plain.append(prepared) or FakeCursor(self))
+        with wrapper._cursor(connection) as cursor:
+            pass
+        assert plain == [False]
+        assert connection.statements == {}
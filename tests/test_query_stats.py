@@ -0,0 +1,79 @@
+"""Query Stats Unit Tests."""
+from tests.context import QueryStats
+from tests.context import query_stats
+from tests.context import app_logging
+import pytest
+
+SELECT_USER = 'SELECT id FROM users WHERE id = %s'
+SELECT_USERS_IN = 'SELECT id FROM users WHERE id IN ({})'
+INSERT_USER = 'INSERT INTO users (full_name, email) VALUES (%s, %s)'
+
+@pytest.fixture
+def stats():
+    stats = QueryStats()
+    stats.register('SELECT_USER', SELECT_USER)
+    stats.register('SELECT_USERS_IN', SELECT_USERS_IN)
+    stats.register('INSERT_USER', INSERT_USER)
+    return stats
+
+class TestQueryStats:
+    """Query Stats Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_histogram_buckets(self, stats):
+        """Test: each execution lands in the first bucket whose upper bound it does not exceed"""
+        for seconds in (0.0004, 0.0005, 0.001, 0.0011, 0.3, 5.0):
+            stats.record('SELECT_USER', seconds)
+        histogram = stats.snapshot()['statements']['SELECT_USER']['histogram_ms']
+        assert {label: count for label, count in histogram.items() if count} == {'<=0.5': 2, '<=1': 1, '<=2': 1, '<=500': 1, 'inf': 1}
+
+    def test_name_for(self, stats):
+        """Test: statements resolve to their constant's name, including formatted and multi-row expansions"""
+        assert stats.name_for(SELECT_USER) == 'SELECT_USER'
+        assert stats.name_for(SELECT_USERS_IN.format('%s, %s, %s')) == 'SELECT_USERS_IN'
+        assert stats.name_for(INSERT_USER.replace('(%s, %s)', '(%s, %s), (%s, %s)')) == 'INSERT_USER_MULTI'
+        assert stats.name_for('SELECT 1') == 'OTHER'
+
+    def test_slow_query_logged(self):
+        """Test: statements at or above slow_query_ms are logged with their name, time and rows; faster ones are not"""
+        entries = []
+        stats = QueryStats(slow_query_ms=100, slow_query_log=entries.append)
+        stats.record('SELECT_USER', 0.05, 1, statement=SELECT_USER)
+        stats.record('SELECT_USER', 0.25, 3, statement=SELECT_USER)
+        stats.record('INSERT_USER', 0.1, error=True, statement=INSERT_USER)
+        assert entries == [f'SELECT_USER took 250.0 ms, 3 rows: {SELECT_USER}',
+                           f'INSERT_USER took 100.0 ms, 0 rows (failed): {INSERT_USER}']
+
+    def test_slow_query_log_file(self, tmp_path, monkeypatch):
+        """Test: open_slow_query_log writes the entries to its file once the writer thread is flushed"""
+        monkeypatch.setattr(app_logging, '_listeners', {})
+        path = str(tmp_path / 'slow_queries.log')
+        stats = QueryStats(slow_query_ms=100, slow_query_log=query_stats.open_slow_query_log(path))
+        stats.record('SELECT_USER', 0.5, 1, statement=SELECT_USER)
+        app_logging.stop_listeners()
+        with open(path, 'r') as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 1
+        assert lines[0].startswith('WARNING:SlowQueryLog:')
+        assert lines[0].endswith(f'SELECT_USER took 500.0 ms, 1 rows: {SELECT_USER}')
+
+    # Edge Case Tests
+
+    def test_checkout_not_slow_logged(self):
+        """Test: slow connection checkouts are counted but not written to the slow-query log"""
+        entries = []
+        stats = QueryStats(slow_query_ms=1, slow_query_log=entries.append)
+        stats.record_checkout(2.0)
+        assert entries == []
+        snapshot = stats.snapshot()
+        assert snapshot['statements'][query_stats.CHECKOUT]['calls'] == 1
+        assert snapshot['total']['calls'] == 0
+
+    def test_name_cache_bounded(self, stats, monkeypatch):
+        """Test: resolved expansions stop being cached once the name cache is full, but still resolve"""
+        monkeypatch.setattr(query_stats, 'NAME_CACHE_SIZE', len(stats._names) + 1)
+        expansions = [SELECT_USERS_IN.format(', '.join(['%s'] * n)) for n in range(1, 4)]
+        assert [stats.name_for(statement) for statement in expansions] == ['SELECT_USERS_IN'] * 3
+        assert expansions[0] in stats._names
+        assert expansions[2] not in stats._names
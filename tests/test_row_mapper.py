@@ -0,0 +1,61 @@
+"""Row Mapper Unit Tests."""
+from tests.context import RowMapper
+from tests.context import User
+from tests.context import Event
+from datetime import datetime
+from enum import Enum
+import pytest
+
+UserColumns = Enum('UserColumns', [('id', 0), ('full_name', 1), ('email', 2), ('phone', 3), ('role', 4), ('created_at', 5)])
+EventColumns = Enum('EventColumns', [('id', 0), ('title', 1), ('description', 2), ('location', 3), ('starts_at', 4),
+                                     ('ends_at', 5), ('capacity', 6), ('created_by', 7), ('created_at', 8)])
+
+USER_ROW = (7, 'Ada', 'ada@example.com', '555-0100', 'volunteer', datetime(2030, 1, 1))
+EVENT_ROW = (3, 'Food Drive', 'Sort donations', 'Hall', datetime(2030, 2, 1, 9), datetime(2030, 2, 1, 12), 5, 7, datetime(2030, 1, 2))
+
+class TestRowMapper:
+    """Row Mapper Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_map_row(self):
+        """Test: map_row sets each attribute from its column"""
+        user = RowMapper.from_enum(User, UserColumns).map_row(USER_ROW)
+        assert isinstance(user, User)
+        assert (user.id, user.full_name, user.email, user.phone, user.role, user.created_at) == USER_ROW
+
+    def test_map_rows(self):
+        """Test: map_rows maps every row to a new object, in order"""
+        rows = [USER_ROW, (8,) + USER_ROW[1:]]
+        users = RowMapper.from_enum(User, UserColumns).map_rows(rows)
+        assert [user.id for user in users] == [7, 8]
+        assert users[0] is not users[1]
+
+    def test_extra_columns(self):
+        """Test: extra columns are read after the Enum's columns"""
+        mapper = RowMapper.from_enum(Event, EventColumns, extra_columns=[('registration_status', len(EventColumns))])
+        event = mapper.map_row(EVENT_ROW + ('waitlist',))
+        assert (event.id, event.created_at, event.registration_status) == (3, datetime(2030, 1, 2), 'waitlist')
+
+    def test_joined_offset(self):
+        """Test: an offset shifts the Enum's and the extra columns past the joined user columns"""
+        mapper = RowMapper.from_enum(Event, EventColumns, len(UserColumns), [('registration_status', len(EventColumns))])
+        event = mapper.map_row(USER_ROW + EVENT_ROW + ('registered',))
+        assert (event.id, event.title, event.created_by, event.registration_status) == (3, 'Food Drive', 7, 'registered')
+
+    # Edge Case Tests
+
+    def test_single_column(self):
+        """Test: a one-column mapper still sets the attribute from the value, not a tuple"""
+        assert RowMapper(User, [('id', 1)]).map_row(('x', 42)).id == 42
+
+    def test_no_rows(self):
+        """Test: map_rows of no rows is an empty list"""
+        assert RowMapper.from_enum(User, UserColumns).map_rows([]) == []
+
+    def test_invalid_mapping(self):
+        """Test: attribute names must be identifiers and positions integers"""
+        with pytest.raises(ValueError):
+            RowMapper(User, [('full name', 1)])
+        with pytest.raises(ValueError):
+            RowMapper(User, [('id', '0')])
@@ -0,0 +1,66 @@
+"""Event Search Index Unit Tests."""
+from tests.context import EventSearchIndex
+from tests.context import Event
+import pytest
+
+def make_event(event_id:int, title:str, location:str='', description:str='')->Event:
+    event = Event()
+    event.id = event_id
+    event.title = title
+    event.location = location
+    event.description = description
+    return event
+
+@pytest.fixture
+def index():
+    return EventSearchIndex.from_events([
+        make_event(1, 'Park Cleanup', 'City Park', 'Pick up litter along the river'),
+        make_event(2, 'Food Drive', 'Community Hall', 'Sort donated food for the food bank'),
+        make_event(3, 'River Cleanup', 'Riverside', 'Clean the river banks'),
+        make_event(4, 'Book Sale', 'Library', None),
+    ])
+
+class TestEventSearchIndex:
+    """Event Search Index Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_title_matches_rank_first(self, index):
+        """Test: a title match outranks a description match"""
+        assert index.search('river') == [3, 1]
+        assert index.search('food') == [2]
+
+    def test_prefix_matching(self, index):
+        """Test: a word matches the longer words it begins; exact words rank above completions"""
+        assert index.search('clean') == [3, 1]
+        assert index.search('lib') == [4]
+
+    def test_more_matching_words_rank_higher(self, index):
+        """Test: events matching more query words come first; limit caps the result"""
+        assert index.search('park cleanup') == [1, 3]
+        assert index.search('park cleanup', limit=1) == [1]
+
+    def test_add_replaces_and_remove_drops(self, index):
+        """Test: re-adding an event replaces its terms and removing it drops them"""
+        index.add(make_event(4, 'Used Book Cleanup', 'Library'))
+        assert index.search('sale') == []
+        assert 4 in index.search('cleanup')
+        index.remove(1)
+        assert index.search('park') == []
+        assert len(index) == 3
+
+    # Edge Case Tests
+
+    def test_empty_query_and_index(self, index):
+        """Test: a query without words, or an empty index, matches nothing"""
+        assert index.search('  ?! ') == []
+        assert EventSearchIndex().search('cleanup') == []
+
+    def test_sparse_event_ids(self):
+        """Test: large, sparse event IDs use one row each and rows freed by removal are reused"""
+        index = EventSearchIndex.from_events([make_event(10 ** 9, 'Park Cleanup'), make_event(7, 'River Cleanup')])
+        assert index.search('cleanup') == [7, 10 ** 9]
+        index.remove(10 ** 9)
+        index.add(make_event(5 * 10 ** 8, 'Beach Cleanup'))
+        assert index.search('cleanup') == [7, 5 * 10 ** 8]
+        assert len(index._lengths) == 2
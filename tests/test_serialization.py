@@ -0,0 +1,68 @@
+"""Serialization Unit Tests."""
+from tests.context import User
+from tests.context import Event
+from tests.context import serialization
+from datetime import datetime
+import io
+import json
+import pytest
+
+@pytest.fixture
+def users():
+    event = Event()
+    event.id = 1
+    event.title = 'Food Drive'
+    event.starts_at = datetime(2025, 11, 20, 10, 0, 0)
+    event.ends_at = datetime(2025, 11, 20, 14, 0, 0)
+    event.registration_status = 'registered'
+    users = []
+    for user_id in (1, 2):
+        user = User()
+        user.id = user_id
+        user.full_name = f'User {user_id}'
+        user.created_at = datetime(2025, 11, 1, 9, 0, 0)
+        user.events = [event]
+        users.append(user)
+    return users
+
+class TestSerialization:
+    """Serialization Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_to_json_handles_datetimes(self, users):
+        """Test: User.to_json encodes nested datetime values"""
+        user_dict = json.loads(users[0].to_json())
+        assert user_dict['created_at'] == '2025-11-01T09:00:00'
+        assert user_dict['events'][0]['starts_at'] == '2025-11-20T10:00:00'
+
+    def test_to_json_skips_deferred_events(self, users):
+        """Test: serializing a user does not load deferred events"""
+        loads = []
+        users[0].defer_events(lambda user_id: loads.append(user_id) or [])
+        assert 'events' not in json.loads(users[0].to_json())
+        assert repr(users[0]) == str(users[0])
+        assert loads == []
+
+    def test_dump_json_array(self, users):
+        """Test: dump_json_array writes one JSON array"""
+        buffer = io.BytesIO()
+        count = serialization.dump_json_array(users, buffer)
+        assert count == 2
+        assert [user['id'] for user in json.loads(buffer.getvalue())] == [1, 2]
+
+    def test_dump_jsonl(self, users):
+        """Test: dump_jsonl writes one JSON object per line"""
+        buffer = io.BytesIO()
+        count = serialization.dump_jsonl(users, buffer)
+        lines = buffer.getvalue().decode('utf-8').splitlines()
+        assert count == 2
+        assert [json.loads(line)['id'] for line in lines] == [1, 2]
+
+    # Edge Case Tests
+
+    def test_dump_json_array_empty(self):
+        """Test: dump_json_array of no entities is an empty array"""
+        buffer = io.BytesIO()
+        assert serialization.dump_json_array([], buffer) == 0
+        assert json.loads(buffer.getvalue()) == []
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""Settings Cache Unit Tests."""
+from tests.context import Settings
+from tests.context import LoggingService
+from tests.context import app_logging
+import logging
+import pytest
+import json
+import os
+
+def write_settings(path, **values):
+    settings = {"logs_dir": "logs", "log_filename": "app.log", "log_level": "error",
+                "log_to_console": False, "log_to_file": False, "deployed_to_production": False}
+    settings.update(values)
+    with open(path, 'w') as f:
+        f.write(json.dumps(settings))
+    # Make the change visible to mtime polling even on coarse-grained file systems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+@pytest.fixture
+def service_logger(monkeypatch):
+    """Restores the test logger and the LoggingService registry after the test."""
+    name = 'SettingsReloadTest'
+    logger = logging.getLogger(name)
+    state = (logger.level, logger.propagate, list(logger.handlers))
+    monkeypatch.setattr(app_logging, '_service_loggers', dict(app_logging._service_loggers))
+    yield name
+    logger.setLevel(state[0])
+    logger.propagate = state[1]
+    logger.handlers[:] = state[2]
+
+class TestSettings:
+    """Settings Cache Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_current_is_cached_and_read_only(self, tmp_path):
+        """Test: current() returns the same read-only mapping without re-reading the file"""
+        path = str(tmp_path / 'app_settings.json')
+        write_settings(path, log_level='info')
+        settings = Settings.current(path)
+        os.remove(path)
+        assert Settings.current(path) is settings
+        assert settings['log_level'] == 'info'
+        with pytest.raises(TypeError):
+            settings['log_level'] = 'debug'
+
+    def test_reload_picks_up_changes(self, tmp_path):
+        """Test: reload() swaps in new settings only when the file changed"""
+        path = str(tmp_path / 'app_settings.json')
+        write_settings(path, log_level='info')
+        Settings.current(path)
+        assert not Settings.reload(path)
+        write_settings(path, log_level='warning')
+        assert Settings.reload(path)
+        assert Settings.current(path)['log_level'] == 'warning'
+
+    def test_reload_updates_log_level(self, tmp_path, monkeypatch, service_logger):
+        """Test: LoggingService levels follow log_level after a reload"""
+        monkeypatch.chdir(tmp_path)
+        write_settings('app_settings.json', log_level='error')
+        service = LoggingService(service_logger, 'test')
+        assert service.log_level == logging.ERROR
+        write_settings('app_settings.json', log_level='debug')
+        Settings.reload()
+        assert service.log_level == logging.DEBUG
+
+    # Edge Case Tests
+
+    def test_reload_of_other_file_keeps_log_level(self, tmp_path, monkeypatch, service_logger):
+        """Test: reloading a settings file LoggingService was not configured from leaves its levels alone"""
+        monkeypatch.chdir(tmp_path)
+        write_settings('app_settings.json', log_level='error')
+        service = LoggingService(service_logger, 'test')
+        other = str(tmp_path / 'other_settings.json')
+        write_settings(other, log_level='info')
+        Settings.current(other)
+        write_settings(other, log_level='debug')
+        assert Settings.reload(other)
+        assert service.log_level == logging.ERROR
+
+    def test_missing_file_uses_defaults_without_writing(self, tmp_path):
+        """Test: a missing settings file yields the defaults and is not created"""
+        path = str(tmp_path / 'app_settings.json')
+        assert Settings.current(path)['log_filename'] == 'app.log'
+        assert not os.path.exists(path)
+
+    def test_malformed_file_keeps_previous_settings(self, tmp_path):
+        """Test: a half-written settings file does not replace the loaded settings"""
+        path = str(tmp_path / 'app_settings.json')
+        write_settings(path, log_level='info')
+        Settings.current(path)
+        with open(path, 'w') as f:
+            f.write('{"log_level": ')
+        assert not Settings.reload(path)
+        assert Settings.current(path)['log_level'] == 'info'
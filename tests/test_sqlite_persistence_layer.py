@@ -0,0 +1,342 @@
+"""SQLite Persistence Layer Unit Tests."""
+from tests.context import SQLitePersistenceWrapper
+from tests.context import SQLiteConnection
+from tests.context import create_storage_backend
+from tests.context import AppServices
+from tests.context import User
+from tests.context import Event
+from tests.context import Registration
+from tests.context import PoolTimeoutError
+from datetime import datetime
+import pytest
+import json
+import sqlite3
+import os
+
+def load_config(path:str)->dict:
+    config_dir_path = os.path.join(os.getcwd(), 'config', 'volunteer_event_coordination_app_config.json')
+    with open(config_dir_path, 'r') as f:
+        config_dict = json.loads(f.read())
+    config_dict["database"]["backend"] = 'sqlite'
+    config_dict["database"]["sqlite"] = {"path": path}
+    return config_dict
+
+def make_user(n:int)->User:
+    user = User()
+    user.full_name = f'Volunteer {n}'
+    user.email = f'volunteer{n}@example.com'
+    user.phone = '555-0100'
+    user.role = 'volunteer'
+    return user
+
+def make_event(created_by:int)->Event:
+    event = Event()
+    event.title = 'Park Cleanup'
+    event.description = 'Pick up litter'
+    event.location = 'City Park'
+    event.starts_at = '2030-01-01 09:00:00'
+    event.ends_at = '2030-01-01 12:00:00'
+    event.capacity = 10
+    event.created_by = created_by
+    return event
+
+@pytest.fixture
+def sqlite_persistence_wrapper():
+    db = create_storage_backend(load_config(':memory:'))
+    yield db
+    db.close()
+
+class TestSQLitePersistenceLayer:
+    """SQLite Persistence Layer Unit Tests."""
+
+    # Happy Path Tests
+
+    def test_factory_selects_sqlite(self, sqlite_persistence_wrapper):
+        """Test: database.backend = sqlite builds a SQLitePersistenceWrapper"""
+        assert isinstance(sqlite_persistence_wrapper, SQLitePersistenceWrapper)
+
+    def test_insert_and_select_user(self, sqlite_persistence_wrapper):
+        """Test: insert_user sets the generated ID and select_user_by_id reads it back"""
+        user = sqlite_persistence_wrapper.insert_user(make_user(1))
+        selected = sqlite_persistence_wrapper.select_user_by_id(user.id)
+        assert selected.email == 'volunteer1@example.com'
+        assert isinstance(selected.created_at, datetime)
+
+    def test_insert_users_many_ids(self, sqlite_persistence_wrapper):
+        """Test: insert_users_many returns the generated IDs in input order"""
+        result = sqlite_persistence_wrapper.insert_users_many([make_user(n) for n in range(5)])
+        assert result.ids == [1, 2, 3, 4, 5]
+        assert [user.email for user in sqlite_persistence_wrapper.iter_users(page_size=2)] == \
+            [f'volunteer{n}@example.com' for n in range(5)]
+
+    def test_registrations_and_prefetched_events(self, sqlite_persistence_wrapper):
+        """Test: registered events come back with status and datetime columns"""
+        user = sqlite_persistence_wrapper.insert_user(make_user(1))
+        event = sqlite_persistence_wrapper.insert_event(make_event(user.id))
+        assert sqlite_persistence_wrapper.register_user_to_event(user.id, event.id, 'waitlist')
+        selected = sqlite_persistence_wrapper.select_user_by_id(user.id, prefetch_events=True)
+        assert [e.registration_status for e in selected.events] == ['waitlist']
+        assert selected.events[0].starts_at == datetime(2030, 1, 1, 9, 0)
+        assert sqlite_persistence_wrapper.count_registrations(event.id, 'waitlist') == 1
+
+    def test_delete_user_cascades(self, sqlite_persistence_wrapper):
+        """Test: deleting a user removes their registrations and clears created_by"""
+        user = sqlite_persistence_wrapper.insert_user(make_user(1))
+        event = sqlite_persistence_wrapper.insert_event(make_event(user.id))
+        sqlite_persistence_wrapper.register_user_to_event(user.id, event.id, 'registered')
+        assert sqlite_persistence_wrapper.delete_user(user.id)
+        assert sqlite_persistence_wrapper.count_registrations(event.id) == 0
+        assert sqlite_persistence_wrapper.select_event_by_id(event.id).created_by is None
+
+    def test_file_database_uses_wal(self, tmp_path):
+        """Test: a file database is opened in WAL mode and persists across instances"""
+        config = load_config(str(tmp_path / 'volunteers.db'))
+        db = SQLitePersistenceWrapper(config)
+        db.insert_user(make_user(1))
+        with db._get_connection() as connection:
+            cursor = connection.cursor()
+            with cursor:
+                cursor.execute('PRAGMA journal_mode;')
+                assert cursor.fetchone()[0] == 'wal'
+        db.close()
+        reopened = SQLitePersistenceWrapper(config)
+        assert reopened.user_exists(1)
+        reopened.close()
+
+    def test_app_services_on_sqlite(self):
+        """Test: AppServices runs end to end without a MySQL server"""
+        app = AppServices(load_config(':memory:'))
+        user = app.create_user('Organizer', 'organizer@example.com', '555-0100', 'organizer')
+        event = app.create_event('Food Drive', 'Sort donations', 'Hall', '2030-02-01 09:00:00',
+                                 '2030-02-01 12:00:00', 5, user.id)
+        assert app.register_user_to_event(user.id, event.id, 'registered')
+        assert app.count_registrations(event.id) == 1
+
+    def test_query_stats_name_statements(self, sqlite_persistence_wrapper):
+        """Test: statements are counted under their SQL constant names, including built IN lists and multi-row INSERTs"""
+        sqlite_persistence_wrapper.get_query_stats(reset=True)
+        users = sqlite_persistence_wrapper.insert_users_many([make_user(n) for n in range(3)])
+        sqlite_persistence_wrapper.select_user_by_id(users.ids[0])
+        sqlite_persistence_wrapper.delete_users_many(users.ids[1:])
+        stats = sqlite_persistence_wrapper.get_query_stats(reset=True)
+        assert stats["statements"]["INSERT_USER_MULTI"]["rows"] == 3
+        assert stats["statements"]["SELECT_USER_BY_ID"]["calls"] == 1
+        assert stats["statements"]["DELETE_USERS_IN"]["rows"] == 2
+        assert stats["total"]["calls"] == 3
+        assert sqlite_persistence_wrapper.get_query_stats()["total"]["calls"] == 0
+
+    def test_schema_migrated_on_open(self, sqlite_persistence_wrapper):
+        """Test: a new database is migrated and every hot query uses an index"""
+        assert sqlite_persistence_wrapper.get_schema_version() >= 2
+        assert sqlite_persistence_wrapper.check_query_plans() == {}
+
+    def test_migrations_applied_once_in_order(self, tmp_path):
+        """Test: numbered migrations after the current version are applied once, in order"""
+        for version, statement in ((3, 'CREATE INDEX IF NOT EXISTS idx_users_role ON users (role);'),
+                                   (2, 'CREATE INDEX IF NOT EXISTS idx_users_phone ON users (phone);')):
+            os.mkdir(tmp_path / f'db_version_{version}')
+            with open(tmp_path / f'db_version_{version}' / 'migrate.sqlite.sql', 'w') as f:
+                f.write(f'-- Test migration {version}\n{statement}\n')
+        config = load_config(':memory:')
+        config["database"]["migrations_dir"] = str(tmp_path)
+        db = SQLitePersistenceWrapper(config)
+        assert db.get_schema_version() == 3
+        assert db.migrate() == []
+        db.close()
+
+    def test_events_between_pages_in_start_order(self, sqlite_persistence_wrapper):
+        """Test: time-window pages are ordered by start time and ID and continue after the last event"""
+        user = sqlite_persistence_wrapper.insert_user(make_user(1))
+        for day in (5, 3, 3, 1, 9):
+            event = make_event(user.id)
+            event.starts_at = f'2030-01-0{day} 09:00:00'
+            sqlite_persistence_wrapper.insert_event(event)
+        first = sqlite_persistence_wrapper.select_events_between(datetime(2030, 1, 2), datetime(2030, 1, 8), limit=2)
+        assert [(e.starts_at.day, e.id) for e in first] == [(3, 2), (3, 3)]
+        second = sqlite_persistence_wrapper.select_events_between(datetime(2030, 1, 2), datetime(2030, 1, 8), limit=2, after=first[-1])
+        assert [(e.starts_at.day, e.id) for e in second] == [(5, 1)]
+
+    def test_upcoming_and_location_events(self, sqlite_persistence_wrapper):
+        """Test: past events are left out of upcoming events and location filters by exact match"""
+        user = sqlite_persistence_wrapper.insert_user(make_user(1))
+        past = make_event(user.id)
+        past.starts_at = '2001-01-01 09:00:00'
+        sqlite_persistence_wrapper.insert_event(past)
+        hall = make_event(user.id)
+        hall.location = 'Hall'
+        sqlite_persistence_wrapper.insert_event(hall)
+        sqlite_persistence_wrapper.insert_event(make_event(user.id))
+        assert [e.id for e in sqlite_persistence_wrapper.select_upcoming_events()] == [2, 3]
+        assert [e.id for e in sqlite_persistence_wrapper.select_events_by_location('City Park')] == [1, 3]
+        assert [e.id for e in sqlite_persistence_wrapper.select_events_by_location('City Park', starts_from=datetime(2020, 1, 1))] == [3]
+
+    def test_schedule_conflict_report(self):
+        """Test: the report lists overlapping registered events per volunteer"""
+        app = AppServices(load_config(':memory:'))
+        user = app.create_user('Organizer', 'organizer@example.com', '555-0100', 'organizer')
+        morning = app.create_event('Food Drive', 'Sort donations', 'Hall', '2030-02-01 09:00:00', '2030-02-01 12:00:00', 5, user.id)
+        midday = app.create_event('Lunch', 'Serve lunch', 'Hall', '2030-02-01 11:00:00', '2030-02-01 13:00:00', 5, user.id)
+        # Writes made straight to the database are not checked; the report finds the clash afterwards
+        registrations = []
+        for event in (morning, midday):
+            registration = Registration()
+            registration.user_id = user.id
+            registration.event_id = event.id
+            registration.status = 'registered'
+            registrations.append(registration)
+        app.DB.register_many(registrations)
+        assert app.get_schedule_conflict_report() == [(user.id, morning.id, midday.id)]
+
+    def test_find_available_volunteers(self):
+        """Test: available volunteers follow registrations made through AppServices"""
+        app = AppServices(load_config(':memory:'))
+        organizer = app.create_user('Organizer', 'organizer@example.com', '555-0100', 'organizer')
+        volunteers = [app.create_user(f'Volunteer {n}', f'volunteer{n}@example.com', '555-0100', 'volunteer') for n in range(3)]
+        event = app.create_event('Food Drive', 'Sort donations', 'Hall', '2030-02-01 09:00:00', '2030-02-01 12:00:00', 5, organizer.id)
+        assert app.register_user_to_event(volunteers[0].id, event.id, 'registered')
+        window = (datetime(2030, 2, 1, 11), datetime(2030, 2, 1, 13))
+        assert [user.id for user in app.find_available_volunteers(*window)] == [volunteers[1].id, volunteers[2].id]
+        assert app.register_user_to_event(volunteers[1].id, event.id, 'registered')
+        assert app.unregister_user_from_event(volunteers[0].id, event.id)
+        assert [user.email for user in app.find_available_volunteers(*window, limit=1)] == ['volunteer0@example.com']
+
+    def test_search_events_follows_changes(self):
+        """Test: search_events sees events created, updated and deleted through AppServices"""
+        app = AppServices(load_config(':memory:'))
+        user = app.create_user('Organizer', 'organizer@example.com', '555-0100', 'organizer')
+        drive = app.create_event('Food Drive', 'Sort donations', 'Hall', '2030-02-01 09:00:00', '2030-02-01 12:00:00', 5, user.id)
+        assert [event.id for event in app.search_events('food')] == [drive.id]
+        cleanup = app.create_event('Park Cleanup', 'Pick up litter', 'City Park', '2030-02-02 09:00:00', '2030-02-02 12:00:00', 5, user.id)
+        assert [event.title for event in app.search_events('clean')] == ['Park Cleanup']
+        app.update_event(drive.id, 'Beach Cleanup', '', '', '', '', '')
+        assert [event.id for event in app.search_events('cleanup park')] == [cleanup.id, drive.id]
+        app.delete_event(cleanup.id)
+        assert [event.id for event in app.search_events('cleanup')] == [drive.id]
+
+    # Edge Case Tests
+
+    def test_query_plan_check_reports_full_scan(self, sqlite_persistence_wrapper):
+        """Test: without the user_id index the registered-events join scans the registrations"""
+        with sqlite_persistence_wrapper._get_connection() as connection:
+            cursor = connection.cursor()
+            with cursor:
+                cursor.execute('DROP INDEX idx_xref_user_event;')
+            connection.commit()
+        problems = sqlite_persistence_wrapper.check_query_plans()
+        assert 'SELECT_REGISTERED_EVENTS_FOR_USER_ID' in problems
+
+    def test_duplicate_registration_rejected(self, sqlite_persistence_wrapper):
+        """Test: the unique (event_id, user_id) constraint is enforced"""
+        user = sqlite_persistence_wrapper.insert_user(make_user(1))
+        event = sqlite_persistence_wrapper.insert_event(make_event(user.id))
+        assert sqlite_persistence_wrapper.register_user_to_event(user.id, event.id, 'registered')
+        assert not sqlite_persistence_wrapper.register_user_to_event(user.id, event.id, 'registered')
+
+    def test_register_many_reports_missing_user(self, sqlite_persistence_wrapper):
+        """Test: foreign keys are enforced and the failing row is reported"""
+        user = sqlite_persistence_wrapper.insert_user(make_user(1))
+        event = sqlite_persistence_wrapper.insert_event(make_event(user.id))
+        registration = Registration()
+        registration.user_id = 999
+        registration.event_id = event.id
+        registration.status = 'registered'
+        result = sqlite_persistence_wrapper.register_many([registration])
+        assert result.ids == [None]
+        assert result.failures[0][0] == 0
+
+    def test_overlapping_registration_refused(self):
+        """Test: registering to an event that overlaps a registered one fails; waitlisting does not"""
+        app = AppServices(load_config(':memory:'))
+        user = app.create_user('Organizer', 'organizer@example.com', '555-0100', 'organizer')
+        morning = app.create_event('Food Drive', 'Sort donations', 'Hall', '2030-02-01 09:00:00', '2030-02-01 12:00:00', 5, user.id)
+        midday = app.create_event('Lunch', 'Serve lunch', 'Hall', '2030-02-01 11:00:00', '2030-02-01 13:00:00', 5, user.id)
+        afternoon = app.create_event('Cleanup', 'Stack chairs', 'Hall', '2030-02-01 12:00:00', '2030-02-01 14:00:00', 5, user.id)
+        assert app.register_user_to_event(user.id, morning.id, 'registered')
+        assert [event.id for event in app.get_schedule_conflicts(user.id, midday.id)] == [morning.id]
+        assert not app.register_user_to_event(user.id, midday.id, 'registered')
+        assert app.register_user_to_event(user.id, midday.id, 'waitlist')
+        assert not app.update_user_event_registration_status(user.id, midday.id, 'registered')
+        assert app.register_user_to_event(user.id, afternoon.id, 'registered')
+
+    def test_register_many_refuses_overlaps(self):
+        """Test: batch rows that overlap a registered event or an earlier row are reported as failed and not written"""
+        app = AppServices(load_config(':memory:'))
+        user = app.create_user('Organizer', 'organizer@example.com', '555-0100', 'organizer')
+        morning = app.create_event('Food Drive', 'Sort donations', 'Hall', '2030-02-01 09:00:00', '2030-02-01 12:00:00', 5, user.id)
+        midday = app.create_event('Lunch', 'Serve lunch', 'Hall', '2030-02-01 11:00:00', '2030-02-01 13:00:00', 5, user.id)
+        afternoon = app.create_event('Cleanup', 'Stack chairs', 'Hall', '2030-02-01 12:30:00', '2030-02-01 14:00:00', 5, user.id)
+        evening = app.create_event('Dinner', 'Serve dinner', 'Hall', '2030-02-01 13:30:00', '2030-02-01 15:00:00', 5, user.id)
+        assert app.register_user_to_event(user.id, morning.id, 'registered')
+        registrations = []
+        for event, status in ((midday, 'registered'), (midday, 'waitlist'), (afternoon, 'registered'), (evening, 'registered')):
+            registration = Registration()
+            registration.user_id = user.id
+            registration.event_id = event.id
+            registration.status = status
+            registrations.append(registration)
+        # midday overlaps morning; evening overlaps afternoon, accepted earlier in the batch
+        result = app.register_many(registrations)
+        assert result.succeeded == 2
+        assert result.ids[0] is None and result.ids[1] and result.ids[2] and result.ids[3] is None
+        assert [failure[0] for failure in result.failures] == [0, 3]
+        assert app.get_schedule_conflict_report() == []
+
+    def test_delete_many_reports_missing_ids(self, sqlite_persistence_wrapper):
+        """Test: a batch delete of an ID that matches no row reports that row as failed"""
+        users = sqlite_persistence_wrapper.insert_users_many([make_user(n) for n in range(2)])
+        result = sqlite_persistence_wrapper.delete_users_many([users.ids[0], 999, users.ids[1]])
+        assert result.succeeded == 2
+        assert [failure[0] for failure in result.failures] == [1]
+
+    def test_failed_commit_keeps_results_aligned(self, sqlite_persistence_wrapper, monkeypatch):
+        """Test: when a chunk's commit fails, its rows are reported once as failed and ids stay aligned with the input"""
+        sqlite_persistence_wrapper.BATCH_SIZE = 2
+        users = [make_user(n) for n in range(3)]
+        # A duplicate email makes the multi-row INSERT fall back to row by row
+        users[1].email = users[0].email
+
+        def failing_commit(connection):
+            raise RuntimeError('commit failed')
+
+        monkeypatch.setattr(SQLiteConnection, 'commit', failing_commit)
+        result = sqlite_persistence_wrapper.insert_users_many(users)
+        assert result.ids == [None, None, None]
+        assert result.succeeded == 0
+        assert [failure[0] for failure in result.failures] == [0, 1, 2]
+
+    def test_failed_update_leaves_cache_unchanged(self, monkeypatch):
+        """Test: when the database write of an update fails, neither later reads nor the cached objects see the unsaved edits"""
+        app = AppServices(load_config(':memory:'))
+        user = app.create_user('Organizer', 'organizer@example.com', '555-0100', 'organizer')
+        event = app.create_event('Food Drive', 'Sort donations', 'Hall', '2030-02-01 09:00:00',
+                                 '2030-02-01 12:00:00', 5, user.id)
+        cached_user = app._get_user(user.id)
+        cached_event = app._get_event(event.id)
+        monkeypatch.setattr(app.DB, 'update_user', lambda user: None)
+        monkeypatch.setattr(app.DB, 'update_event', lambda event: None)
+        assert app.update_user(user.id, 'Renamed', '', '', '') is None
+        assert app.update_event(event.id, 'Renamed', '', '', '', '', '') is None
+        assert app._get_user(user.id).full_name == 'Organizer'
+        assert app._get_event(event.id).title == 'Food Drive'
+        assert (cached_user.full_name, cached_event.title) == ('Organizer', 'Food Drive')
+
+    def test_unopenable_database_raises(self, tmp_path):
+        """Test: a database file that cannot be opened fails construction instead of leaving no pool"""
+        with pytest.raises(sqlite3.OperationalError):
+            create_storage_backend(load_config(str(tmp_path / 'missing' / 'app.db')))
+
+    def test_pool_exhaustion_raised_not_empty(self):
+        """Test: a checkout timeout reaches the caller instead of looking like an empty result"""
+        app = AppServices(load_config(':memory:'))
+        app.DB._connection_pool.timeout_seconds = 0.01
+        held = app.DB._connection_pool.get_connection()
+        with pytest.raises(PoolTimeoutError):
+            app.DB.select_all_users()
+        with pytest.raises(PoolTimeoutError):
+            app.get_user_by_id(1)
+        held.close()
+        assert app.DB.select_all_users() == []
+
+    def test_select_user_by_invalid_id(self, sqlite_persistence_wrapper):
+        """Test: select_user_by_id returns None for a missing user"""
+        assert sqlite_persistence_wrapper.select_user_by_id(42) is None